@@ -0,0 +1,65 @@
+"""
+Benchmark pages fetched and seconds per season of scraper_defense,
+one fetch per table (before) against one fetch per opponent page (after)
+
+usage:
+python -m fantasy_football.benchmarks.defense_fetch --seasons 5 [--page opp.htm]
+"""
+
+import argparse
+import logging
+import fantasy_football.benchmarks.pages as pages
+import fantasy_football.scrapers.cache as cache
+import fantasy_football.scrapers.fetcher as fetcher
+import fantasy_football.scrapers.rate_limiter as rate_limiter
+import fantasy_football.scrapers.scraper_defense as scraper_defense
+
+
+def per_table(years: list) -> dict:
+    # previous behaviour: scrape_data once per table id
+    return {
+        table_id: scraper_defense.scrape_data(
+            years=years, table_id=table_id, table_schema=table_schema
+        )
+        for table_id, table_schema in pages.opponent_tables.items()
+    }
+
+
+def single_pass(years: list) -> dict:
+    return scraper_defense.scrape_tables(years=years, tables=pages.opponent_tables)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seasons", type=int, default=5)
+    parser.add_argument("--page", help="saved opp.htm page, synthetic if omitted")
+    args = parser.parse_args()
+
+    if args.page:
+        with open(args.page, encoding="utf-8") as f:
+            source = f.read()
+    else:
+        source = pages.synthetic_page(pages.opponent_tables)
+    # silence the per season progress log
+    logging.disable(logging.WARNING)
+    # measure fetches and parsing only, fake pages must never reach the page cache
+    cache.disable_cache()
+    # and not the politeness delays
+    rate_limiter.configure(requests_per_minute=10**9, burst=10**6)
+
+    years = list(range(2023 - args.seasons, 2023))
+    print(f"{'mode':<12}{'pages':>8}{'pages/season':>14}{'s/season':>10}")
+    for name, run in [("per table", per_table), ("single pass", single_pass)]:
+        counting = pages.CountingFetcher(source)
+        fetcher.register_fetcher("benchmark", counting)
+        fetcher.set_default_fetcher("benchmark")
+        _, seconds = pages.timed(run, years)
+        print(
+            f"{name:<12}{counting.pages:>8}{counting.pages / len(years):>14.1f}"
+            f"{seconds / len(years):>10.3f}"
+        )
+    fetcher.set_default_fetcher("http")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark parse plus extract time of a season page,
+helpers walking the BeautifulSoup tree (before) against the indexed Document (after)
+and the lxml engine, read through the helpers or as plain cell rows
+
+usage:
+python -m fantasy_football.benchmarks.document_parse --repeat 20 [--page 2022.htm]
+the fastest of repeat runs is reported
+"""
+
+import argparse
+from bs4 import BeautifulSoup
+import fantasy_football.benchmarks.pages as pages
+import fantasy_football.scrapers.document as document
+import fantasy_football.scrapers.lxml_engine as lxml_engine
+import fantasy_football.scrapers.scraper as scraper
+import fantasy_football.scrapers.team_tables as team_tables
+
+
+def extract(html, table_ids: list) -> int:
+    # same lookups as team_tables.scrape_tables, one find_table per table
+    rows = 0
+    for table_id in table_ids:
+        table = scraper.find_table(html=html, id=table_id)
+        if table is not None:
+            rows += len(
+                team_tables.parse_table(
+                    year=2022, table=table, table_schema=pages.season_tables[table_id]
+                )
+            )
+    return rows
+
+
+def tree(source: str, table_ids: list) -> int:
+    return extract(BeautifulSoup(source, "lxml"), table_ids)
+
+
+def indexed(source: str, table_ids: list) -> int:
+    return extract(document.Document(BeautifulSoup(source, "lxml")), table_ids)
+
+
+def lxml_helpers(source: str, table_ids: list) -> int:
+    return extract(lxml_engine.LxmlDocument(source), table_ids)
+
+
+def lxml_rows(source: str, table_ids: list) -> int:
+    html = lxml_engine.LxmlDocument(source)
+    rows = 0
+    for table_id in table_ids:
+        table = scraper.find_table(html=html, id=table_id)
+        if table is not None:
+            rows += len(scraper.find_table_rows(table))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--page", help="saved season page, synthetic if omitted")
+    parser.add_argument(
+        "--filler", type=int, default=2000, help="page weight of the synthetic page"
+    )
+    args = parser.parse_args()
+
+    if args.page:
+        with open(args.page, encoding="utf-8") as f:
+            source = f.read()
+    else:
+        source = pages.synthetic_page(pages.season_tables, filler=args.filler)
+    table_ids = list(pages.season_tables)
+
+    modes = {
+        "tree": tree,
+        "indexed": indexed,
+        "lxml": lxml_helpers,
+        "lxml rows": lxml_rows,
+    }
+    # alternate the modes so all see the same machine load
+    best = {name: (0, float("inf")) for name in modes}
+    for _ in range(args.repeat):
+        for name, run in modes.items():
+            rows, seconds = pages.timed(run, source, table_ids)
+            best[name] = (rows, min(best[name][1], seconds))
+    print(f"{'mode':<12}{'rows':>8}{'ms/page':>10}")
+    for name, (rows, seconds) in best.items():
+        print(f"{name:<12}{rows:>8}{seconds * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""
+Benchmark time and peak memory of building the combined measure table,
+chained merges with column assignments (before) against the
+index aligned single join of predictor.loader (after)
+
+usage:
+python -m fantasy_football.benchmarks.loader_join --seasons 100 [--teams 32]
+the data set is synthetic and written as parquet to a temporary directory,
+the fastest of repeat runs and the peak of the tracemalloc run are reported,
+once reading the files and once with the tables served from memory (join only)
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+import pandas as pd
+import fantasy_football.predictor.loader as loader
+import fantasy_football.utils.header_mapping as header_mapping
+import fantasy_football.utils.schema as schema
+import fantasy_football.utils.storage as storage
+
+
+def synthetic_column(
+    column: schema.Column, teams: list, years: np.ndarray, rng
+) -> np.ndarray:
+    # values matching the dtype of column
+    rows = len(years)
+    if column.name == "year":
+        return years
+    if column.name == "team_id":
+        return np.tile(teams, rows // len(teams))
+    if column.dtype == schema.INT:
+        return rng.integers(1, 500, rows)
+    if column.dtype == schema.FLOAT:
+        return rng.random(rows) * 100
+    if column.dtype == schema.BOOL:
+        return rng.random(rows) < 0.4
+    return np.array([f"{column.name} {i}" for i in range(rows)], dtype=object)
+
+
+def write_dataset(directory: str, seasons: int, teams: int, seed: int = 0) -> None:
+    """
+    Write measure tables and playoff history of seasons x teams rows
+    to the paths predictor.loader reads, relative to directory
+    """
+    rng = np.random.default_rng(seed)
+    team_ids = [f"T{t:02d}" for t in range(1, teams + 1)]
+    years = np.repeat(np.arange(2023 - seasons, 2023), teams)
+    tables = [
+        (loader.table_path(factor, table), table_schema)
+        for factor, factor_schemas in loader.schemas.items()
+        for table, table_schema in factor_schemas.items()
+    ]
+    tables.append((loader.PLAYOFF_HISTORY, header_mapping.schema_playoffs))
+    for path, table_schema in tables:
+        df = pd.DataFrame(
+            {
+                column.name: synthetic_column(column, team_ids, years, rng)
+                for column in table_schema
+            }
+        )
+        storage.write_table(
+            df,
+            storage.parquet_path(os.path.join(directory, path)),
+            table_schema=table_schema,
+        )
+
+
+def chained_merge(factor: str) -> pd.DataFrame:
+    # loader before the index aligned join, one merge per table,
+    # reading the same columns so only the join differs
+    total = None
+    for table, cols in loader.measures[factor].items():
+        df = loader.read_table(factor=factor, table=table, columns=loader.KEYS + cols)
+        for name, (numerator, denominator) in (
+            loader.ratios[factor].get(table, dict()).items()
+        ):
+            df[name] = df[numerator] / df[denominator]
+        total = df if total is None else total.merge(right=df, on=loader.KEYS)
+    playoff_history = storage.load(
+        loader.PLAYOFF_HISTORY,
+        table_schema=header_mapping.schema_playoffs,
+        columns=loader.KEYS + [loader.LABEL],
+    )
+    return total.merge(right=playoff_history, on=loader.KEYS)
+
+
+class InMemory:
+    """
+    Serve the tables read by the loader from memory, so only joins are measured
+    """
+
+    def __init__(self) -> None:
+        self.tables = dict()
+        self.read_table = loader.read_table
+        self.load = storage.load
+
+    def __enter__(self):
+        def read_table(factor, table, columns=None, years=None):
+            key = (factor, table, tuple(columns or ()), tuple(years or ()))
+            if key not in self.tables:
+                self.tables[key] = self.read_table(factor, table, columns, years)
+            return self.tables[key].copy(deep=False)
+
+        def load(path, table_schema=None, columns=None, years=None):
+            key = (path, None, tuple(columns or ()), tuple(years or ()))
+            if key not in self.tables:
+                self.tables[key] = self.load(path, table_schema, columns, years)
+            return self.tables[key].copy(deep=False)
+
+        loader.read_table = read_table
+        storage.load = load
+        return self
+
+    def __exit__(self, *args) -> None:
+        loader.read_table = self.read_table
+        storage.load = self.load
+
+
+def indexed_join(factor: str) -> pd.DataFrame:
+    return loader.build_nfl_measure_tables(factor=factor)
+
+
+def measure(build, factor: str, repeat: int) -> tuple:
+    # fastest time of repeat runs, peak memory of one traced run
+    seconds = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        df = build(factor)
+        seconds = min(seconds, time.perf_counter() - start)
+    tracemalloc.start()
+    build(factor)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(df), seconds, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seasons", type=int, default=100)
+    parser.add_argument("--teams", type=int, default=32)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        write_dataset(directory, seasons=args.seasons, teams=args.teams)
+        os.chdir(directory)
+        try:
+            modes = {"chained merge": chained_merge, "indexed join": indexed_join}
+            print(
+                f"{'mode':<16}{'factor':<10}{'reads':<8}{'rows':>8}"
+                f"{'ms':>10}{'peak MiB':>10}"
+            )
+            for reads in ["files", "memory"]:
+                for factor in loader.schemas:
+                    for name, build in modes.items():
+                        if reads == "memory":
+                            with InMemory():
+                                build(factor)
+                                result = measure(build, factor, args.repeat)
+                        else:
+                            result = measure(build, factor, args.repeat)
+                        rows, seconds, peak = result
+                        print(
+                            f"{name:<16}{factor:<10}{reads:<8}{rows:>8}"
+                            f"{seconds * 1000:>10.1f}{peak / 2**20:>10.2f}"
+                        )
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+import time
+import fantasy_football.utils.header_mapping as header_mapping
+import fantasy_football.utils.schema as schema
+
+# table ids of a season page with their schemas
+season_tables = {
+    "team_stats": header_mapping.schema_offense,
+    "team_scoring": header_mapping.schema_scoring,
+    "passing": header_mapping.schema_passing,
+    "rushing": header_mapping.schema_rushing,
+    "returns": header_mapping.schema_returns,
+    "kicking": header_mapping.schema_kicking,
+    "punting": header_mapping.schema_punting,
+    "team_conversions": header_mapping.schema_conversion,
+    "drives": header_mapping.schema_drives,
+}
+
+# table ids of an opponent page with their schemas
+opponent_tables = {
+    "team_stats": header_mapping.schema_defense,
+    "team_scoring": header_mapping.schema_scoring_defense,
+    "passing": header_mapping.schema_passing_defense,
+    "rushing": header_mapping.schema_rushing_defense,
+    "returns": header_mapping.schema_returns_defense,
+    "kicking": header_mapping.schema_kicking_defense,
+    "punting": header_mapping.schema_punting_defense,
+    "team_conversions": header_mapping.schema_conversion_defense,
+    "drives": header_mapping.schema_drives_defense,
+}
+
+
+def synthetic_value(column: schema.Column, team: int, position: int) -> str:
+    # cell text matching the dtype of column
+    if column.parse == schema.PERCENT:
+        return f"{team + position}.5%"
+    if column.dtype == schema.INT:
+        return str(team * (position + 1))
+    if column.dtype == schema.FLOAT:
+        return f"{team * (position + 1)}.5"
+    return f"{column.name} {team}"
+
+
+def synthetic_table(table_id: str, table_schema: schema.Schema, teams: int = 32) -> str:
+    """
+    Build a team table shaped like the pro football reference ones
+
+    Parameters
+    ----------
+    table_id: str
+        id of table
+    table_schema: Schema
+        columns of the table, format: year, rank, team_id, stats...
+    teams: int, optional
+        number of team rows
+
+    Returns
+    -------
+    str:
+        html of table
+    """
+    rows = list()
+    for t in range(1, teams + 1):
+        cells = [
+            f'<th scope="row" class="right " data-stat="ranker">{t}</th>',
+            f'<td class="left " data-stat="team"><a href="/teams/t{t:02d}/2022.htm">'
+            f"Team {t}</a></td>",
+        ]
+        for c, column in enumerate(table_schema.columns[3:]):
+            cells.append(
+                f'<td class="right " data-stat="{column.name}">'
+                f"{synthetic_value(column, t, c)}</td>"
+            )
+        rows.append(f"<tr>{''.join(cells)}</tr>")
+    head = "".join(
+        f'<th data-stat="{header}">{header}</th>' for header in table_schema.names[1:]
+    )
+    return (
+        f'<table class="stats_table" id="{table_id}"><thead><tr>{head}</tr></thead>'
+        f"<tbody>{''.join(rows)}</tbody></table>"
+    )
+
+
+def synthetic_page(tables: dict, filler: int = 200) -> str:
+    """
+    Build a season page, every table but the first is wrapped in an html comment
+    like pro football reference does
+
+    Parameters
+    ----------
+    tables: dict
+        id of table -> schema of table
+    filler: int, optional
+        number of unrelated paragraphs for page weight
+
+    Returns
+    -------
+    str:
+        html of page
+    """
+    body = list()
+    for i, (table_id, table_schema) in enumerate(tables.items()):
+        table = synthetic_table(table_id=table_id, table_schema=table_schema)
+        if i == 0:
+            body.append(
+                f'<div class="table_container" id="div_{table_id}">{table}</div>'
+            )
+        else:
+            body.append(f'<div id="all_{table_id}"><!--\n{table}\n--></div>')
+    body.extend(
+        f"<p>filler {i} <a href='/x/{i}.htm'>link</a></p>" for i in range(filler)
+    )
+    return f"<html><body><div id='content'>{''.join(body)}</div></body></html>"
+
+
+class CountingFetcher:
+    """
+    Fetcher backend serving one saved page and counting the requests
+
+    Parameters
+    ----------
+    source: str
+        page source served for every website
+    """
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.pages = 0
+
+    def fetch(self, website: str, load_timeout: int = 3, wait_for: list = None) -> str:
+        self.pages += 1
+        return self.source
+
+
+def timed(function, *args, **kwargs) -> tuple:
+    """
+    Run function and measure its wall time
+
+    Returns
+    -------
+    tuple:
+        result of function, seconds
+    """
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
@@ -20,7 +20,7 @@ def create_nfl_boxplots(column: str, factor: str = "offense") -> None:
     >>> import pandas as pd
     >>> create_nfl_boxplots('yards_per_game', factor='defensive')
     """
-    df = loader.combine_nfl_measure_tables(factor=factor)
+    df = loader.combine_nfl_measure_tables(factor=factor, columns=[column])
     boxplot = df.boxplot(column=[column], by="made_playoffs")
     boxplot.get_figure().suptitle("")
     plt.savefig(f"plots/{column}_{factor}.png")
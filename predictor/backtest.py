@@ -0,0 +1,194 @@
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+import xgboost as xgb
+from sklearn.metrics import log_loss, roc_auc_score
+import fantasy_football.predictor.features as features
+import fantasy_football.predictor.loader as loader
+import fantasy_football.predictor.xgboost_predictor as xgboost_predictor
+import fantasy_football.utils.logging as logging
+
+# seasons the first tested season is trained on
+MIN_SEASONS = 5
+
+# seed of the classifier of every season
+SEED = 0
+
+# columns of the result, one row per tested season
+COLUMNS = [
+    "year",
+    "train_seasons",
+    "train_rows",
+    "test_rows",
+    "auc",
+    "log_loss",
+    "seconds",
+]
+
+# arrays shared between the worker processes, one npy file each
+_ARRAYS = ["X", "y", "year"]
+
+# shared arrays and settings of a worker process, set once by _init_worker
+_data = None
+_settings = None
+
+
+def _arrays(df: pd.DataFrame) -> dict:
+    # feature table as plain arrays, missing values as nan
+    X = df.drop(columns=loader.KEYS + [loader.LABEL])
+    return {
+        "X": X.to_numpy(dtype="float64", na_value=np.nan),
+        "y": df[loader.LABEL].to_numpy(dtype="float64"),
+        "year": df["year"].to_numpy(dtype="int64"),
+    }
+
+
+def _share(arrays: dict, directory: str) -> dict:
+    # write arrays as npy files, workers map them read only
+    paths = dict()
+    for name in _ARRAYS:
+        paths[name] = os.path.join(directory, f"{name}.npy")
+        np.save(paths[name], arrays[name])
+    return paths
+
+
+def _init_worker(paths: dict, settings: dict) -> None:
+    global _data, _settings
+    _data = {name: np.load(path, mmap_mode="r") for name, path in paths.items()}
+    _settings = settings
+
+
+def _season(data: dict, year: int, settings: dict) -> dict:
+    # train on the seasons before year, predict the playoff teams of year
+    start = time.perf_counter()
+    train = data["year"] < year
+    test = data["year"] == year
+    matrix = xgb.QuantileDMatrix(
+        data["X"][train], label=data["y"][train], feature_names=settings["names"]
+    )
+    booster = xgb.train(
+        {**settings["params"], "nthread": settings["threads"], "seed": SEED},
+        matrix,
+        num_boost_round=settings["rounds"],
+    )
+    y = data["y"][test]
+    p = booster.predict(xgb.DMatrix(data["X"][test], feature_names=settings["names"]))
+    return {
+        "year": year,
+        "train_seasons": len(np.unique(data["year"][train])),
+        "train_rows": int(train.sum()),
+        "test_rows": int(test.sum()),
+        # auc is undefined for seasons with one class only
+        "auc": roc_auc_score(y, p) if len(np.unique(y)) == 2 else np.nan,
+        "log_loss": log_loss(y, p, labels=[0, 1]),
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def _season_worker(year: int) -> dict:
+    return _season(_data, year, _settings)
+
+
+def backtest(
+    years: list = None,
+    min_seasons: int = MIN_SEASONS,
+    params: dict = None,
+    rounds: int = xgboost_predictor.ROUNDS,
+    max_workers: int = None,
+    threads: int = 1,
+) -> pd.DataFrame:
+    """
+    Walk forward backtest of the playoff classifier
+    Every tested season S is predicted by a classifier trained on the seasons
+    before S only. Seasons are fitted in parallel worker processes,
+    the feature arrays are written once and memory mapped read only
+    by all workers instead of being copied into every process.
+
+    Parameters
+    ----------
+    years: list, optional
+        seasons to test, defaults to the seasons with known playoff teams
+        after the first min_seasons seasons, seasons without known playoff
+        teams or earlier seasons are left out
+    min_seasons: int, optional
+        number of seasons the first tested season is trained on
+    params: dict, optional
+        xgboost parameters, defaults to PARAMS of xgboost_predictor
+    rounds: int, optional
+        boosting rounds
+    max_workers: int, optional
+        number of worker processes, defaults to the cpus divided by threads
+    threads: int, optional
+        threads of xgboost per worker process
+
+    Returns
+    -------
+    DataFrame:
+        no rows if no season can be tested
+        year: int
+            tested season
+        train_seasons: int
+            number of seasons trained on
+        train_rows, test_rows: int
+            number of team seasons trained on and predicted
+        auc: float
+            area under the roc curve of the predicted playoff probabilities
+        log_loss: float
+            log loss of the predicted playoff probabilities
+        seconds: float
+            wall time of fitting and predicting the season
+
+    Example
+    -------
+    >>> backtest(min_seasons=10)[["year", "auc", "log_loss"]]
+    """
+    labeled = features.labeled_seasons()
+    if years is None:
+        years = labeled[min_seasons:]
+    years = [year for year in years if year in labeled]
+    if not years:
+        logging.log("backtest without labeled seasons to test")
+        return pd.DataFrame(columns=COLUMNS)
+    df = features.load_features(years=[year for year in labeled if year <= max(years)])
+    # team seasons without a label can't be trained on or scored
+    df = df[df[loader.LABEL].notna()]
+    arrays = _arrays(df)
+    settings = {
+        "names": list(df.columns.drop(loader.KEYS + [loader.LABEL])),
+        "params": params or xgboost_predictor.PARAMS,
+        "rounds": rounds,
+        "threads": threads,
+    }
+    # seasons without earlier seasons can't be trained, empty seasons not scored
+    years = [
+        year
+        for year in years
+        if (arrays["year"] < year).any() and (arrays["year"] == year).any()
+    ]
+    if not years:
+        logging.log("backtest without seasons to train on")
+        return pd.DataFrame(columns=COLUMNS)
+
+    start = time.perf_counter()
+    if max_workers is None:
+        max_workers = max(1, (os.cpu_count() or 1) // threads)
+    max_workers = min(max_workers, max(1, len(years)))
+    if max_workers == 1:
+        results = [_season(arrays, year, settings) for year in years]
+    else:
+        with tempfile.TemporaryDirectory() as directory:
+            paths = _share(arrays, directory)
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(paths, settings),
+            ) as executor:
+                # latest seasons train on most rows, they are started first
+                results = list(executor.map(_season_worker, sorted(years)[::-1]))
+    logging.log(
+        f"backtest of {len(years)} seasons in {time.perf_counter() - start:.1f}s"
+    )
+    return pd.DataFrame(results, columns=COLUMNS).sort_values("year", ignore_index=True)
@@ -0,0 +1,213 @@
+import glob
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+import pandas as pd
+
+# bytes read at once while hashing source files
+_CHUNK = 1024 * 1024
+
+
+def digest(value) -> str:
+    """
+    Short digest of a value for cache keys, p.e. requested columns and years
+
+    Parameters
+    ----------
+    value: object
+        value with a stable repr, p.e. a list
+
+    Returns
+    -------
+    str:
+        hex digest
+    """
+    return hashlib.sha1(repr(value).encode()).hexdigest()[:12]
+
+
+# path -> (mtime, size, hash), files are hashed again only after a change
+_hashes = dict()
+_hashes_lock = threading.Lock()
+
+
+def _hash(path: str) -> str:
+    stat = os.stat(path)
+    known = _hashes.get(path)
+    if known and known[:2] == (stat.st_mtime_ns, stat.st_size):
+        return known[2]
+    sha = hashlib.sha1()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(_CHUNK), b""):
+            sha.update(chunk)
+    _hashes[path] = (stat.st_mtime_ns, stat.st_size, sha.hexdigest())
+    return sha.hexdigest()
+
+
+def fingerprint(sources: list) -> str:
+    """
+    Fingerprint of source files from their paths, mtimes and contents,
+    missing files are left out
+
+    Parameters
+    ----------
+    sources: list
+        paths of source files
+
+    Returns
+    -------
+    str:
+        hex digest, changes whenever a source file changes
+    """
+    sha = hashlib.sha1()
+    with _hashes_lock:
+        for path in sorted(sources):
+            # a file appearing later changes the fingerprint all the same
+            if not os.path.exists(path):
+                continue
+            sha.update(path.encode())
+            sha.update(_hash(path).encode())
+    return sha.hexdigest()[:16]
+
+
+class TableCache:
+    """
+    Cache of tables built from source files, p.e. the combined measure tables
+    Tables are kept in memory for the maxsize most recently used keys and
+    materialized as parquet files on disk, so later processes skip the build.
+    An entry is only valid for the fingerprint of its source files,
+    a changed source file changes the fingerprint and the table is built again.
+
+    Parameters
+    ----------
+    directory: str, optional
+        directory of the materialized tables, None to keep tables in memory only
+    maxsize: int, optional
+        number of tables kept in memory
+    """
+
+    def __init__(self, directory: str = ".cache/tables", maxsize: int = 8) -> None:
+        self.directory = directory
+        self.maxsize = maxsize
+        self._tables = OrderedDict()
+        self._lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def fingerprint(self, sources: list) -> str:
+        """
+        Fingerprint of source files, see fingerprint
+        """
+        return fingerprint(sources)
+
+    def _path(self, key: str, fingerprint: str) -> str:
+        return os.path.join(self.directory, f"{key}-{fingerprint}.parquet")
+
+    def get(self, key: str, sources: list, build) -> pd.DataFrame:
+        """
+        Get table of key, build it if it isn't cached for the current sources
+
+        Parameters
+        ----------
+        key: str
+            name of table, p.e. 'offense'
+        sources: list
+            paths of the files the table is built from
+        build: callable
+            function without arguments returning the table
+
+        Returns
+        -------
+        DataFrame:
+            copy of the table, callers may change it
+        """
+        with self._lock:
+            fingerprint = self.fingerprint(sources)
+            df = self._tables.get(key)
+            if df is not None and df[0] == fingerprint:
+                self._tables.move_to_end(key)
+                return df[1].copy()
+        path = self._path(key, fingerprint) if self.directory else None
+        if path and os.path.exists(path):
+            df = pd.read_parquet(path)
+        else:
+            df = build()
+            if path:
+                self._materialize(key, path, df)
+        with self._lock:
+            self._tables[key] = (fingerprint, df)
+            self._tables.move_to_end(key)
+            while len(self._tables) > self.maxsize:
+                self._tables.popitem(last=False)
+        return df.copy()
+
+    def _materialize(self, key: str, path: str, df: pd.DataFrame) -> None:
+        # tables of outdated sources are never read again
+        for old in glob.glob(self._path(glob.escape(key), "*")):
+            os.remove(old)
+        df.to_parquet(path + ".tmp", index=False)
+        os.replace(path + ".tmp", path)
+
+    def clear(self) -> None:
+        """
+        Remove all tables from memory and disk
+        """
+        with self._lock:
+            self._tables.clear()
+            if self.directory:
+                for path in glob.glob(os.path.join(self.directory, "*.parquet")):
+                    os.remove(path)
+
+
+# process wide cache used by predictor.loader
+_cache = None
+_cache_lock = threading.Lock()
+_enabled = True
+
+
+def get_cache() -> TableCache:
+    """
+    Get the process wide table cache, create it on first use
+
+    Returns
+    -------
+    TableCache:
+        shared table cache, None if caching is disabled
+    """
+    global _cache
+    if not _enabled:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = TableCache()
+        return _cache
+
+
+def configure_cache(directory: str = ".cache/tables", maxsize: int = 8) -> TableCache:
+    """
+    Replace the process wide table cache and enable caching
+
+    Parameters
+    ----------
+    directory: str, optional
+        directory of the materialized tables, None to keep tables in memory only
+    maxsize: int, optional
+        number of tables kept in memory
+
+    Returns
+    -------
+    TableCache:
+        shared table cache
+    """
+    global _cache, _enabled
+    _cache = TableCache(directory=directory, maxsize=maxsize)
+    _enabled = True
+    return _cache
+
+
+def disable_cache() -> None:
+    """
+    Build every table from its source files again
+    """
+    global _enabled
+    _enabled = False
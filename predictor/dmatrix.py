@@ -0,0 +1,120 @@
+import os
+import pandas as pd
+import xgboost as xgb
+import fantasy_football.predictor.cache as cache
+import fantasy_football.predictor.features as features
+import fantasy_football.utils.storage as storage
+
+# directory of the training matrices saved in xgboost's binary format
+DIRECTORY = ".cache/dmatrix"
+
+# number of histogram bins of the quantized features, xgboost's default
+MAX_BIN = 256
+
+
+def fingerprint(years: list = None) -> str:
+    """
+    Fingerprint of the training data of seasons,
+    changes whenever the feature table of one of the seasons changes
+
+    Parameters
+    ----------
+    years: list, optional
+        seasons of the training data, all seasons if None
+
+    Returns
+    -------
+    str:
+        hex digest
+    """
+    features.materialize()
+    files = storage.sources(features.PATH, years=years)
+    return cache.digest([features.VERSION, years, cache.fingerprint(files)])
+
+
+def quantize(X: pd.DataFrame, y: pd.Series, max_bin: int = MAX_BIN) -> xgb.DMatrix:
+    """
+    Training matrix with the features quantized once,
+    fits of the hist tree method reuse the bins instead of building them again
+
+    Parameters
+    ----------
+    X: DataFrame
+        features
+    y: Series
+        label
+    max_bin: int, optional
+        number of bins per feature
+
+    Returns
+    -------
+    QuantileDMatrix:
+        training matrix
+    """
+    return xgb.QuantileDMatrix(X, label=y, max_bin=max_bin)
+
+
+def save(years: list = None, directory: str = DIRECTORY) -> str:
+    """
+    Save the training matrix of seasons in xgboost's binary format,
+    the file is only written if there is none for the current training data
+
+    Parameters
+    ----------
+    years: list, optional
+        seasons of the training data, all seasons if None
+    directory: str, optional
+        directory of the binary files
+
+    Returns
+    -------
+    str:
+        path of binary file
+    """
+    path = os.path.join(directory, f"training-{fingerprint(years=years)}.buffer")
+    if not os.path.exists(path):
+        X, y = features.training_data(years=years)
+        os.makedirs(directory, exist_ok=True)
+        xgb.DMatrix(X, label=y).save_binary(path + ".tmp")
+        os.replace(path + ".tmp", path)
+    return path
+
+
+def load(path: str) -> xgb.DMatrix:
+    """
+    Load a training matrix saved by save, without converting the features again
+    The bins of the hist tree method are built by the first fit and kept
+    with the matrix for later fits.
+
+    Parameters
+    ----------
+    path: str
+        path of binary file
+
+    Returns
+    -------
+    DMatrix:
+        training matrix
+    """
+    return xgb.DMatrix(path)
+
+
+def training_matrix(years: list = None, directory: str = DIRECTORY) -> xgb.DMatrix:
+    """
+    Training matrix of seasons, read from its binary file when directory is set
+
+    Parameters
+    ----------
+    years: list, optional
+        seasons of the training data, all seasons if None
+    directory: str, optional
+        directory of the binary files, None to quantize in memory only
+
+    Returns
+    -------
+    DMatrix:
+        training matrix
+    """
+    if directory:
+        return load(save(years=years, directory=directory))
+    return quantize(*features.training_data(years=years))
@@ -0,0 +1,207 @@
+import datetime
+import json
+import os
+import shutil
+import pandas as pd
+import fantasy_football.predictor.cache as cache
+import fantasy_football.predictor.loader as loader
+import fantasy_football.utils.storage as storage
+import fantasy_football.scrapers.cache as page_cache
+
+# version of the feature definition, bump it when build_features changes
+# so materialized tables of older versions are rebuilt
+VERSION = 2
+
+# materialized team season features, parquet dataset partitioned by season
+PATH = "data/features/team_season.parquet"
+
+# file in the dataset with the version and the fingerprint of every season
+MANIFEST = "_manifest.json"
+
+# measures of the combined tables that are no features
+EXCLUDED = {
+    "offense": [
+        "games",
+        "points_per_game",
+        "extra_points_made",
+        "extra_points_attempted",
+    ],
+    "defense": [
+        "games",
+        "points_per_game",
+        "total_touchdowns",
+        "points_against",
+    ],
+}
+
+
+def build_features(years: list = None) -> pd.DataFrame:
+    """
+    Build the wide team season table, offense measures with suffix _offense
+    next to defense measures with suffix _defense
+
+    Parameters
+    ----------
+    years: list, optional
+        seasons to build, all seasons if None
+
+    Returns
+    -------
+    DataFrame:
+        year: int
+            season year
+        team_id: str
+            teams pro football reference id
+        *_offense, *_defense: float
+            features
+        made_playoffs: bool
+            team made playoffs
+    """
+    frames = list()
+    for factor, excluded in EXCLUDED.items():
+        df = loader.combine_nfl_measure_tables(factor=factor, years=years)
+        df = df.set_index(loader.KEYS)
+        frames.append(
+            df.drop(columns=excluded + [loader.LABEL]).add_suffix(f"_{factor}")
+        )
+    # both tables carry the label of the playoff history
+    frames.append(df[loader.LABEL])
+    # teams with offense and defense measures
+    return pd.concat(frames, axis=1, join="inner").reset_index()
+
+
+def _season_sources(year: int) -> list:
+    # files the features of a season are built from
+    return loader.source_files(factor="offense", years=[year]) + loader.source_files(
+        factor="defense", years=[year]
+    )
+
+
+def _read_manifest(path: str) -> dict:
+    try:
+        with open(os.path.join(path, MANIFEST)) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return dict()
+
+
+def _write_manifest(path: str, manifest: dict) -> None:
+    output = os.path.join(path, MANIFEST)
+    with open(output + ".tmp", "w") as file:
+        json.dump(manifest, file, indent=1, sort_keys=True)
+    os.replace(output + ".tmp", output)
+
+
+def materialize(path: str = PATH) -> list:
+    """
+    Bring the materialized feature table up to date
+    Every season is stored with the fingerprint of its source files,
+    only seasons whose sources changed, new seasons and all seasons of
+    an older VERSION are built again. Seasons without sources are removed.
+
+    Parameters
+    ----------
+    path: str, optional
+        parquet dataset of the feature table
+
+    Returns
+    -------
+    list:
+        seasons that were built
+    """
+    manifest = _read_manifest(path)
+    if manifest.get("version") != VERSION:
+        manifest = {"version": VERSION, "seasons": dict()}
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+    stored = manifest["seasons"]
+
+    seasons = loader.seasons(factor="offense")
+    fingerprints = {
+        str(year): cache.fingerprint(_season_sources(year)) for year in seasons
+    }
+    stale = [
+        year for year in seasons if stored.get(str(year)) != fingerprints[str(year)]
+    ]
+    removed = [year for year in stored if year not in fingerprints]
+
+    for year in stale + removed:
+        shutil.rmtree(
+            os.path.join(path, f"{storage.PARTITION}={year}"), ignore_errors=True
+        )
+    if stale:
+        storage.write_table(build_features(years=stale), path, replace=False)
+    if stale or removed or not os.path.exists(os.path.join(path, MANIFEST)):
+        os.makedirs(path, exist_ok=True)
+        _write_manifest(path, {"version": VERSION, "seasons": fingerprints})
+    return stale
+
+
+def load_features(
+    years: list = None, columns: list = None, path: str = PATH
+) -> pd.DataFrame:
+    """
+    Read the team season feature table, materialized first if it is outdated
+
+    Parameters
+    ----------
+    years: list, optional
+        seasons to read, all seasons if None
+    columns: list, optional
+        columns to read, all columns if None
+    path: str, optional
+        parquet dataset of the feature table
+
+    Returns
+    -------
+    DataFrame:
+        team season features, see build_features
+    """
+    materialize(path=path)
+    return storage.read_table(path, columns=columns, years=years)
+
+
+def labeled_seasons(today: datetime.date = None) -> list:
+    """
+    Parameters
+    ----------
+    today: datetime.date, optional
+        date, defaults to today
+
+    Returns
+    -------
+    list:
+        finished seasons of the measure tables with playoff teams in the
+        playoff history, the seeds of a running season are provisional
+    """
+    running = page_cache.current_season(today)
+    history = loader.read_playoff_history(columns=["year", loader.LABEL])
+    made = history[loader.LABEL].fillna(False).astype(bool)
+    played = set(history.loc[made, "year"].tolist())
+    return [
+        year
+        for year in loader.seasons(factor="offense")
+        if year in played and year < running
+    ]
+
+
+def training_data(years: list = None, path: str = PATH) -> tuple:
+    """
+    Features and label of the playoff classifier
+
+    Parameters
+    ----------
+    years: list, optional
+        seasons to read, all seasons if None
+    path: str, optional
+        parquet dataset of the feature table
+
+    Returns
+    -------
+    DataFrame:
+        X, features of every team season
+    Series:
+        y, team made playoffs
+    """
+    df = load_features(years=years, path=path)
+    return df.drop(columns=loader.KEYS + [loader.LABEL]), df[loader.LABEL]
@@ -1,31 +1,33 @@
+import os
 import pandas as pd
 import numpy as np
+import fantasy_football.predictor.cache as cache
+import fantasy_football.utils.header_mapping as header_mapping
+import fantasy_football.utils.storage as storage
 
+# schemas of the measure tables per factor
+schemas = {
+    "offense": {
+        "total": header_mapping.schema_offense,
+        "scoring": header_mapping.schema_scoring,
+        "returning": header_mapping.schema_returns,
+        "punting": header_mapping.schema_punting,
+        "conversion": header_mapping.schema_conversion,
+    },
+    "defense": {
+        "total": header_mapping.schema_defense,
+        "scoring": header_mapping.schema_scoring_defense,
+        "returning": header_mapping.schema_returns_defense,
+        "punting": header_mapping.schema_punting_defense,
+        "conversion": header_mapping.schema_conversion_defense,
+    },
+}
 
-def combine_nfl_measure_tables(factor: str = "offense") -> pd.DataFrame:
-    """
-    This function combines different NFL measure tables, such as completion, scoring, returning, and punting,
-    into a single DataFrame based on the specified factor ('offense' or 'defense').
-
-    Parameters
-    ----------
-    factor: str, optional
-        The factor to consider, either 'offense' or 'defense'
-
-    Returns
-    -------
-    pd.DataFrame:
-        A DataFrame combining various NFL measure tables related to the specified factor.
 
-    Example
-    -------
-    >>> combined_df = combine_nfl_measure_tables('offense')
-    """
-    total = pd.read_excel(f"data/{factor}/total_{factor}.xlsx")
-    if factor == "offense":
-        cols = [
-            "year",
-            "team_id",
+# measure columns used per factor and table, in order of the combined table
+measures = {
+    "offense": {
+        "total": [
             "games",
             "total_yards",
             "offensive_plays",
@@ -46,11 +48,37 @@ def combine_nfl_measure_tables(factor: str = "offense") -> pd.DataFrame:
             "yards_penalties_opponent",
             "pct_drives_ending_score",
             "pct_drives_ending_turnover",
-        ]
-    elif factor == "defense":
-        cols = [
-            "year",
-            "team_id",
+        ],
+        "scoring": [
+            "total_touchdowns",
+            "two_points_made",
+            "two_points_attempted",
+            "extra_points_made",
+            "extra_points_attempted",
+            "field_goals_made",
+            "field_goals_attempted",
+            "points_per_game",
+        ],
+        "returning": [
+            "punts_returned",
+            "yards_per_punt_return",
+            "kickoffs_returned",
+            "yards_per_kickoff_return",
+            "all_purpose_yards",
+        ],
+        "punting": [
+            "punts_avg_yards",
+            "punts_touchback_pct",
+            "punts_inside_20_pct",
+        ],
+        "conversion": [
+            "third_down_conversion_pct",
+            "fourth_down_conversion_pct",
+            "red_zone_conversion_pct",
+        ],
+    },
+    "defense": {
+        "total": [
             "games",
             "points_against",
             "total_yards",
@@ -73,127 +101,362 @@ def combine_nfl_measure_tables(factor: str = "offense") -> pd.DataFrame:
             "first_downs_penalties_commited",
             "pct_drives_ending_score",
             "pct_drives_ending_turnover",
-        ]
-    total = total[cols]
-    total["completion_pct"] = total["passes_completed"] / total["passes_attempted"]
-    total["yards_per_game"] = total["total_yards"] / total["games"]
-    total["touchdown_interception_ratio"] = (
-        total["touchdowns_passing"] / total["interceptions"]
-    )
-    total["pass_run_ratio"] = total["passes_attempted"] / total["rushing_attempted"]
-
-    scoring = pd.read_excel(f"data/{factor}/scoring_{factor}.xlsx")
-    if factor == "offense":
-        cols = [
-            "year",
-            "team_id",
+        ],
+        "scoring": [
             "total_touchdowns",
-            "two_points_made",
-            "two_points_attempted",
-            "extra_points_made",
-            "extra_points_attempted",
-            "field_goals_made",
-            "field_goals_attempted",
             "points_per_game",
-        ]
-        scoring = scoring[cols]
-        scoring["field_goal_pct"] = (
-            scoring["field_goals_made"] / scoring["field_goals_attempted"]
-        )
-        scoring["extra_point_pct"] = (
-            scoring["extra_points_made"] / scoring["extra_points_attempted"]
-        )
-        scoring["two_point_pct"] = (
-            scoring["two_points_made"] / scoring["two_points_attempted"]
-        )
-    elif factor == "defense":
-        cols = [
-            "year",
-            "team_id",
-            "total_touchdowns",
-            "points_per_game",
-        ]
-        scoring = scoring[cols]
-    total = total.merge(right=scoring, on=["year", "team_id"])
-
-    returning = pd.read_excel(f"data/{factor}/returning_{factor}.xlsx")
-    if factor == "offense":
-        cols = [
-            "year",
-            "team_id",
+        ],
+        "returning": [
             "punts_returned",
             "yards_per_punt_return",
             "kickoffs_returned",
             "yards_per_kickoff_return",
-            "all_purpose_yards",
-        ]
-    elif factor == "defense":
-        cols = [
-            "year",
-            "team_id",
-            "punts_returned",
-            "yards_per_punt_return",
-            "kickoffs_returned",
-            "yards_per_kickoff_return",
-        ]
-    returning = returning[cols]
-    total = total.merge(right=returning, on=["year", "team_id"])
-
-    punting = pd.read_excel(f"data/{factor}/punting_{factor}.xlsx")
-    if factor == "offense":
-        cols = [
-            "year",
-            "team_id",
+        ],
+        "punting": [
             "punts_avg_yards",
-            "punts_touchback_pct",
-            "punts_inside_20_pct",
-        ]
-        punting = punting[cols]
-        punting["punts_touchback_pct"] = (
-            punting["punts_touchback_pct"].str.rstrip("%").astype("float") / 100.0
-        )
-        punting["punts_inside_20_pct"] = (
-            punting["punts_inside_20_pct"].str.rstrip("%").astype("float") / 100.0
-        )
-    elif factor == "defense":
-        cols = [
-            "year",
-            "team_id",
-            "punts_avg_yards",
-        ]
-        punting = punting[cols]
-
-    total = total.merge(right=punting, on=["year", "team_id"])
-
-    conversion = pd.read_excel(f"data/{factor}/conversion_{factor}.xlsx")
-    conversion = conversion[
-        [
-            "year",
-            "team_id",
+        ],
+        "conversion": [
             "third_down_conversion_pct",
             "fourth_down_conversion_pct",
             "red_zone_conversion_pct",
-        ]
-    ]
-    conversion["third_down_conversion_pct"] = (
-        conversion["third_down_conversion_pct"].str.rstrip("%").astype("float") / 100.0
+        ],
+    },
+}
+
+# ratios added to the measures per factor and table,
+# column -> (numerator, denominator)
+ratios = {
+    "offense": {
+        "total": {
+            "completion_pct": ("passes_completed", "passes_attempted"),
+            "yards_per_game": ("total_yards", "games"),
+            "touchdown_interception_ratio": ("touchdowns_passing", "interceptions"),
+            "pass_run_ratio": ("passes_attempted", "rushing_attempted"),
+        },
+        "scoring": {
+            "field_goal_pct": ("field_goals_made", "field_goals_attempted"),
+            "extra_point_pct": ("extra_points_made", "extra_points_attempted"),
+            "two_point_pct": ("two_points_made", "two_points_attempted"),
+        },
+    },
+    "defense": {
+        "total": {
+            "completion_pct": ("passes_completed", "passes_attempted"),
+            "yards_per_game": ("total_yards", "games"),
+            "touchdown_interception_ratio": ("touchdowns_passing", "interceptions"),
+            "pass_run_ratio": ("passes_attempted", "rushing_attempted"),
+        },
+    },
+}
+
+# version of the combined tables, bump it when their values change
+# so cached tables of older versions are built again
+VERSION = 2
+
+# columns every combined table has
+KEYS = ["year", "team_id"]
+LABEL = "made_playoffs"
+
+# file of the playoff history the measure tables are labeled with
+PLAYOFF_HISTORY = "data/playoffs/playoff_history.xlsx"
+
+# warehouse the tables are read from instead of their files, see use_warehouse
+_warehouse = None
+
+
+def use_warehouse(warehouse) -> None:
+    """
+    Read measure tables and playoff history from a warehouse,
+    tables the warehouse doesn't hold yet are still read from their files
+
+    Parameters
+    ----------
+    warehouse: Warehouse
+        warehouse of utils.warehouse, None to read the files again
+    """
+    global _warehouse
+    _warehouse = warehouse
+
+
+def _load(
+    path: str, table_schema, columns: list = None, years: list = None
+) -> pd.DataFrame:
+    # warehouse tables are named like the files, p.e. total_offense
+    name = os.path.splitext(os.path.basename(path))[0]
+    if _warehouse is not None and _warehouse.has_rows(name):
+        return _warehouse.read_table(name, columns=columns, years=years)
+    return storage.load(path, table_schema=table_schema, columns=columns, years=years)
+
+
+def table_path(factor: str, table: str) -> str:
+    """
+    Parameters
+    ----------
+    factor: str
+        'offense' or 'defense'
+    table: str
+        'total', 'scoring', 'returning', 'punting' or 'conversion'
+
+    Returns
+    -------
+    str:
+        path of the xlsx file of the measure table
+    """
+    return f"data/{factor}/{table}_{factor}.xlsx"
+
+
+def read_table(
+    factor: str, table: str, columns: list = None, years: list = None
+) -> pd.DataFrame:
+    """
+    Read a measure table with the dtypes of its schema
+    from the warehouse set with use_warehouse if it holds the table,
+    else from the parquet dataset when present, else from the xlsx file,
+    files written by older scraper versions hold text and are parsed once here
+
+    Parameters
+    ----------
+    factor: str
+        'offense' or 'defense'
+    table: str
+        'total', 'scoring', 'returning', 'punting' or 'conversion'
+    columns: list, optional
+        columns to read, all columns if None
+    years: list, optional
+        seasons to read, all seasons if None
+
+    Returns
+    -------
+    pd.DataFrame:
+        typed measure table
+    """
+    return _load(
+        table_path(factor=factor, table=table),
+        table_schema=schemas[factor][table],
+        columns=columns,
+        years=years,
+    )
+
+
+def read_playoff_history(columns: list = None, years: list = None) -> pd.DataFrame:
+    """
+    Read the playoff history with the dtypes of its schema,
+    from the warehouse or files like read_table
+
+    Parameters
+    ----------
+    columns: list, optional
+        columns to read, all columns if None
+    years: list, optional
+        seasons to read, all seasons if None
+
+    Returns
+    -------
+    pd.DataFrame:
+        typed playoff history
+    """
+    return _load(
+        PLAYOFF_HISTORY,
+        table_schema=header_mapping.schema_playoffs,
+        columns=columns,
+        years=years,
     )
-    conversion["fourth_down_conversion_pct"] = (
-        conversion["fourth_down_conversion_pct"].str.rstrip("%").astype("float") / 100.0
+
+
+def seasons(factor: str = "offense") -> list:
+    """
+    Seasons of the measure tables of a factor
+
+    Parameters
+    ----------
+    factor: str, optional
+        'offense' or 'defense'
+
+    Returns
+    -------
+    list:
+        sorted season years
+    """
+    if _warehouse is not None and _warehouse.has_rows(f"total_{factor}"):
+        df = _warehouse.query(f"SELECT DISTINCT year FROM total_{factor} ORDER BY year")
+        return df["year"].tolist()
+    return storage.seasons(table_path(factor=factor, table="total"))
+
+
+def source_files(factor: str, years: list = None) -> list:
+    """
+    Files the combined measure table of a factor is built from
+
+    Parameters
+    ----------
+    factor: str
+        'offense' or 'defense'
+    years: list, optional
+        seasons of the table, all seasons if None
+
+    Returns
+    -------
+    list:
+        paths of parquet files or xlsx files, the warehouse files
+        instead of the tables it holds
+    """
+    files = list()
+    paths = [table_path(factor=factor, table=table) for table in schemas[factor]]
+    for path in paths + [PLAYOFF_HISTORY]:
+        # tables served by the warehouse are covered by its files
+        name = os.path.splitext(os.path.basename(path))[0]
+        if _warehouse is not None and _warehouse.has_rows(name):
+            continue
+        files.extend(storage.sources(path, years=years))
+    if _warehouse is not None:
+        # committed rows may still be in the write ahead log
+        files.extend(
+            path
+            for path in [_warehouse.path, _warehouse.path + "-wal"]
+            if os.path.exists(path)
+        )
+    return files
+
+
+def combine_nfl_measure_tables(
+    factor: str = "offense", columns: list = None, years: list = None
+) -> pd.DataFrame:
+    """
+    Combined measure tables of a factor, see build_nfl_measure_tables
+    The table is cached in memory and on disk until one of its source files
+    changes, see predictor.cache.
+
+    Parameters
+    ----------
+    factor: str, optional
+        The factor to consider, either 'offense' or 'defense'
+    columns: list, optional
+        measures to return besides year, team_id and made_playoffs,
+        all measures if None
+    years: list, optional
+        seasons to return, all seasons if None
+
+    Returns
+    -------
+    pd.DataFrame:
+        A DataFrame combining various NFL measure tables related to the specified factor.
+    """
+    table_cache = cache.get_cache()
+    if table_cache is None:
+        return build_nfl_measure_tables(factor=factor, columns=columns, years=years)
+    key = f"{factor}_v{VERSION}"
+    if columns is not None or years is not None:
+        key = f"{key}_{cache.digest([columns, years])}"
+    return table_cache.get(
+        key=key,
+        sources=source_files(factor=factor, years=years),
+        build=lambda: build_nfl_measure_tables(
+            factor=factor, columns=columns, years=years
+        ),
+    )
+
+
+def build_nfl_measure_tables(
+    factor: str = "offense", columns: list = None, years: list = None
+) -> pd.DataFrame:
+    """
+    This function combines different NFL measure tables, such as completion, scoring, returning, and punting,
+    into a single DataFrame based on the specified factor ('offense' or 'defense').
+    Only the columns needed for the requested measures are read from the files
+    and only the requested seasons.
+
+    Parameters
+    ----------
+    factor: str, optional
+        The factor to consider, either 'offense' or 'defense'
+    columns: list, optional
+        measures to return besides year, team_id and made_playoffs,
+        all measures if None
+    years: list, optional
+        seasons to return, all seasons if None
+
+    Returns
+    -------
+    pd.DataFrame:
+        A DataFrame combining various NFL measure tables related to the specified factor.
+
+    Raises
+    ------
+    ValueError:
+        a column isn't a measure of factor
+
+    Example
+    -------
+    >>> combined_df = build_nfl_measure_tables('offense', columns=['yards_per_game'])
+    """
+    if columns is not None:
+        known = set(KEYS + [LABEL])
+        for table, cols in measures[factor].items():
+            known.update(cols)
+            known.update(ratios[factor].get(table, dict()))
+        unknown = [column for column in columns if column not in known]
+        if unknown:
+            raise ValueError(f"unknown {factor} measures: {unknown}")
+
+    frames = list()
+    first = None
+    # iterate over measure tables
+    for table, cols in measures[factor].items():
+        table_ratios = ratios[factor].get(table, dict())
+        if columns is not None:
+            table_ratios = {
+                name: ratio for name, ratio in table_ratios.items() if name in columns
+            }
+            needed = set(columns)
+            for ratio in table_ratios.values():
+                needed.update(ratio)
+            cols = [col for col in cols if col in needed]
+        df = read_table(factor=factor, table=table, columns=KEYS + cols, years=years)
+        df, first = _indexed(df, name=table, first=first)
+        if columns is not None:
+            frames.append(df[[col for col in cols if col in columns]])
+        else:
+            frames.append(df)
+        if table_ratios:
+            frames.append(_ratios(df, table_ratios))
+
+    playoff_history = read_playoff_history(columns=KEYS + [LABEL], years=years)
+    df, first = _indexed(playoff_history, name="playoff_history", first=first)
+    frames.append(df)
+
+    # inner join, rows of the (year, team_id) all tables have in order of total
+    index = frames[0].index
+    for df in frames[1:]:
+        if df.index is not index:
+            index = index.intersection(df.index, sort=False)
+    frames = [df if df.index is index else df.reindex(index) for df in frames]
+    total = pd.concat(frames, axis=1)
+    return total.reset_index()
+
+
+def _indexed(df: pd.DataFrame, name: str, first: tuple = None) -> tuple:
+    # table indexed by (year, team_id), tables with the same keys in the same
+    # order as the first table share its index instead of building their own
+    if first is not None:
+        keys, index = first
+        if len(df) == len(keys) and all(df[key].equals(keys[key]) for key in KEYS):
+            return df.drop(columns=KEYS).set_axis(index, axis=0), first
+    indexed = df.set_index(KEYS)
+    if not indexed.index.is_unique:
+        raise ValueError(f"{name} has several rows for a (year, team_id)")
+    if first is None:
+        first = (df[KEYS], indexed.index)
+    return indexed, first
+
+
+def _ratios(df: pd.DataFrame, table_ratios: dict) -> pd.DataFrame:
+    # all ratios of a table in one numpy division, float like the schema ratios
+    numerators = df[[ratio[0] for ratio in table_ratios.values()]].to_numpy(
+        dtype=np.float64, na_value=np.nan
     )
-    conversion["red_zone_conversion_pct"] = (
-        conversion["red_zone_conversion_pct"].str.rstrip("%").astype("float") / 100.0
+    denominators = df[[ratio[1] for ratio in table_ratios.values()]].to_numpy(
+        dtype=np.float64, na_value=np.nan
     )
-    total = total.merge(right=conversion, on=["year", "team_id"])
-
-    playoff_history = pd.read_excel("data/playoffs/playoff_history.xlsx")
-    playoff_history = playoff_history[
-        [
-            "year",
-            "team_id",
-            "made_playoffs",
-        ]
-    ]
-    total = total.merge(right=playoff_history, on=["year", "team_id"])
-
-    return total
+    with np.errstate(divide="ignore", invalid="ignore"):
+        values = numerators / denominators
+    return pd.DataFrame(values, index=df.index, columns=list(table_ratios))
@@ -1,7 +1,69 @@
-from scipy.stats import ttest_ind
+import numpy as np
 import pandas as pd
+from scipy import stats
 import fantasy_football.predictor.loader as loader
 
+# columns of the combined tables that are no measures
+NOT_MEASURES = ["year", "team_id", "games", loader.LABEL]
+
+
+def ttest(a: np.ndarray, b: np.ndarray) -> tuple:
+    """
+    Two sample t-test with pooled variance of every column at once,
+    like scipy.stats.ttest_ind(a, b, nan_policy="omit") per column
+    Missing and infinite values, p.e. ratios of a zero denominator,
+    are left out per column. Columns constant in both samples
+    have t-statistic 0 and p-value 1 if the means are equal,
+    else an infinite t-statistic and p-value 0.
+
+    Parameters
+    ----------
+    a: ndarray
+        first sample, rows x columns
+    b: ndarray
+        second sample, rows x columns
+
+    Returns
+    -------
+    ndarray:
+        t-statistic per column, nan for columns without values in a sample
+    ndarray:
+        two sided p-value per column
+    """
+    a = np.where(np.isfinite(a), a, np.nan)
+    b = np.where(np.isfinite(b), b, np.nan)
+    n_a = np.sum(~np.isnan(a), axis=0)
+    n_b = np.sum(~np.isnan(b), axis=0)
+    dof = n_a + n_b - 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_a = np.nansum(a, axis=0) / n_a
+        mean_b = np.nansum(b, axis=0) / n_b
+        ss_a = np.nansum((a - mean_a) ** 2, axis=0)
+        ss_b = np.nansum((b - mean_b) ** 2, axis=0)
+        se = np.sqrt((ss_a + ss_b) / dof * (1 / n_a + 1 / n_b))
+        diff = mean_a - mean_b
+        t = diff / se
+    # constant samples, compared by value as their rounded means may differ
+    high_a = np.fmax.reduce(a, axis=0, initial=-np.inf)
+    high_b = np.fmax.reduce(b, axis=0, initial=-np.inf)
+    constant = (high_a == np.fmin.reduce(a, axis=0, initial=np.inf)) & (
+        high_b == np.fmin.reduce(b, axis=0, initial=np.inf)
+    )
+    with np.errstate(invalid="ignore"):
+        t = np.where(
+            constant,
+            np.where(high_a == high_b, 0.0, np.sign(high_a - high_b) * np.inf),
+            t,
+        )
+    t = np.where((n_a < 1) | (n_b < 1) | (dof < 1), np.nan, t)
+    p = 2 * stats.t.sf(np.abs(t), np.maximum(dof, 1))
+    return t, np.where(np.isnan(t), np.nan, p)
+
+
+def _measures(df: pd.DataFrame) -> pd.DataFrame:
+    # measures as floats, missing values as nan
+    return df.drop(columns=NOT_MEASURES).astype("float64")
+
 
 def calculate_nfl_playoffs_significance(
     factor: str = "offense", alpha: float = 0.05
@@ -35,19 +97,87 @@ def calculate_nfl_playoffs_significance(
     >>> result_df = calculate_nfl_playoffs_significance(factor='defensive', alpha=0.05)
     """
     df = loader.combine_nfl_measure_tables(factor=factor)
-    df = df.drop(["year", "team_id", "games"], axis=1)
-    df_playoffs = df[df["made_playoffs"] == True]
-    df_playoffs = df_playoffs.drop(["made_playoffs"], axis=1)
-    df_not_playoffs = df[df["made_playoffs"] == False]
-    df_not_playoffs = df_not_playoffs.drop(["made_playoffs"], axis=1)
-    data = list()
-    for col in df_playoffs.columns:
-        col_data = list()
-        col_data.append(col)
-        t_stat, p_value = ttest_ind(df_playoffs[col], df_not_playoffs[col])
-        col_data.append(t_stat)
-        col_data.append(p_value)
-        data.append(col_data)
-    df_final = pd.DataFrame(data=data, columns=["Factor", "t-stat", "p-value"])
+    measures = _measures(df)
+    playoffs = (df[loader.LABEL] == True).to_numpy()
+    not_playoffs = (df[loader.LABEL] == False).to_numpy()
+    t_stat, p_value = ttest(
+        measures.to_numpy()[playoffs], measures.to_numpy()[not_playoffs]
+    )
+    df_final = pd.DataFrame(
+        {"Factor": measures.columns, "t-stat": t_stat, "p-value": p_value}
+    )
     df_final["Significant"] = df_final["p-value"] < alpha
     return df_final
+
+
+def significance_sweep(
+    factors: list = ("offense", "defense"),
+    alphas: list = (0.05,),
+    windows: list = None,
+) -> pd.DataFrame:
+    """
+    t-tests of all measures for many combinations of factor, significance
+    level and seasons at once. Every factor is read once, the t-statistics of
+    a season window are computed for all measures in one array operation and
+    shared by all significance levels.
+
+    Parameters
+    ----------
+    factors: list, optional
+        factors to consider, 'offense' and 'defense'
+    alphas: list, optional
+        significance levels
+    windows: list, optional
+        (first season, last season) pairs, both included,
+        all seasons of the factor if None
+
+    Returns
+    -------
+    DataFrame:
+        one row per factor, window, alpha and measure
+        factor: str
+            'offense' or 'defense'
+        first_season, last_season: int
+            seasons tested
+        alpha: float
+            significance level
+        Factor: str
+            measure
+        t-stat, p-value, Significant:
+            see calculate_nfl_playoffs_significance
+
+    Example
+    -------
+    >>> significance_sweep(alphas=[0.01, 0.05], windows=[(2003, 2012), (2013, 2022)])
+    """
+    frames = list()
+    # iterate over factors
+    for factor in factors:
+        df = loader.combine_nfl_measure_tables(factor=factor)
+        measures = _measures(df)
+        values = measures.to_numpy()
+        years = df["year"].to_numpy()
+        label = df[loader.LABEL]
+        playoffs = (label == True).to_numpy()
+        not_playoffs = (label == False).to_numpy()
+        for first, last in windows or [(years.min(), years.max())]:
+            window = (years >= first) & (years <= last)
+            t_stat, p_value = ttest(
+                values[window & playoffs], values[window & not_playoffs]
+            )
+            for alpha in alphas:
+                frames.append(
+                    pd.DataFrame(
+                        {
+                            "factor": factor,
+                            "first_season": int(first),
+                            "last_season": int(last),
+                            "alpha": alpha,
+                            "Factor": measures.columns,
+                            "t-stat": t_stat,
+                            "p-value": p_value,
+                            "Significant": p_value < alpha,
+                        }
+                    )
+                )
+    return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,410 @@
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+import pandas as pd
+import xgboost as xgb
+import fantasy_football.predictor.cache as cache
+import fantasy_football.predictor.dmatrix as dmatrix
+import fantasy_football.predictor.features as features
+import fantasy_football.predictor.xgboost_predictor as xgboost_predictor
+
+# search space, parameter -> (distribution, low, high)
+# log: log uniform float, uniform: uniform float, int: uniform integer
+SPACE = {
+    "eta": ("log", 0.01, 0.3),
+    "max_depth": ("int", 2, 8),
+    "min_child_weight": ("log", 0.5, 10.0),
+    "subsample": ("uniform", 0.5, 1.0),
+    "colsample_bytree": ("uniform", 0.5, 1.0),
+    "lambda": ("log", 0.1, 10.0),
+    "gamma": ("uniform", 0.0, 5.0),
+}
+
+# number of season grouped cross validation folds
+FOLDS = 5
+
+# boosting rounds without improvement of the validation log loss before a fit stops
+EARLY_STOPPING = 20
+
+# boosting rounds of a fit at most
+MAX_ROUNDS = 1000
+
+# seed of every fit, trials differ by their parameters only
+SEED = 0
+
+# fold matrices of a worker process, set once by _init_worker
+_folds = None
+_threads = 1
+
+
+def sample(space: dict, rng: np.random.Generator) -> dict:
+    """
+    Draw one parameter set from a search space
+
+    Parameters
+    ----------
+    space: dict
+        parameter -> (distribution, low, high), see SPACE
+    rng: Generator
+        random number generator
+
+    Returns
+    -------
+    dict:
+        parameter -> value
+    """
+    params = dict()
+    for name, (distribution, low, high) in space.items():
+        if distribution == "int":
+            params[name] = int(rng.integers(low, high + 1))
+        elif distribution == "log":
+            params[name] = float(np.exp(rng.uniform(np.log(low), np.log(high))))
+        elif distribution == "uniform":
+            params[name] = float(rng.uniform(low, high))
+        else:
+            raise ValueError(f"unknown distribution {distribution} of {name}")
+    return params
+
+
+def season_folds(years: np.ndarray, n_folds: int = FOLDS) -> list:
+    """
+    Cross validation folds keeping the team seasons of a season together,
+    consecutive seasons are validated together
+
+    Parameters
+    ----------
+    years: ndarray
+        season of every row
+    n_folds: int, optional
+        number of folds, at most the number of seasons
+
+    Returns
+    -------
+    list:
+        (train rows, validation rows) per fold
+    """
+    seasons = np.unique(years)
+    folds = list()
+    for block in np.array_split(seasons, min(n_folds, len(seasons))):
+        valid = np.isin(years, block)
+        folds.append((np.flatnonzero(~valid), np.flatnonzero(valid)))
+    return folds
+
+
+class TrialCache:
+    """
+    Results of finished trials on disk, one json file per trial
+    A trial is identified by its parameters, boosting rounds, folds and
+    the fingerprint of the training data, so repeated or interrupted
+    searches read finished trials instead of fitting them again.
+
+    Parameters
+    ----------
+    directory: str, optional
+        directory of the trial files, None to keep no results
+    """
+
+    def __init__(self, directory: str = ".cache/tuning") -> None:
+        self.directory = directory
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def key(self, params: dict, rounds: int, data: str) -> str:
+        """
+        Parameters
+        ----------
+        params: dict
+            parameters of trial
+        rounds: int
+            boosting rounds of trial at most
+        data: str
+            fingerprint of the training data and folds
+
+        Returns
+        -------
+        str:
+            key of trial
+        """
+        return cache.digest([sorted(params.items()), rounds, EARLY_STOPPING, data])
+
+    def get(self, key: str) -> dict:
+        """
+        Result of trial, None if it isn't finished
+        """
+        if not self.directory:
+            return None
+        try:
+            with open(os.path.join(self.directory, f"{key}.json")) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, result: dict) -> None:
+        """
+        Store result of trial
+        """
+        if not self.directory:
+            return
+        path = os.path.join(self.directory, f"{key}.json")
+        with open(path + ".tmp", "w") as file:
+            json.dump(result, file, indent=1, sort_keys=True)
+        os.replace(path + ".tmp", path)
+
+
+def _fold_matrices(path: str, folds: list) -> list:
+    # slices of the saved training matrix, binned by their first fit
+    matrix = dmatrix.load(path)
+    return [(matrix.slice(train), matrix.slice(valid)) for train, valid in folds]
+
+
+def _init_worker(path: str, folds: list, threads: int) -> None:
+    global _folds, _threads
+    _folds, _threads = _fold_matrices(path, folds), threads
+
+
+def _trial(folds: list, params: dict, rounds: int, threads: int) -> dict:
+    # mean best validation log loss over the folds, fits stop early
+    scores = list()
+    iterations = list()
+    for train, valid in folds:
+        booster = xgb.train(
+            {
+                **xgboost_predictor.PARAMS,
+                **params,
+                "eval_metric": "logloss",
+                "nthread": threads,
+                "seed": SEED,
+            },
+            train,
+            num_boost_round=rounds,
+            evals=[(valid, "valid")],
+            early_stopping_rounds=EARLY_STOPPING,
+            verbose_eval=False,
+        )
+        scores.append(booster.best_score)
+        iterations.append(booster.best_iteration + 1)
+    return {
+        "log_loss": float(np.mean(scores)),
+        "log_loss_std": float(np.std(scores)),
+        "best_rounds": int(round(np.mean(iterations))),
+    }
+
+
+def _trial_worker(params: dict, rounds: int) -> dict:
+    return _trial(_folds, params, rounds, _threads)
+
+
+class Search:
+    """
+    Evaluation of parameter sets of the playoff classifier with season grouped
+    cross validation. Trials are fitted in parallel worker processes which
+    load the saved training matrix once, finished trials are cached on disk.
+
+    Parameters
+    ----------
+    years: list, optional
+        seasons of the training data, defaults to the seasons with known playoff teams
+    n_folds: int, optional
+        number of season grouped folds
+    max_workers: int, optional
+        number of worker processes, defaults to the cpus divided by threads
+    threads: int, optional
+        threads of xgboost per worker process
+    trial_cache: TrialCache, optional
+        cache of finished trials, defaults to TrialCache()
+    """
+
+    def __init__(
+        self,
+        years: list = None,
+        n_folds: int = FOLDS,
+        max_workers: int = None,
+        threads: int = 1,
+        trial_cache: TrialCache = None,
+    ) -> None:
+        self.years = years or features.labeled_seasons()
+        self.path = dmatrix.save(years=self.years)
+        rows = features.load_features(years=self.years, columns=["year"])["year"]
+        self.folds = season_folds(rows.to_numpy(), n_folds=n_folds)
+        self.data = cache.digest([dmatrix.fingerprint(years=self.years), n_folds])
+        self.threads = threads
+        if max_workers is None:
+            max_workers = max(1, (os.cpu_count() or 1) // threads)
+        self.max_workers = max_workers
+        self.trial_cache = trial_cache or TrialCache()
+        self._executor = None
+        self._matrices = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stop the worker processes
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def evaluate(self, candidates: list, rounds: int) -> list:
+        """
+        Cross validate parameter sets, finished trials are read from the cache
+
+        Parameters
+        ----------
+        candidates: list
+            parameter sets
+        rounds: int
+            boosting rounds of a fit at most
+
+        Returns
+        -------
+        list:
+            result dict per parameter set with the parameters, rounds,
+            log_loss, log_loss_std, best_rounds and cached
+        """
+        keys = [
+            self.trial_cache.key(params, rounds, self.data) for params in candidates
+        ]
+        results = [self.trial_cache.get(key) for key in keys]
+        todo = [i for i, result in enumerate(results) if result is None]
+        if len(todo) > 1 and self.max_workers > 1:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=_init_worker,
+                    initargs=(self.path, self.folds, self.threads),
+                )
+            futures = {
+                self._executor.submit(_trial_worker, candidates[i], rounds): i
+                for i in todo
+            }
+            # every trial is stored as soon as it is done, in order of finishing
+            for future in as_completed(futures):
+                i = futures[future]
+                results[i] = future.result()
+                self.trial_cache.put(keys[i], results[i])
+        else:
+            if todo and self._matrices is None:
+                self._matrices = _fold_matrices(self.path, self.folds)
+            for i in todo:
+                results[i] = _trial(self._matrices, candidates[i], rounds, self.threads)
+                self.trial_cache.put(keys[i], results[i])
+        return [
+            {**params, "rounds": rounds, **result, "cached": i not in todo}
+            for i, (params, result) in enumerate(zip(candidates, results))
+        ]
+
+
+def random_search(
+    trials: int = 50,
+    seed: int = 0,
+    space: dict = SPACE,
+    rounds: int = MAX_ROUNDS,
+    **kwargs,
+) -> pd.DataFrame:
+    """
+    Random search over the parameters of the playoff classifier
+
+    Parameters
+    ----------
+    trials: int, optional
+        number of parameter sets
+    seed: int, optional
+        seed of the drawn parameter sets, same seed same trials
+    space: dict, optional
+        search space, see SPACE
+    rounds: int, optional
+        boosting rounds of a fit at most, fits stop early
+    kwargs:
+        arguments of Search, p.e. max_workers
+
+    Returns
+    -------
+    DataFrame:
+        one row per trial, best first, parameters and
+        log_loss: float
+            mean validation log loss over the folds
+        log_loss_std: float
+            standard deviation of the validation log loss over the folds
+        best_rounds: int
+            mean number of boosting rounds of the best validation log loss
+        cached: bool
+            trial was read from the cache
+
+    Example
+    -------
+    >>> random_search(trials=100).head(1)
+    """
+    rng = np.random.default_rng(seed)
+    candidates = [sample(space, rng) for _ in range(trials)]
+    with Search(**kwargs) as search:
+        results = search.evaluate(candidates, rounds)
+    return pd.DataFrame(results).sort_values("log_loss", ignore_index=True)
+
+
+def successive_halving(
+    trials: int = 81,
+    seed: int = 0,
+    space: dict = SPACE,
+    min_rounds: int = 10,
+    max_rounds: int = MAX_ROUNDS,
+    factor: int = 3,
+    **kwargs,
+) -> pd.DataFrame:
+    """
+    Successive halving over the parameters of the playoff classifier
+    All parameter sets are fitted with few boosting rounds, the best
+    1 / factor of them are fitted again with factor times the rounds,
+    until one set is left or max_rounds is reached.
+
+    Parameters
+    ----------
+    trials: int, optional
+        number of parameter sets of the first rung
+    seed: int, optional
+        seed of the drawn parameter sets, same seed same trials
+    space: dict, optional
+        search space, see SPACE
+    min_rounds: int, optional
+        boosting rounds of the first rung
+    max_rounds: int, optional
+        boosting rounds of the last rung at most
+    factor: int, optional
+        reduction factor between rungs
+    kwargs:
+        arguments of Search, p.e. max_workers
+
+    Returns
+    -------
+    DataFrame:
+        one row per trial of every rung, see random_search,
+        trials of the last rung first, best first
+
+    Example
+    -------
+    >>> successive_halving(trials=81, min_rounds=10).head(1)
+    """
+    rng = np.random.default_rng(seed)
+    candidates = [sample(space, rng) for _ in range(trials)]
+    rounds = min_rounds
+    results = list()
+    with Search(**kwargs) as search:
+        # iterate over rungs
+        while True:
+            rung = search.evaluate(candidates, rounds)
+            results.extend(rung)
+            if len(candidates) <= 1 or rounds >= max_rounds:
+                break
+            best = sorted(range(len(rung)), key=lambda i: rung[i]["log_loss"])
+            keep = max(1, math.floor(len(candidates) / factor))
+            candidates = [candidates[i] for i in best[:keep]]
+            rounds = min(rounds * factor, max_rounds)
+    return pd.DataFrame(results).sort_values(
+        ["rounds", "log_loss"], ascending=[False, True], ignore_index=True
+    )
@@ -1,47 +1,169 @@
-import fantasy_football.predictor.loader as loader
+import os
+from concurrent.futures import ProcessPoolExecutor
+import fantasy_football.predictor.dmatrix as dmatrix
+import fantasy_football.predictor.features as features
 import pandas as pd
 import numpy as np
-from xgboost import XGBClassifier
-
-
-def xgboost_features():
-    df_offense = loader.combine_nfl_measure_tables(factor="offense")
-    df_offense = df_offense.add_suffix("_offense")
-    df_defense = loader.combine_nfl_measure_tables(factor="defense")
-    df_defense = df_defense.add_suffix("_defense")
-    df = df_offense.merge(
-        right=df_defense,
-        left_on=["year_offense", "team_id_offense"],
-        right_on=["year_defense", "team_id_defense"],
+import xgboost as xgb
+from scipy import stats
+
+# number of fits of the ensemble
+RUNS = 100
+
+# boosting rounds of a fit, the n_estimators default of XGBClassifier
+ROUNDS = 100
+
+# parameters of every fit, runs differ by their seed
+# and so by the rows and columns they sample
+PARAMS = {
+    "objective": "binary:logistic",
+    "tree_method": "hist",
+    "subsample": 0.8,
+    "colsample_bytree": 0.8,
+}
+
+# training matrix of a worker process, set once by _init_worker
+_matrix = None
+_threads = 1
+
+
+def _training_matrix(path: str, years: list) -> xgb.DMatrix:
+    # saved binary matrix, else quantized from the feature table
+    if path:
+        return dmatrix.load(path)
+    return dmatrix.quantize(*features.training_data(years=years))
+
+
+def _init_worker(path: str, years: list, threads: int) -> None:
+    global _matrix, _threads
+    _matrix, _threads = _training_matrix(path, years), threads
+
+
+def importances(booster: xgb.Booster) -> np.ndarray:
+    """
+    Gain importances of the features of a booster, normalized to sum 1
+    like feature_importances_ of XGBClassifier
+
+    Parameters
+    ----------
+    booster: Booster
+        fitted booster
+
+    Returns
+    -------
+    ndarray:
+        importance per feature, in order of the training matrix columns
+    """
+    score = booster.get_score(importance_type="gain")
+    values = np.array([score.get(name, 0.0) for name in booster.feature_names])
+    total = values.sum()
+    return values / total if total > 0 else values
+
+
+def _fit(matrix: xgb.DMatrix, seed: int, threads: int) -> np.ndarray:
+    # feature importances of one seeded run
+    booster = xgb.train(
+        {**PARAMS, "nthread": threads, "seed": seed}, matrix, num_boost_round=ROUNDS
     )
-    df = df[df["year_offense"] != 2023]
-    df = df.drop(
-        [
-            "points_per_game_offense",
-            "extra_points_made_offense",
-            "extra_points_attempted_offense",
-            "points_per_game_defense",
-            "total_touchdowns_defense",
-            "points_against_defense",
-            "year_offense",
-            "year_defense",
-            "team_id_offense",
-            "team_id_defense",
-            "games_offense",
-            "games_defense",
-            "made_playoffs_offense",
-        ],
-        axis=1,
+    return importances(booster)
+
+
+def _fit_worker(seed: int) -> np.ndarray:
+    return _fit(_matrix, seed, _threads)
+
+
+def summarize(runs: np.ndarray, index: pd.Index, confidence: float) -> pd.DataFrame:
+    """
+    Mean, standard deviation and confidence interval of the mean
+    of the feature importances of several runs
+
+    Parameters
+    ----------
+    runs: ndarray
+        feature importances, one row per run
+    index: Index
+        names of features
+    confidence: float
+        confidence level of the interval
+
+    Returns
+    -------
+    DataFrame:
+        see xgboost_features
+    """
+    mean = runs.mean(axis=0)
+    std = runs.std(axis=0, ddof=1) if len(runs) > 1 else np.full(len(index), np.nan)
+    half = stats.t.ppf((1 + confidence) / 2, len(runs) - 1) * std / np.sqrt(len(runs))
+    return pd.DataFrame(
+        {"mean": mean, "std": std, "ci_low": mean - half, "ci_high": mean + half},
+        index=index,
     )
-    df = df.rename(columns={"made_playoffs_defense": "made_playoffs"})
-    X = df.loc[:, df.columns != "made_playoffs"]
-    y = df["made_playoffs"]
-
-    runs = list()
-    for i in range(100):
-        model = XGBClassifier()
-        model.fit(X, y)
-        fi = model.feature_importances_
-        runs.append(fi)
-    run_mean = np.mean(np.array(runs), axis=0)
-    return pd.DataFrame(run_mean, index=df.columns[:-1])
+
+
+def xgboost_features(
+    runs: int = RUNS,
+    seed: int = 0,
+    max_workers: int = None,
+    threads: int = 1,
+    confidence: float = 0.95,
+    directory: str = dmatrix.DIRECTORY,
+) -> pd.DataFrame:
+    """
+    Feature importances of an ensemble of XGBoost classifiers
+    predicting whether a team makes the playoffs.
+    Every run has its own seed and fits on a sample of the rows and columns,
+    so the spread of the importances over the runs is measured.
+    Runs are fitted in parallel worker processes on one training matrix,
+    the features are converted and quantized once, not once per run.
+
+    Parameters
+    ----------
+    runs: int, optional
+        number of fits
+    seed: int, optional
+        seed the seeds of the runs are drawn from, same seed same result
+    max_workers: int, optional
+        number of worker processes, defaults to the cpus divided by threads
+    threads: int, optional
+        threads of xgboost per worker process
+    confidence: float, optional
+        confidence level of the interval of the mean importance
+    directory: str, optional
+        directory of the binary training matrices, later calls and the workers
+        load the matrix instead of converting the features,
+        None to build the matrix in memory
+
+    Returns
+    -------
+    DataFrame:
+        index: features
+        mean: float
+            mean importance over the runs
+        std: float
+            standard deviation of the importance over the runs
+        ci_low, ci_high: float
+            confidence interval of the mean importance
+
+    Example
+    -------
+    >>> xgboost_features(runs=100, threads=2).sort_values("mean")
+    """
+    years = features.labeled_seasons()
+    path = dmatrix.save(years=years, directory=directory) if directory else None
+    matrix = _training_matrix(path, years)
+
+    seeds = [int(s) for s in np.random.SeedSequence(seed).generate_state(runs)]
+    if max_workers is None:
+        max_workers = max(1, (os.cpu_count() or 1) // threads)
+    max_workers = min(max_workers, runs)
+    if max_workers == 1:
+        importance = [_fit(matrix, s, threads) for s in seeds]
+    else:
+        # workers load the training matrix once, it isn't sent with every run
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(path, years, threads),
+        ) as executor:
+            importance = list(executor.map(_fit_worker, seeds))
+    return summarize(np.array(importance), pd.Index(matrix.feature_names), confidence)
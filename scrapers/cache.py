@@ -0,0 +1,284 @@
+import datetime
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+
+# seconds a page stays fresh per url class, None = never expires
+DAY = 24 * 60 * 60
+TTLS = {
+    "finished_season": None,
+    "current_season": DAY,
+    "boxscore": None,
+    "recent_boxscore": DAY,
+    "other": 7 * DAY,
+}
+
+# season year in /years/2022/..., /teams/kan/2022.htm and boxscore ids
+_SEASON_URL = re.compile(r"/(?:years|teams/\w+)/(\d{4})")
+_BOXSCORE_URL = re.compile(r"/boxscores/(\d{4})(\d{2})(\d{2})")
+
+
+def current_season(today: datetime.date = None) -> int:
+    """
+    NFL season running at a date, seasons end with the super bowl in february
+
+    Parameters
+    ----------
+    today: datetime.date, optional
+        date, defaults to today
+
+    Returns
+    -------
+    int:
+        season year
+    """
+    today = today or datetime.date.today()
+    return today.year if today.month >= 3 else today.year - 1
+
+
+def url_class(website: str, today: datetime.date = None) -> str:
+    """
+    Classify website for its time to live in the cache
+
+    Parameters
+    ----------
+    website: str
+        website
+    today: datetime.date, optional
+        date, defaults to today
+
+    Returns
+    -------
+    str:
+        one of the keys of TTLS
+    """
+    today = today or datetime.date.today()
+    boxscore = _BOXSCORE_URL.search(website)
+    if boxscore:
+        played = datetime.date(*map(int, boxscore.groups()))
+        # stats corrections come in during the days after a game
+        if (today - played).days <= 3:
+            return "recent_boxscore"
+        return "boxscore"
+    season = _SEASON_URL.search(website)
+    if season:
+        if int(season.group(1)) < current_season(today):
+            return "finished_season"
+        return "current_season"
+    return "other"
+
+
+class PageCache:
+    """
+    Persistent cache of page sources keyed by url
+    Bodies are stored zlib compressed in SQLite together with their
+    fetch time. Entries expire by their url class on the day they were
+    fetched (see TTLS) and the least
+    recently used ones are evicted once the cache exceeds max_bytes.
+
+    Parameters
+    ----------
+    path: str, optional
+        SQLite file of the cache
+    max_bytes: int, optional
+        disk budget for compressed page bodies
+    ttls: dict, optional
+        url class -> seconds a page stays fresh, overrides TTLS
+    """
+
+    def __init__(
+        self,
+        path: str = ".cache/pages.sqlite",
+        max_bytes: int = 512 * 1024 * 1024,
+        ttls: dict = None,
+    ) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttls = {**TTLS, **(ttls or dict())}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connection() as con:
+            con.execute(
+                "CREATE TABLE IF NOT EXISTS pages ("
+                "url TEXT PRIMARY KEY, body BLOB NOT NULL, size INTEGER NOT NULL, "
+                "fetched_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            con.execute(
+                "CREATE INDEX IF NOT EXISTS pages_accessed ON pages (accessed_at)"
+            )
+        # running total of the compressed bodies, summed once per process
+        self._bytes = self.size()
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite connections can't be shared between threads
+        con = getattr(self._local, "con", None)
+        if con is None:
+            con = sqlite3.connect(self.path, timeout=30)
+            con.execute("PRAGMA journal_mode=WAL")
+            self._local.con = con
+        return con
+
+    def get(self, website: str) -> str:
+        """
+        Get page source of website if cached and still fresh
+
+        Parameters
+        ----------
+        website: str
+            website
+
+        Returns
+        -------
+        str:
+            page source, None if not cached or expired
+        """
+        con = self._connection()
+        row = con.execute(
+            "SELECT body, fetched_at FROM pages WHERE url = ?", (website,)
+        ).fetchone()
+        if row is None:
+            return None
+        body, fetched_at = row
+        # classified at fetch time, a page fetched while its season was running
+        # or before stat corrections of its game stays short lived
+        fetched = datetime.date.fromtimestamp(fetched_at)
+        ttl = self.ttls[url_class(website, today=fetched)]
+        now = time.time()
+        if ttl is not None and now - fetched_at > ttl:
+            return None
+        with con:
+            con.execute(
+                "UPDATE pages SET accessed_at = ? WHERE url = ?", (now, website)
+            )
+        return zlib.decompress(body).decode("utf-8")
+
+    def put(self, website: str, source: str) -> None:
+        """
+        Store page source of website, evict least recently used pages
+        while the cache is over its disk budget
+
+        Parameters
+        ----------
+        website: str
+            website
+        source: str
+            page source
+        """
+        body = zlib.compress(source.encode("utf-8"), 6)
+        now = time.time()
+        con = self._connection()
+        with self._lock, con:
+            self._bytes -= self._stored_size(con, website)
+            con.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?)",
+                (website, body, len(body), now, now),
+            )
+            self._bytes += len(body)
+            self._evict(con)
+
+    def _stored_size(self, con: sqlite3.Connection, website: str) -> int:
+        # size of the stored body of website, 0 if it isn't cached
+        row = con.execute("SELECT size FROM pages WHERE url = ?", (website,)).fetchone()
+        return row[0] if row else 0
+
+    def _evict(self, con: sqlite3.Connection) -> None:
+        if self._bytes <= self.max_bytes:
+            return
+        rows = con.execute("SELECT url, size FROM pages ORDER BY accessed_at")
+        evict = list()
+        for url, size in rows:
+            if self._bytes <= self.max_bytes:
+                break
+            evict.append((url,))
+            self._bytes -= size
+        con.executemany("DELETE FROM pages WHERE url = ?", evict)
+
+    def invalidate(self, website: str) -> None:
+        """
+        Remove website from the cache
+
+        Parameters
+        ----------
+        website: str
+            website
+        """
+        con = self._connection()
+        with self._lock, con:
+            self._bytes -= self._stored_size(con, website)
+            con.execute("DELETE FROM pages WHERE url = ?", (website,))
+
+    def size(self) -> int:
+        """
+        Returns
+        -------
+        int:
+            bytes of compressed page bodies in the cache
+        """
+        con = self._connection()
+        return con.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+
+
+# process wide cache used by scrapers.scraper.get_html
+_cache = None
+_cache_lock = threading.Lock()
+_enabled = True
+
+
+def get_cache() -> PageCache:
+    """
+    Get the process wide page cache, create it on first use
+
+    Returns
+    -------
+    PageCache:
+        shared page cache, None if caching is disabled
+    """
+    global _cache
+    if not _enabled:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = PageCache()
+        return _cache
+
+
+def configure_cache(
+    path: str = ".cache/pages.sqlite",
+    max_bytes: int = 512 * 1024 * 1024,
+    ttls: dict = None,
+) -> PageCache:
+    """
+    Replace the process wide page cache and enable caching
+
+    Parameters
+    ----------
+    path: str, optional
+        SQLite file of the cache
+    max_bytes: int, optional
+        disk budget for compressed page bodies
+    ttls: dict, optional
+        url class -> seconds a page stays fresh, overrides TTLS
+
+    Returns
+    -------
+    PageCache:
+        shared page cache
+    """
+    global _cache, _enabled
+    _cache = PageCache(path=path, max_bytes=max_bytes, ttls=ttls)
+    _enabled = True
+    return _cache
+
+
+def disable_cache() -> None:
+    """
+    Fetch every page from the website again
+    """
+    global _enabled
+    _enabled = False
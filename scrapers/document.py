@@ -0,0 +1,210 @@
+from collections import namedtuple
+from bs4 import BeautifulSoup, Comment, Tag
+
+# one table cell: its text, data-stat attribute and first href
+Cell = namedtuple("Cell", ["text", "stat", "href"])
+
+
+class Element:
+    """
+    Wrapper of a BeautifulSoup tag remembering the results of the
+    scraper helpers, so rows, cells, headers and hrefs of a tag are
+    searched only once. Everything else is passed on to the tag.
+
+    Parameters
+    ----------
+    tag: Tag
+        html element
+    """
+
+    def __init__(self, tag: Tag) -> None:
+        self.tag = tag
+        self._rows = None
+        self._cells = None
+        self._header = False
+        self._href = False
+        self._text = None
+
+    def __getattr__(self, name: str):
+        return getattr(self.tag, name)
+
+    def __getitem__(self, key: str):
+        return self.tag[key]
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __repr__(self) -> str:
+        return repr(self.tag)
+
+    def __str__(self) -> str:
+        return str(self.tag)
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = self.tag.get_text()
+        return self._text
+
+    def find(self, *args, **kwargs):
+        found = self.tag.find(*args, **kwargs)
+        return wrap(found)
+
+    def find_all(self, *args, **kwargs) -> list:
+        return [wrap(found) for found in self.tag.find_all(*args, **kwargs)]
+
+    def rows(self) -> list:
+        """
+        Returns
+        -------
+        list:
+            all tr elements of the table, each row with its cells found once
+        """
+        if self._rows is None:
+            self._rows = list()
+            for tr in self.tag.find_all("tr"):
+                row = Element(tr)
+                row._cells = list()
+                for cell in tr.find_all(["th", "td"]):
+                    if cell.name == "td":
+                        row._cells.append(Element(cell))
+                    elif row._header is False:
+                        row._header = Element(cell)
+                if row._header is False:
+                    row._header = None
+                self._rows.append(row)
+        return self._rows
+
+    def cells(self) -> list:
+        """
+        Returns
+        -------
+        list:
+            all td elements
+        """
+        if self._cells is None:
+            self._cells = [Element(td) for td in self.tag.find_all("td")]
+        return self._cells
+
+    def header(self):
+        """
+        Returns
+        -------
+        Element:
+            first th element, None if there is none
+        """
+        if self._header is False:
+            self._header = wrap(self.tag.find("th"))
+        return self._header
+
+    def href(self):
+        """
+        Returns
+        -------
+        Element:
+            first element with a href, None if there is none
+        """
+        if self._href is False:
+            self._href = wrap(self.tag.find(href=True))
+        return self._href
+
+    def cell_rows(self, body: bool = True) -> list:
+        """
+        Read the rows of a table as plain values
+
+        Parameters
+        ----------
+        body: bool, optional
+            only rows inside tbody, skipping header and footer rows
+            and the header rows repeated inside tbody
+
+        Returns
+        -------
+        list:
+            list of rows, every row a list of Cell for its th and td elements
+        """
+        rows = list()
+        parents = self.tag.find_all("tbody") if body else [self.tag]
+        for parent in parents:
+            for tr in parent.find_all("tr"):
+                if body and "thead" in (tr.get("class") or list()):
+                    continue
+                row = list()
+                for cell in tr.find_all(["th", "td"]):
+                    href = cell.find(href=True)
+                    row.append(
+                        Cell(
+                            text=cell.get_text(),
+                            stat=cell.get("data-stat"),
+                            href=href["href"] if href else None,
+                        )
+                    )
+                rows.append(row)
+        return rows
+
+
+def wrap(tag):
+    """
+    Wrap tag into an Element, None and strings are returned as they are
+    """
+    if isinstance(tag, Tag) and not isinstance(tag, Element):
+        return Element(tag)
+    return tag
+
+
+class Document(Element):
+    """
+    Parsed page with an index of all elements by id
+    The index is built in one pass over the page and includes elements
+    inside html comments, where pro football reference ships most tables.
+
+    Parameters
+    ----------
+    html: BeautifulSoup
+        parsed page
+    """
+
+    def __init__(self, html: BeautifulSoup) -> None:
+        super().__init__(html)
+        self._index = None
+
+    def _build_index(self) -> dict:
+        index = dict()
+        comments = list()
+        for node in self.tag.descendants:
+            if isinstance(node, Tag):
+                id = node.get("id")
+                if id and id not in index:
+                    index[id] = Element(node)
+            elif isinstance(node, Comment) and 'id="' in node:
+                comments.append(node)
+        # parse all commented markup at once instead of one tree per comment
+        if comments:
+            commented = BeautifulSoup("".join(comments), "lxml")
+            for node in commented.find_all(id=True):
+                if node["id"] not in index:
+                    index[node["id"]] = Element(node)
+        return index
+
+    def by_id(self, id: str, name: str = None):
+        """
+        Get element by id
+
+        Parameters
+        ----------
+        id: str
+            id of element
+        name: str, optional
+            tag name the element must have, p.e. 'table'
+
+        Returns
+        -------
+        Element:
+            element, None if there is no such element
+        """
+        if self._index is None:
+            self._index = self._build_index()
+        element = self._index.get(id)
+        if element is None or (name and element.name != name):
+            return None
+        return element
@@ -0,0 +1,326 @@
+import atexit
+import queue
+import threading
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, WebDriverException
+import fantasy_football.scrapers.errors as errors
+
+# true once the page finished loading or every element id is in the page and
+# closed, an element is closed once the parser added a node after its end tag,
+# the finished loading only counts if the second argument is true
+# ids inside html comments count as pro football reference ships tables there,
+# comment nodes are only added once the parser reached their end
+_READY_SCRIPT = r"""
+const ids = arguments[0];
+const complete = arguments[1] && document.readyState === "complete";
+if (ids.length === 0) {
+    return complete;
+}
+const closed = (node) => {
+    for (; node !== null; node = node.parentNode) {
+        if (node.nextSibling !== null) {
+            return true;
+        }
+    }
+    return false;
+};
+let comments = null;
+const commented = (id) => {
+    if (comments === null) {
+        comments = [];
+        const walker = document.createTreeWalker(document, NodeFilter.SHOW_COMMENT);
+        while (walker.nextNode()) {
+            comments.push(walker.currentNode.data);
+        }
+    }
+    const attribute = new RegExp("\\sid\\s*=\\s*([\"'])" + id + "\\1");
+    return comments.some((text) => attribute.test(text));
+};
+return ids.every((id) => {
+    const element = document.getElementById(id);
+    if (element !== null) {
+        return complete || closed(element);
+    }
+    return commented(id);
+});
+"""
+
+
+def missing_ids(driver: webdriver.Chrome, wait_for: list) -> list:
+    """
+    Element ids that are not yet in the page loaded by driver,
+    or whose element is still being streamed
+
+    Parameters
+    ----------
+    driver: webdriver.Chrome
+        webdriver
+    wait_for: list
+        ids of elements
+
+    Returns
+    -------
+    list:
+        ids not found
+    """
+    # a stopped page may be complete with half its elements
+    return [
+        id for id in wait_for if not driver.execute_script(_READY_SCRIPT, [id], False)
+    ]
+
+
+def create_driver() -> webdriver.Chrome:
+    """
+    Start a new headless Chrome instance
+
+    Returns
+    -------
+    webdriver.Chrome:
+        webdriver
+    """
+    # options for selenium - don't show window and don't log information
+    options = Options()
+    options.add_argument("--headless")
+    options.add_argument("--log-level=3")
+    # don't block in get, navigate waits for readiness itself
+    options.page_load_strategy = "none"
+    return webdriver.Chrome(options=options)
+
+
+class DriverPool:
+    """
+    Pool of warm headless Chrome instances
+
+    Drivers are started lazily up to `size`, handed out with `acquire`
+    and given back with `release`. A driver is quit and replaced once it
+    served `max_pages` pages or when navigation crashed.
+
+    Parameters
+    ----------
+    size: int, optional
+        maximum number of Chrome instances alive at the same time
+    max_pages: int, optional
+        number of pages after which a driver is recycled
+    """
+
+    def __init__(self, size: int = 2, max_pages: int = 50) -> None:
+        self.size = size
+        self.max_pages = max_pages
+        self._idle = queue.LifoQueue()
+        self._pages = dict()
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def acquire(self) -> webdriver.Chrome:
+        """
+        Take a driver out of the pool, starting a new one if none is idle
+        Blocks while `size` drivers are in use
+
+        Returns
+        -------
+        webdriver.Chrome:
+            webdriver
+        """
+        if self._closed:
+            raise RuntimeError("driver pool is closed")
+        self._slots.acquire()
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            driver = create_driver()
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._pages[driver] = 0
+        return driver
+
+    def release(self, driver: webdriver.Chrome, crashed: bool = False) -> None:
+        """
+        Give a driver back to the pool
+        Crashed or worn out drivers are quit instead of reused
+
+        Parameters
+        ----------
+        driver: webdriver.Chrome
+            webdriver taken from acquire
+        crashed: bool, optional
+            driver raised an error and must not be reused
+        """
+        with self._lock:
+            pages = self._pages.get(driver, 0)
+        if crashed or self._closed or pages >= self.max_pages:
+            self._discard(driver)
+        else:
+            self._idle.put(driver)
+        self._slots.release()
+
+    def navigate(
+        self,
+        driver: webdriver.Chrome,
+        website: str,
+        load_timeout: int = 3,
+        wait_for: list = None,
+    ) -> None:
+        """
+        Load website in driver and return as soon as it is ready:
+        all elements in wait_for exist, or without wait_for the page finished loading
+        loading is stopped after load_timeout seconds
+
+        Parameters
+        ----------
+        driver: webdriver.Chrome
+            webdriver taken from acquire
+        website: str
+            website to load data from
+        load_timeout: int, optional
+            timeout after which loading of website stops
+        wait_for: list, optional
+            ids of elements the caller needs
+
+        Raises
+        ------
+        PageTruncatedError:
+            elements in wait_for are missing after load_timeout
+        """
+        wait_for = list(wait_for or list())
+        with self._lock:
+            self._pages[driver] = self._pages.get(driver, 0) + 1
+        driver.get(website)
+        try:
+            WebDriverWait(driver, load_timeout, poll_frequency=0.1).until(
+                lambda d: d.execute_script(_READY_SCRIPT, wait_for, True)
+            )
+        except TimeoutException:
+            driver.execute_script("window.stop();")
+            missing = missing_ids(driver, wait_for)
+            if missing:
+                raise errors.PageTruncatedError(website, missing)
+
+    def open(
+        self, website: str, load_timeout: int = 3, wait_for: list = None
+    ) -> webdriver.Chrome:
+        """
+        Acquire a driver and load website in it
+        a crashed driver is replaced by a fresh one and loading is tried once more
+
+        Parameters
+        ----------
+        website: str
+            website to load data from
+        load_timeout: int, optional
+            timeout after which loading of website stops
+        wait_for: list, optional
+            ids of elements the caller needs
+
+        Returns
+        -------
+        webdriver.Chrome:
+            webdriver, give it back with release
+        """
+        for attempt in range(2):
+            driver = self.acquire()
+            # unexpected errors, interrupts included, discard the driver
+            outcome = "crashed"
+            try:
+                self.navigate(
+                    driver,
+                    website=website,
+                    load_timeout=load_timeout,
+                    wait_for=wait_for,
+                )
+                outcome = "loaded"
+                return driver
+            except errors.PageTruncatedError:
+                outcome = "truncated"
+                raise
+            except WebDriverException:
+                if attempt == 1:
+                    raise
+            finally:
+                # the slot is given back unless the caller got the driver
+                if outcome != "loaded":
+                    self.release(driver, crashed=outcome == "crashed")
+
+    def close(self) -> None:
+        """
+        Quit all drivers started by the pool and refuse new requests
+        """
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+        with self._lock:
+            drivers = list(self._pages)
+        for driver in drivers:
+            self._discard(driver)
+
+    def _discard(self, driver: webdriver.Chrome) -> None:
+        with self._lock:
+            self._pages.pop(driver, None)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+
+# process wide pool used by scrapers.scraper
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> DriverPool:
+    """
+    Get the process wide driver pool, create it on first use
+
+    Returns
+    -------
+    DriverPool:
+        shared driver pool
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool._closed:
+            _pool = DriverPool()
+        return _pool
+
+
+def configure_pool(size: int = 2, max_pages: int = 50) -> DriverPool:
+    """
+    Replace the process wide driver pool, quitting the drivers of the old one
+
+    Parameters
+    ----------
+    size: int, optional
+        maximum number of Chrome instances alive at the same time
+    max_pages: int, optional
+        number of pages after which a driver is recycled
+
+    Returns
+    -------
+    DriverPool:
+        shared driver pool
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+        _pool = DriverPool(size=size, max_pages=max_pages)
+        return _pool
+
+
+@atexit.register
+def shutdown_pool() -> None:
+    """
+    Quit every driver of the process wide pool
+    """
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
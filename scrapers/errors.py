@@ -0,0 +1,56 @@
+class ScraperError(Exception):
+    """
+    Base class of errors raised while scraping a website
+    """
+
+
+class ThrottledError(ScraperError):
+    """
+    Website refused the request because of too many requests (HTTP 429)
+
+    Parameters
+    ----------
+    website: str
+        website that was requested
+    retry_after: float, optional
+        seconds the website asked to wait
+    """
+
+    def __init__(self, website: str, retry_after: float = None) -> None:
+        super().__init__(f"throttled by {website}, retry after {retry_after}s")
+        self.website = website
+        self.retry_after = retry_after
+
+
+class FetchTimeoutError(ScraperError, TimeoutError):
+    """
+    Website did not answer within the load timeout
+
+    Parameters
+    ----------
+    website: str
+        website that was requested
+    """
+
+    def __init__(self, website: str) -> None:
+        super().__init__(f"timeout loading {website}")
+        self.website = website
+
+
+class PageTruncatedError(ScraperError):
+    """
+    Page was loaded without elements the caller waits for,
+    p.e. because loading stopped early or the website sent an error page
+
+    Parameters
+    ----------
+    website: str
+        website that was requested
+    missing: list
+        ids of elements not found on the page
+    """
+
+    def __init__(self, website: str, missing: list) -> None:
+        super().__init__(f"{website} is missing {', '.join(missing)}")
+        self.website = website
+        self.missing = missing
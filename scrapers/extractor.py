@@ -0,0 +1,131 @@
+import pandas as pd
+import fantasy_football.scrapers.document as document
+import fantasy_football.utils.schema as schema
+
+
+def team_id(cell: document.Cell) -> str:
+    """
+    Team id from the link of a team cell, p.e. /teams/kan/2022.htm -> KAN
+
+    Parameters
+    ----------
+    cell: Cell
+        table cell
+
+    Returns
+    -------
+    str:
+        team id, None if the cell has no team link
+    """
+    if cell.href and cell.href[:6] == "/teams":
+        return cell.href[7:10].upper()
+    return None
+
+
+def extract(
+    rows: list,
+    columns: list,
+    table_schema: schema.Schema,
+    constants: dict = None,
+    converters: dict = None,
+    derived: dict = None,
+    min_cells: int = 1,
+) -> pd.DataFrame:
+    """
+    Turn table rows into a typed DataFrame
+    The first full row maps pro football reference data-stat attributes to the
+    column names, later rows are placed by their data-stat so missing or
+    reordered cells don't shift columns. Cells without data-stat, and all cells
+    of a table without a full row, are placed by position.
+    Every column is converted once to its schema dtype.
+
+    Parameters
+    ----------
+    rows: list
+        rows of Cell, see scraper.find_table_rows
+    columns: list
+        column name of every cell of a full row, None to skip a cell
+    table_schema: Schema
+        columns of the DataFrame in order with their dtypes
+    constants: dict, optional
+        column -> value shared by all rows, p.e. {"year": 2022}
+    converters: dict, optional
+        column -> function(Cell) used instead of the cell text
+    derived: dict, optional
+        column -> function(index, row) for columns not read from a single cell,
+        index is the position of the row in rows
+    min_cells: int, optional
+        rows with fewer cells are skipped, p.e. header rows
+
+    Returns
+    -------
+    DataFrame:
+        one row per table row with at least min_cells cells
+    """
+    constants = constants or dict()
+    converters = converters or dict()
+    derived = derived or dict()
+
+    # data-stat -> column from the first full row
+    stats = dict()
+    for row in rows:
+        if len(row) >= len(columns):
+            stats = {
+                cell.stat: column
+                for cell, column in zip(row, columns)
+                if cell.stat and column
+            }
+            break
+    # without a full row data-stats can't be mapped, cells are placed by position
+    by_position = not stats
+
+    headers = table_schema.names
+    data = {header: list() for header in headers}
+    for index, row in enumerate(rows):
+        if len(row) < min_cells:
+            continue
+        values = dict()
+        for position, cell in enumerate(row):
+            if cell.stat in stats:
+                column = stats[cell.stat]
+            elif (by_position or cell.stat is None) and position < len(columns):
+                column = columns[position]
+            else:
+                continue
+            if column is None or column in values:
+                continue
+            converter = converters.get(column)
+            values[column] = converter(cell) if converter else cell.text
+        for column, function in derived.items():
+            values[column] = function(index, row)
+        values.update(constants)
+        for header in headers:
+            data[header].append(values.get(header))
+
+    df = pd.DataFrame(
+        {header: pd.Series(data[header], dtype=object) for header in headers}
+    )
+    return table_schema.coerce(df)
+
+
+def concat(frames: list, table_schema: schema.Schema) -> pd.DataFrame:
+    """
+    Concatenate typed DataFrames, columns keep their schema dtype
+    even if categories differ between the frames
+
+    Parameters
+    ----------
+    frames: list
+        list of DataFrames
+    table_schema: Schema
+        columns of the DataFrame in order with their dtypes
+
+    Returns
+    -------
+    DataFrame:
+        all rows of frames
+    """
+    if not frames:
+        frames = [pd.DataFrame(columns=table_schema.names)]
+    df = pd.concat(frames, ignore_index=True)
+    return table_schema.coerce(df[table_schema.names])
@@ -0,0 +1,198 @@
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+import fantasy_football.scrapers.driver_pool as driver_pool
+import fantasy_football.scrapers.errors as errors
+import fantasy_football.scrapers.rate_limiter as rate_limiter
+
+# browser like user agent, pro-football-reference rejects the requests default
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+)
+
+
+class HttpFetcher:
+    """
+    Fetch server rendered pages with a plain HTTP client
+    All threads share one session, its keep-alive connections
+    are pooled per host
+
+    Parameters
+    ----------
+    pool_maxsize: int, optional
+        number of keep-alive connections kept per host, defaults to the
+        highest number of requests in flight, see rate_limiter.max_concurrency
+    """
+
+    def __init__(self, pool_maxsize: int = None) -> None:
+        self.pool_maxsize = pool_maxsize
+        self._shared = None
+        self._lock = threading.Lock()
+
+    def _session(self) -> requests.Session:
+        # connection pools are thread safe, one connection per thread in flight
+        with self._lock:
+            if self._shared is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_maxsize=self.pool_maxsize or rate_limiter.max_concurrency(),
+                    max_retries=0,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update({"User-Agent": USER_AGENT})
+                self._shared = session
+            return self._shared
+
+    def fetch(self, website: str, load_timeout: int = 3, wait_for: list = None) -> str:
+        """
+        Download page source of website
+        the server sends the complete page, wait_for is checked by the caller
+
+        Parameters
+        ----------
+        website: str
+            website to load data from
+        load_timeout: int, optional
+            seconds to wait for the server to answer
+        wait_for: list, optional
+            ids of elements the caller needs
+
+        Returns
+        -------
+        str:
+            page source
+        """
+        try:
+            response = self._session().get(website, timeout=load_timeout)
+        except requests.Timeout as e:
+            raise errors.FetchTimeoutError(website) from e
+        if response.status_code == 429:
+            retry_after = response.headers.get("Retry-After")
+            raise errors.ThrottledError(
+                website,
+                retry_after=(
+                    float(retry_after)
+                    if retry_after and retry_after.isdigit()
+                    else None
+                ),
+            )
+        response.raise_for_status()
+        return response.text
+
+
+class SeleniumFetcher:
+    """
+    Fetch pages by rendering them in a pooled headless Chrome
+    Only needed for pages that build their content with JavaScript
+    """
+
+    def fetch(self, website: str, load_timeout: int = 3, wait_for: list = None) -> str:
+        """
+        Render website and return its page source
+        as soon as the elements in wait_for exist
+
+        Parameters
+        ----------
+        website: str
+            website to load data from
+        load_timeout: int, optional
+            timeout after which loading of website stops
+        wait_for: list, optional
+            ids of elements the caller needs
+
+        Returns
+        -------
+        str:
+            page source
+        """
+        pool = driver_pool.get_pool()
+        driver = pool.open(
+            website=website, load_timeout=load_timeout, wait_for=wait_for
+        )
+        try:
+            return driver.page_source
+        finally:
+            pool.release(driver)
+
+
+# registered fetcher backends
+_fetchers = {"http": HttpFetcher(), "selenium": SeleniumFetcher()}
+_default = "http"
+
+
+def register_fetcher(name: str, fetcher) -> None:
+    """
+    Register a fetcher backend, any object with a
+    fetch(website, load_timeout, wait_for) -> str method
+
+    Parameters
+    ----------
+    name: str
+        name of backend
+    fetcher: object
+        fetcher backend
+    """
+    _fetchers[name] = fetcher
+
+
+def set_default_fetcher(name: str) -> None:
+    """
+    Select the backend used for pages that don't need JavaScript
+
+    Parameters
+    ----------
+    name: str
+        name of a registered backend, p.e. 'http' or 'selenium'
+    """
+    global _default
+    if name not in _fetchers:
+        raise ValueError(f"unknown fetcher: {name}")
+    _default = name
+
+
+def get_fetcher(needs_js: bool = False):
+    """
+    Get fetcher backend for a page
+
+    Parameters
+    ----------
+    needs_js: bool, optional
+        page has to be rendered by a browser
+
+    Returns
+    -------
+    object:
+        fetcher backend
+    """
+    if needs_js:
+        return _fetchers["selenium"]
+    return _fetchers[_default]
+
+
+def fetch(
+    website: str, load_timeout: int = 3, needs_js: bool = False, wait_for: list = None
+) -> str:
+    """
+    Download page source of website with the matching backend
+
+    Parameters
+    ----------
+    website: str
+        website to load data from
+    load_timeout: int, optional
+        timeout after which loading of website stops
+    needs_js: bool, optional
+        page has to be rendered by a browser
+    wait_for: list, optional
+        ids of elements the caller needs
+
+    Returns
+    -------
+    str:
+        page source
+    """
+    return get_fetcher(needs_js=needs_js).fetch(
+        website, load_timeout=load_timeout, wait_for=wait_for
+    )
@@ -0,0 +1,64 @@
+import pandas as pd
+
+
+def upsert(previous: pd.DataFrame, delta: pd.DataFrame, keys: list) -> pd.DataFrame:
+    """
+    Combine previously stored rows with freshly scraped ones,
+    rows of delta replace rows of previous with the same keys
+
+    Parameters
+    ----------
+    previous: DataFrame
+        previously stored rows, may be None
+    delta: DataFrame
+        freshly scraped rows
+    keys: list
+        columns identifying a row, p.e. ["year", "team_id"]
+
+    Returns
+    -------
+    DataFrame:
+        previous rows not in delta followed by delta
+    """
+    if previous is None or previous.empty:
+        return delta.reset_index(drop=True)
+    if delta.empty:
+        return previous.reset_index(drop=True)
+    replaced = pd.MultiIndex.from_frame(previous[keys].astype(str)).isin(
+        pd.MultiIndex.from_frame(delta[keys].astype(str))
+    )
+    return pd.concat([previous[~replaced], delta], ignore_index=True)
+
+
+def same_values(stored: list, scraped: list) -> bool:
+    """
+    Compare stored row values with freshly scraped text,
+    numbers are compared by value so 10, 10.0 and "10" are the same
+
+    Parameters
+    ----------
+    stored: list
+        values of previously stored row
+    scraped: list
+        values of scraped row
+
+    Returns
+    -------
+    bool:
+        rows hold the same values
+    """
+    if len(stored) != len(scraped):
+        return False
+    for a, b in zip(stored, scraped):
+        if not isinstance(a, str) and pd.isna(a):
+            a = ""
+        a = str(a).strip()
+        b = str(b).strip()
+        if a == b:
+            continue
+        try:
+            if float(a) != float(b):
+                return False
+        except ValueError:
+            return False
+    return True
@@ -0,0 +1,158 @@
+import lxml.html
+from lxml import etree
+import fantasy_football.scrapers.document as document
+
+# hrefs of the descendants of an element, compiled once
+_HREFS = etree.XPath(".//*/@href")
+
+
+def _matches(node, name, attrs: dict) -> bool:
+    if not isinstance(node.tag, str):
+        # comments and processing instructions
+        return False
+    if name is not None:
+        names = [name] if isinstance(name, str) else name
+        if node.tag not in names:
+            return False
+    for key, value in attrs.items():
+        if key == "class_":
+            if value not in (node.get("class") or "").split():
+                return False
+        elif value is True:
+            if node.get(key) is None:
+                return False
+        elif node.get(key) != value:
+            return False
+    return True
+
+
+class LxmlElement(document.Element):
+    """
+    Element of a page parsed with lxml instead of BeautifulSoup
+    Supports the subset of the BeautifulSoup interface used by the scrapers:
+    find, find_all, text and attribute access, and the scraper helpers.
+    Rows and cells are found by lxml in C, without building python objects
+    for the parts of the page that are never read.
+
+    Parameters
+    ----------
+    tag: lxml.html.HtmlElement
+        html element
+    """
+
+    def __getitem__(self, key: str):
+        value = self.tag.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default=None):
+        return self.tag.get(key, default)
+
+    @property
+    def name(self) -> str:
+        return self.tag.tag
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = self.tag.text_content()
+        return self._text
+
+    def find(self, name=None, **attrs):
+        for node in self.tag.iterdescendants():
+            if _matches(node, name, attrs):
+                return LxmlElement(node)
+        return None
+
+    def find_all(self, name=None, **attrs) -> list:
+        return [
+            LxmlElement(node)
+            for node in self.tag.iterdescendants()
+            if _matches(node, name, attrs)
+        ]
+
+    def rows(self) -> list:
+        if self._rows is None:
+            self._rows = list()
+            for tr in self.tag.iter("tr"):
+                row = LxmlElement(tr)
+                row._cells = list()
+                for cell in tr.iter("th", "td"):
+                    if cell.tag == "td":
+                        row._cells.append(LxmlElement(cell))
+                    elif row._header is False:
+                        row._header = LxmlElement(cell)
+                if row._header is False:
+                    row._header = None
+                self._rows.append(row)
+        return self._rows
+
+    def cells(self) -> list:
+        if self._cells is None:
+            self._cells = [LxmlElement(td) for td in self.tag.iterdescendants("td")]
+        return self._cells
+
+    def header(self):
+        if self._header is False:
+            self._header = self.find("th")
+        return self._header
+
+    def href(self):
+        if self._href is False:
+            self._href = self.find(href=True)
+        return self._href
+
+    def cell_rows(self, body: bool = True) -> list:
+        rows = list()
+        parents = self.tag.iter("tbody") if body else [self.tag]
+        for parent in parents:
+            for tr in parent.iter("tr"):
+                if body and "thead" in (tr.get("class") or "").split():
+                    continue
+                row = list()
+                for cell in tr.iter("th", "td"):
+                    hrefs = _HREFS(cell)
+                    row.append(
+                        document.Cell(
+                            text=cell.text_content(),
+                            stat=cell.get("data-stat"),
+                            href=hrefs[0] if hrefs else None,
+                        )
+                    )
+                rows.append(row)
+        return rows
+
+
+class LxmlDocument(LxmlElement, document.Document):
+    """
+    Page parsed with lxml with an index of all elements by id,
+    elements inside html comments included
+
+    Parameters
+    ----------
+    source: str
+        page source
+    """
+
+    def __init__(self, source: str) -> None:
+        LxmlElement.__init__(self, lxml.html.document_fromstring(source))
+        self._index = None
+
+    def _build_index(self) -> dict:
+        index = dict()
+        for node in self.tag.xpath("//*[@id]"):
+            index.setdefault(node.get("id"), LxmlElement(node))
+        comments = [
+            comment.text
+            for comment in self.tag.iter(etree.Comment)
+            if comment.text and 'id="' in comment.text
+        ]
+        # parse all commented markup at once instead of one tree per comment
+        if comments:
+            commented = lxml.html.document_fromstring(
+                f"<html><body>{''.join(comments)}</body></html>"
+            )
+            for node in commented.xpath("//*[@id]"):
+                index.setdefault(node.get("id"), LxmlElement(node))
+        return index
@@ -0,0 +1,287 @@
+import os
+import sqlite3
+import threading
+import time
+import pandas as pd
+
+PENDING = "pending"
+DONE = "done"
+FAILED = "failed"
+
+
+class CrawlManifest:
+    """
+    Record of crawl units so long scrapes can resume after a failure
+    A unit is one (scraper, year, unit) combination, p.e.
+    ("offense", 2022, "passing") or ("games", 2022, "202209080ram").
+    Every unit is pending, done or failed and done units point to the
+    checkpoint file holding their rows.
+
+    Parameters
+    ----------
+    path: str, optional
+        SQLite file of the manifest
+    output_dir: str, optional
+        directory for checkpoint files
+    """
+
+    def __init__(
+        self, path: str = ".cache/manifest.sqlite", output_dir: str = "checkpoints"
+    ) -> None:
+        self.path = path
+        self.output_dir = output_dir
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connection() as con:
+            con.execute(
+                "CREATE TABLE IF NOT EXISTS units ("
+                "scraper TEXT NOT NULL, year INTEGER NOT NULL, unit TEXT NOT NULL, "
+                "status TEXT NOT NULL, output TEXT, error TEXT, "
+                "attempts INTEGER NOT NULL DEFAULT 0, updated_at REAL NOT NULL, "
+                "PRIMARY KEY (scraper, year, unit))"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite connections can't be shared between threads
+        con = getattr(self._local, "con", None)
+        if con is None:
+            con = sqlite3.connect(self.path, timeout=30)
+            self._local.con = con
+        return con
+
+    def mark(
+        self,
+        scraper: str,
+        year: int,
+        unit: str,
+        status: str,
+        output: str = None,
+        error: str = None,
+    ) -> None:
+        """
+        Set status of a unit
+
+        Parameters
+        ----------
+        scraper: str
+            name of scraper
+        year: int
+            season year
+        unit: str
+            table id or game id
+        status: str
+            pending, done or failed
+        output: str, optional
+            checkpoint file of a done unit
+        error: str, optional
+            error of a failed unit
+        """
+        attempts = 1 if status == PENDING else 0
+        con = self._connection()
+        with self._lock, con:
+            con.execute(
+                "INSERT INTO units VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (scraper, year, unit) DO UPDATE SET "
+                "status = excluded.status, output = excluded.output, "
+                "error = excluded.error, attempts = attempts + excluded.attempts, "
+                "updated_at = excluded.updated_at",
+                (
+                    scraper,
+                    int(year),
+                    unit,
+                    status,
+                    output,
+                    error,
+                    attempts,
+                    time.time(),
+                ),
+            )
+
+    def mark_many(
+        self, scraper: str, year: int, units: list, status: str, output: str = None
+    ) -> None:
+        """
+        Set status of several units of a season sharing one checkpoint file
+
+        Parameters
+        ----------
+        scraper: str
+            name of scraper
+        year: int
+            season year
+        units: list
+            table ids or game ids
+        status: str
+            pending, done or failed
+        output: str, optional
+            checkpoint file of the done units
+        """
+        attempts = 1 if status == PENDING else 0
+        now = time.time()
+        con = self._connection()
+        with self._lock, con:
+            con.executemany(
+                "INSERT INTO units VALUES (?, ?, ?, ?, ?, NULL, ?, ?) "
+                "ON CONFLICT (scraper, year, unit) DO UPDATE SET "
+                "status = excluded.status, output = excluded.output, error = NULL, "
+                "attempts = attempts + excluded.attempts, "
+                "updated_at = excluded.updated_at",
+                [
+                    (scraper, int(year), unit, status, output, attempts, now)
+                    for unit in units
+                ],
+            )
+
+    def done(self, scraper: str, year: int) -> dict:
+        """
+        Get done units of a season whose checkpoint file still exists
+
+        Parameters
+        ----------
+        scraper: str
+            name of scraper
+        year: int
+            season year
+
+        Returns
+        -------
+        dict:
+            unit -> checkpoint file
+        """
+        rows = self._connection().execute(
+            "SELECT unit, output FROM units WHERE scraper = ? AND year = ? "
+            "AND status = ?",
+            (scraper, int(year), DONE),
+        )
+        return {
+            unit: output for unit, output in rows if output and os.path.exists(output)
+        }
+
+    def units(self, scraper: str = None, status: str = None) -> pd.DataFrame:
+        """
+        List units of the manifest
+
+        Parameters
+        ----------
+        scraper: str, optional
+            only units of this scraper
+        status: str, optional
+            only units with this status
+
+        Returns
+        -------
+        DataFrame:
+            scraper, year, unit, status, output, error, attempts, updated_at
+        """
+        query = "SELECT * FROM units WHERE 1 = 1"
+        params = list()
+        if scraper:
+            query += " AND scraper = ?"
+            params.append(scraper)
+        if status:
+            query += " AND status = ?"
+            params.append(status)
+        return pd.read_sql_query(
+            query + " ORDER BY scraper, year, unit", self._connection(), params=params
+        )
+
+    def checkpoint_path(self, scraper: str, year: int, unit: str) -> str:
+        """
+        Checkpoint file of a unit, directories are created
+
+        Parameters
+        ----------
+        scraper: str
+            name of scraper
+        year: int
+            season year
+        unit: str
+            table id, or name of a group of units
+
+        Returns
+        -------
+        str:
+            path of checkpoint file
+        """
+        directory = os.path.join(self.output_dir, scraper, str(year))
+        os.makedirs(directory, exist_ok=True)
+        return os.path.join(directory, f"{unit}.parquet")
+
+
+def write_checkpoint(df: pd.DataFrame, output: str) -> None:
+    """
+    Write rows of a unit to its checkpoint file
+
+    Parameters
+    ----------
+    df: DataFrame
+        rows of the unit
+    output: str
+        checkpoint file
+    """
+    df.to_parquet(output + ".tmp", index=False)
+    os.replace(output + ".tmp", output)
+
+
+def read_checkpoint(output: str) -> pd.DataFrame:
+    """
+    Read rows of a unit from its checkpoint file,
+    xlsx checkpoints of older manifests included
+
+    Parameters
+    ----------
+    output: str
+        checkpoint file
+
+    Returns
+    -------
+    DataFrame:
+        rows of the unit
+    """
+    if output.endswith(".xlsx"):
+        return pd.read_excel(output)
+    return pd.read_parquet(output)
+
+
+def run_unit(
+    manifest: CrawlManifest, scraper: str, year: int, unit: str, build
+) -> pd.DataFrame:
+    """
+    Run one crawl unit, or read it back from its checkpoint if it is done
+
+    Parameters
+    ----------
+    manifest: CrawlManifest
+        crawl manifest, None to always run build
+    scraper: str
+        name of scraper
+    year: int
+        season year
+    unit: str
+        table id or other unit name
+    build: callable
+        function without arguments returning the DataFrame of the unit
+
+    Returns
+    -------
+    DataFrame:
+        rows of the unit
+    """
+    if manifest is None:
+        return build()
+    done = manifest.done(scraper=scraper, year=year)
+    if unit in done:
+        return read_checkpoint(done[unit])
+    manifest.mark(scraper, year, unit, PENDING)
+    try:
+        df = build()
+    except Exception as e:
+        manifest.mark(scraper, year, unit, FAILED, error=str(e))
+        raise
+    output = manifest.checkpoint_path(scraper, year, unit)
+    write_checkpoint(df, output)
+    manifest.mark(scraper, year, unit, DONE, output=output)
+    return df
@@ -0,0 +1,273 @@
+import threading
+import time
+from collections import deque
+import fantasy_football.scrapers.errors as errors
+
+
+class TokenBucket:
+    """
+    Token bucket limiting the request rate of the whole process
+
+    Parameters
+    ----------
+    rate: float
+        tokens added per second
+    burst: int, optional
+        maximum number of tokens in the bucket
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take one token, block until one is available
+
+        Returns
+        -------
+        float:
+            seconds waited
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if now >= self._paused_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                wait = max(
+                    self._paused_until - now, (1 - self._tokens) / self.rate, 0.01
+                )
+            time.sleep(wait)
+            waited += wait
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hand out no tokens for the next seconds, p.e. after a 429 response
+
+        Parameters
+        ----------
+        seconds: float
+            seconds to pause
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD controller for the number of requests in flight
+    The limit grows by `increase` after every `window` healthy requests
+    (average latency below latency_target and error rate below
+    error_threshold) and is multiplied by `decrease` on a throttled or
+    timed out request.
+
+    Parameters
+    ----------
+    initial: int, optional
+        limit at start
+    minimum: int, optional
+        lowest limit
+    maximum: int, optional
+        highest limit, politeness cap
+    increase: int, optional
+        additive increase of the limit
+    decrease: float, optional
+        multiplicative decrease of the limit
+    latency_target: float, optional
+        seconds of average latency still considered healthy
+    error_threshold: float, optional
+        error rate still considered healthy
+    window: int, optional
+        number of requests evaluated per step
+    """
+
+    def __init__(
+        self,
+        initial: int = 2,
+        minimum: int = 1,
+        maximum: int = 8,
+        increase: int = 1,
+        decrease: float = 0.5,
+        latency_target: float = 2.0,
+        error_threshold: float = 0.05,
+        window: int = 20,
+    ) -> None:
+        self.limit = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_target = latency_target
+        self.error_threshold = error_threshold
+        self.window = window
+        self.in_flight = 0
+        self.requests = 0
+        self.errors = 0
+        self.throttled = 0
+        self._recent = deque(maxlen=window)
+        self._since_change = 0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        """
+        Take a request slot, block while the limit is reached
+        """
+        with self._condition:
+            while self.in_flight >= self.limit:
+                self._condition.wait()
+            self.in_flight += 1
+
+    def release(self, latency: float = None, error: bool = False, throttled=False):
+        """
+        Give a request slot back and adapt the limit
+
+        Parameters
+        ----------
+        latency: float, optional
+            seconds the request took
+        error: bool, optional
+            request failed
+        throttled: bool, optional
+            request was throttled or timed out
+        """
+        with self._condition:
+            self.in_flight -= 1
+            self.requests += 1
+            self.errors += error or throttled
+            self.throttled += throttled
+            self._recent.append((latency or 0.0, error or throttled))
+            self._since_change += 1
+            if throttled:
+                self.limit = max(self.minimum, int(self.limit * self.decrease))
+                self._since_change = 0
+            elif self._since_change >= self.window:
+                latencies = [latency for latency, _ in self._recent]
+                error_rate = sum(failed for _, failed in self._recent) / len(
+                    self._recent
+                )
+                healthy = (
+                    sum(latencies) / len(latencies) < self.latency_target
+                    and error_rate < self.error_threshold
+                )
+                if healthy:
+                    self.limit = min(self.maximum, self.limit + self.increase)
+                self._since_change = 0
+            self._condition.notify_all()
+
+    def metrics(self) -> dict:
+        """
+        Returns
+        -------
+        dict:
+            current limit, requests in flight and request counters
+        """
+        with self._condition:
+            latencies = [latency for latency, _ in self._recent]
+            return {
+                "limit": self.limit,
+                "in_flight": self.in_flight,
+                "requests": self.requests,
+                "errors": self.errors,
+                "throttled": self.throttled,
+                "avg_latency": sum(latencies) / len(latencies) if latencies else None,
+            }
+
+
+# process wide limiter used by scrapers.scraper.get_html
+# pro-football-reference blocks clients making more than 20 requests a minute
+_bucket = TokenBucket(rate=20 / 60, burst=1)
+_concurrency = AdaptiveConcurrency()
+
+
+def configure(requests_per_minute: float = 20, burst: int = 1, **concurrency) -> None:
+    """
+    Replace the process wide rate limiter and concurrency controller
+
+    Parameters
+    ----------
+    requests_per_minute: float, optional
+        request rate of the whole process
+    burst: int, optional
+        requests allowed at once after an idle period
+    **concurrency:
+        arguments of AdaptiveConcurrency
+    """
+    global _bucket, _concurrency
+    _bucket = TokenBucket(rate=requests_per_minute / 60, burst=burst)
+    _concurrency = AdaptiveConcurrency(**concurrency)
+
+
+def limited(function, *args, **kwargs):
+    """
+    Call a fetch function through the process wide rate limiter
+    and concurrency controller, throttled and timed out calls shrink
+    the concurrency limit and a 429 pauses the token bucket
+
+    Parameters
+    ----------
+    function: callable
+        function doing one request
+
+    Returns
+    -------
+    object:
+        result of function
+    """
+    concurrency = _concurrency
+    bucket = _bucket
+    concurrency.acquire()
+    start = time.monotonic()
+    outcome = {"error": True}
+    try:
+        # the slot is given back even if waiting for a token fails
+        bucket.acquire()
+        start = time.monotonic()
+        result = function(*args, **kwargs)
+        outcome = dict()
+    except errors.ThrottledError as e:
+        bucket.pause(e.retry_after or 60)
+        outcome = {"throttled": True}
+        raise
+    except errors.FetchTimeoutError:
+        outcome = {"throttled": True}
+        raise
+    finally:
+        concurrency.release(latency=time.monotonic() - start, **outcome)
+    return result
+
+
+def max_concurrency() -> int:
+    """
+    Highest number of requests the process wide concurrency controller
+    lets into flight, pools of fetching threads are sized by it and the
+    controller limits the requests in flight below it
+
+    Returns
+    -------
+    int:
+        ceiling of the concurrency limit
+    """
+    return _concurrency.maximum
+
+
+def metrics() -> dict:
+    """
+    Current limits of the process wide rate limiter and concurrency controller
+
+    Returns
+    -------
+    dict:
+        requests_per_minute, concurrency limit, requests in flight and counters
+    """
+    return {"requests_per_minute": _bucket.rate * 60, **_concurrency.metrics()}
@@ -1,13 +1,46 @@
-from bs4 import BeautifulSoup
+import re
+from bs4 import BeautifulSoup, Comment
 from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException
+import fantasy_football.scrapers.cache as cache
+import fantasy_football.scrapers.document as document
+import fantasy_football.scrapers.driver_pool as driver_pool
+import fantasy_football.scrapers.errors as errors
+import fantasy_football.scrapers.fetcher as fetcher
+import fantasy_football.scrapers.lxml_engine as lxml_engine
+import fantasy_football.scrapers.rate_limiter as rate_limiter
+
+# parsers turning a page source into a Document
+_engines = {
+    "soup": lambda source: document.Document(BeautifulSoup(source, "lxml")),
+    "lxml": lxml_engine.LxmlDocument,
+}
+_engine = "soup"
+
+
+def set_engine(engine: str) -> None:
+    """
+    Select the parser get_html uses by default, applies to every scraper
+
+    Parameters
+    ----------
+    engine: str
+        'soup' for a full BeautifulSoup tree,
+        'lxml' for a lighter lxml tree (faster, BeautifulSoup subset only)
+    """
+    global _engine
+    if engine not in _engines:
+        raise ValueError(f"unknown engine: {engine}")
+    _engine = engine
 
 
-def get_driver(website: str, load_timeout: int = 3) -> webdriver.Chrome:
+def get_driver(
+    website: str, load_timeout: int = 3, wait_for: list = None
+) -> webdriver.Chrome:
     """
-    Get Selenium driver from website
-    load for load_timeout seconds
+    Get Selenium driver from the shared driver pool and load website
+    returns as soon as all elements in wait_for exist,
+    without wait_for once the page finished loading, at most after load_timeout
+    give the driver back with release_driver once done
 
     Parameters
     ----------
@@ -15,42 +48,159 @@ def get_driver(website: str, load_timeout: int = 3) -> webdriver.Chrome:
         website to load data from
     load_timeout: int, optional
         timeout after which loading of website stops
+    wait_for: list, optional
+        ids of elements the caller needs, p.e. ["games"]
 
     Returns
     -------
     webdriver.Chrome:
         webdriver
+
+    Raises
+    ------
+    PageTruncatedError:
+        elements in wait_for are missing after load_timeout
+    """
+    return rate_limiter.limited(
+        driver_pool.get_pool().open,
+        website=website,
+        load_timeout=load_timeout,
+        wait_for=wait_for,
+    )
+
+
+def release_driver(driver: webdriver.Chrome, crashed: bool = False) -> None:
+    """
+    Give Selenium driver back to the shared driver pool
+
+    Parameters
+    ----------
+    driver: webdriver.Chrome
+        webdriver from get_driver
+    crashed: bool, optional
+        driver is broken and must not be reused
+    """
+    driver_pool.get_pool().release(driver, crashed=crashed)
+
+
+def closed(source: str, id: str) -> bool:
+    """
+    Element with id is in the page source up to its end tag,
+    a page cut off while streaming may hold half a table
+
+    Parameters
+    ----------
+    source: str
+        page source
+    id: str
+        id of element
+
+    Returns
+    -------
+    bool:
+        element and its end tag found
     """
-    # options for selenium - don't show window and don't log information
-    options = Options()
-    options.add_argument("--headless")
-    options.add_argument("--log-level=3")
+    # the id attribute itself, not data-id="x" or the like
+    attribute = re.search(rf"""\sid\s*=\s*(["']){re.escape(id)}\1""", source)
+    if attribute is None:
+        return False
+    start = attribute.start()
+    tag = re.match(r"\w+", source[source.rfind("<", 0, start) + 1 :])
+    if tag is None:
+        return False
+    # nested elements of the same tag open and close in between
+    depth = 0
+    pattern = re.compile(rf"<(/?){tag.group()}\b", re.I)
+    for match in pattern.finditer(source, start):
+        if not match.group(1):
+            depth += 1
+        elif depth == 0:
+            return True
+        else:
+            depth -= 1
+    return False
+
+
+def missing_ids(source: str, wait_for: list) -> list:
+    """
+    Element ids that are not in the page source or miss their end tag,
+    ids inside html comments count as present
+
+    Parameters
+    ----------
+    source: str
+        page source
+    wait_for: list
+        ids of elements
 
-    # selenium driver - only load for 3 seconds
-    driver = webdriver.Chrome(options=options)
-    driver.set_page_load_timeout(load_timeout)
-    try:
-        driver.get(website)
-    except TimeoutException:
-        driver.execute_script("window.stop();")
-    return driver
+    Returns
+    -------
+    list:
+        ids not found
+    """
+    return [id for id in wait_for or list() if not closed(source, id)]
 
 
-def get_html(driver: webdriver.Chrome) -> BeautifulSoup:
+def get_html(
+    website: str,
+    load_timeout: int = 3,
+    needs_js: bool = False,
+    refresh: bool = False,
+    wait_for: list = None,
+    engine: str = None,
+) -> document.Document:
     """
     import HTML of webpage into python
+    pages are served from the page cache while fresh, otherwise downloaded
+    over plain HTTP, only pages flagged with needs_js are rendered by Selenium
+    every download goes through the process wide rate limiter
 
     Parameters
     ----------
-    driver: webdriver.Chrome
-        webdriver
+    website: str
+        website to load data from
+    load_timeout: int, optional
+        timeout after which loading of website stops
+    needs_js: bool, optional
+        page has to be rendered by a browser
+    refresh: bool, optional
+        ignore the cached page and fetch it again
+    wait_for: list, optional
+        ids of elements the caller needs, p.e. ["games"]
+        a page without them is not cached and raises PageTruncatedError
+    engine: str, optional
+        parser, 'soup' or 'lxml', defaults to the one chosen with set_engine
 
     Returns
     -------
-    BeautifulSoup:
-        HTML of website
+    Document:
+        HTML of website, indexed by element id
+
+    Raises
+    ------
+    PageTruncatedError:
+        elements in wait_for are missing from the page
     """
-    return BeautifulSoup(driver.page_source, "lxml")
+    page_cache = cache.get_cache()
+    source = None
+    if page_cache is not None and not refresh:
+        source = page_cache.get(website)
+        if source is not None and missing_ids(source, wait_for):
+            source = None
+    if source is None:
+        source = rate_limiter.limited(
+            fetcher.fetch,
+            website,
+            load_timeout=load_timeout,
+            needs_js=needs_js,
+            wait_for=wait_for,
+        )
+        missing = missing_ids(source, wait_for)
+        if missing:
+            raise errors.PageTruncatedError(website, missing)
+        if page_cache is not None:
+            page_cache.put(website, source)
+    return _engines[engine or _engine](source)
 
 
 def find_div(html: BeautifulSoup, id: str = None) -> BeautifulSoup:
@@ -71,6 +221,8 @@ def find_div(html: BeautifulSoup, id: str = None) -> BeautifulSoup:
         div html
     """
     if id:
+        if isinstance(html, document.Document):
+            return html.by_id(id, name="div")
         return html.find("div", id=id)
     return html.find("div")
 
@@ -93,6 +245,8 @@ def find_span(html: BeautifulSoup, id: str = None) -> BeautifulSoup:
         span html
     """
     if id:
+        if isinstance(html, document.Document):
+            return html.by_id(id, name="span")
         return html.find("span", id=id)
     return html.find("span")
 
@@ -119,6 +273,7 @@ def find_table(html: BeautifulSoup, id: str = None) -> BeautifulSoup:
     """
     Look in the children of html element and
     find the first table that matches the given criteria
+    tables with an id are also searched in html comments
 
     Parameters
     ----------
@@ -133,10 +288,78 @@ def find_table(html: BeautifulSoup, id: str = None) -> BeautifulSoup:
         table html
     """
     if id:
-        return html.find("table", id=id)
+        return find_tables(html=html, ids=[id])[id]
     return html.find("table")
 
 
+def find_tables(html: BeautifulSoup, ids: list) -> dict:
+    """
+    Find all tables with the given ids in one pass over the html,
+    a Document answers from its id index
+    pro football reference ships most tables of a page inside html comments,
+    those comments are only parsed if they contain one of the missing ids
+
+    Parameters
+    ----------
+    html: BeautifulSoup
+        html of website
+    ids: list
+        ids of tables in html
+
+    Returns
+    -------
+    dict:
+        table id -> table html, None if table is not on the page
+    """
+    if isinstance(html, document.Document):
+        return {id: html.by_id(id, name="table") for id in ids}
+    tables = dict()
+    for table in html.find_all("table", id=True):
+        if table["id"] in ids and table["id"] not in tables:
+            tables[table["id"]] = table
+    missing = [id for id in ids if id not in tables]
+    if missing:
+        for comment in html.find_all(string=lambda text: isinstance(text, Comment)):
+            if "<table" not in comment:
+                continue
+            if not any(f'id="{id}"' in comment for id in missing):
+                continue
+            commented = BeautifulSoup(comment, "lxml")
+            for table in commented.find_all("table", id=True):
+                if table["id"] in missing and table["id"] not in tables:
+                    tables[table["id"]] = table
+            missing = [id for id in ids if id not in tables]
+            if not missing:
+                break
+    for id in missing:
+        tables[id] = None
+    return tables
+
+
+def find_table_rows(table: BeautifulSoup, body: bool = True) -> list:
+    """
+    Read the rows of a table as plain values,
+    without keeping html elements around
+
+    Parameters
+    ----------
+    table: BeautifulSoup
+        html of table
+    body: bool, optional
+        only rows inside tbody, skipping header and footer rows
+        and the header rows repeated inside tbody
+
+    Returns
+    -------
+    list:
+        list of rows, every row a list of Cell(text, stat, href)
+        for its th and td elements, stat is the data-stat attribute
+    """
+    if not isinstance(table, document.Element):
+        table = document.Element(table)
+    return table.cell_rows(body=body)
+
+
 def find_all_rows(table: BeautifulSoup) -> list:
     """
     Look in the children of table element and
@@ -152,6 +375,8 @@ def find_all_rows(table: BeautifulSoup) -> list:
     list:
         list of rows
     """
+    if isinstance(table, document.Element):
+        return table.rows()
     return table.find_all("tr")
 
 
@@ -170,6 +395,8 @@ def find_table_header(table: BeautifulSoup) -> BeautifulSoup:
     BeautifulSoup:
         html of table header
     """
+    if isinstance(table, document.Element):
+        return table.header()
     return table.find("th")
 
 
@@ -188,6 +415,8 @@ def find_all_table_cells(table: BeautifulSoup) -> list:
     list:
         list of table cells
     """
+    if isinstance(table, document.Element):
+        return table.cells()
     return table.find_all("td")
 
 
@@ -206,4 +435,6 @@ def find_href(html: BeautifulSoup) -> BeautifulSoup:
     BeautifulSoup:
         html of href
     """
+    if isinstance(html, document.Element):
+        return html.href()
     return html.find(href=True)
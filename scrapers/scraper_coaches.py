@@ -1,11 +1,88 @@
 import pandas as pd
 import fantasy_football.utils.header_mapping as header_mapping
 import fantasy_football.utils.logging as logging
+import fantasy_football.utils.storage as storage
 import fantasy_football.scrapers.scraper as scraper
+import fantasy_football.scrapers.manifest as crawl_manifest
 from typing import Tuple
 
 
-def scrape_data(years: list) -> pd.DataFrame:
+def scrape_season(year: int) -> list:
+    """
+    Scrape coach data of one season from
+    https://www.pro-football-reference.com/years/{year}/coaches.htm
+
+    Parameters
+    ----------
+    year: int
+        season year
+
+    Returns
+    -------
+    list:
+        list of rows in format of header_coaches
+    """
+    data = list()
+    # website to scrape data from
+    website = f"https://www.pro-football-reference.com/years/{year}/coaches.htm"
+
+    # import HTML of webpage into python
+    html = scraper.get_html(website=website, wait_for=["coaches"])
+
+    # get coaches table
+    table = scraper.find_table(html=html, id="coaches")
+
+    # iterate over rows (coaches)
+    coaches = scraper.find_all_rows(table=table)
+    for coach in coaches:
+        # list for coach
+        data_coach = list()
+        data_coach.append(year)
+
+        # coach name - first column (is th)
+        coach_th = scraper.find_table_header(table=coach)
+        coach_name = coach_th.text
+        href = scraper.find_href(coach_th)
+        # open coach specific website to scrape information
+        if href:
+            # coach id is his hyperlink handle
+            coach_id = href["href"][9:-4]
+            data_coach.append(coach_id)
+            data_coach.append(coach_name)
+            coach_href = (
+                f"https://www.pro-football-reference.com/coaches/{coach_id}.htm"
+            )
+            html_coach = scraper.get_html(website=coach_href, wait_for=["meta"])
+            # coach birthday and location
+            birth = scraper.find_span(html=html_coach, id="necro-birth")
+            birth = birth.text.strip()
+            birth = birth.split("in", 1)
+            birth_date = birth[0].strip()
+            if len(birth) == 2:
+                birth_loc = birth[1].strip()
+            else:
+                birth_loc = None
+            data_coach.append(birth_date)
+            data_coach.append(birth_loc)
+        stats = scraper.find_all_table_cells(coach)
+        for i, stat in enumerate(stats):
+            if i == 0:
+                href_team = scraper.find_href(stat)
+                if href_team:
+                    team_id = href_team["href"][7:10].upper()
+                else:
+                    team_id = None
+                data_coach.append(team_id)
+            else:
+                data_coach.append(stat.text)
+        if data_coach and len(data_coach) > 5:
+            data.append(data_coach)
+    return data
+
+
+def scrape_data(
+    years: list, manifest: crawl_manifest.CrawlManifest = None
+) -> pd.DataFrame:
     """
     Scrape coach data from
     https://www.pro-football-reference.com/years/{year}/coaches.htm
@@ -14,6 +91,8 @@ def scrape_data(years: list) -> pd.DataFrame:
     ----------
     years: list
         list of years to scrape data for
+    manifest: CrawlManifest, optional
+        crawl manifest, seasons done in a previous run are read from their checkpoint
 
     Returns
     -------
@@ -79,72 +158,32 @@ def scrape_data(years: list) -> pd.DataFrame:
     data = list()
     for year in years:
         logging.log(str(year))
-        # website to scrape data from
-        website = f"https://www.pro-football-reference.com/years/{year}/coaches.htm"
-
-        # selenium driver
-        driver = scraper.get_driver(website=website)
-
-        # import HTML of webpage into python
-        html = scraper.get_html(driver=driver)
-
-        # get coaches table
-        table = scraper.find_table(html=html, id="coaches")
-
-        # iterate over rows (coaches)
-        coaches = scraper.find_all_rows(table=table)
-        for coach in coaches:
-            # list for coach
-            data_coach = list()
-            data_coach.append(year)
-
-            # coach name - first column (is th)
-            coach_th = scraper.find_table_header(table=coach)
-            coach_name = coach_th.text
-            href = scraper.find_href(coach_th)
-            # open coach specific website to scrape information
-            if href:
-                # coach id is his hyperlink handle
-                coach_id = href["href"][9:-4]
-                data_coach.append(coach_id)
-                data_coach.append(coach_name)
-                coach_href = (
-                    f"https://www.pro-football-reference.com/coaches/{coach_id}.htm"
-                )
-                driver_coach = scraper.get_driver(website=coach_href)
-                html_coach = scraper.get_html(driver=driver_coach)
-                # coach birthday and location
-                birth = scraper.find_span(html=html_coach, id="necro-birth")
-                birth = birth.text.strip()
-                birth = birth.split("in", 1)
-                birth_date = birth[0].strip()
-                if len(birth) == 2:
-                    birth_loc = birth[1].strip()
-                else:
-                    birth_loc = None
-                data_coach.append(birth_date)
-                data_coach.append(birth_loc)
-                driver_coach.quit()
-            stats = scraper.find_all_table_cells(coach)
-            for i, stat in enumerate(stats):
-                if i == 0:
-                    href_team = scraper.find_href(stat)
-                    if href_team:
-                        team_id = href_team["href"][7:10].upper()
-                    else:
-                        team_id = None
-                    data_coach.append(team_id)
-                else:
-                    data_coach.append(stat.text)
-            if data_coach and len(data_coach) > 5:
-                data.append(data_coach)
-        driver.quit()
+        df_year = crawl_manifest.run_unit(
+            manifest=manifest,
+            scraper="coaches",
+            year=year,
+            unit="coaches",
+            build=lambda: pd.DataFrame(
+                data=scrape_season(year=year), columns=header_mapping.header_coaches
+            ),
+        )
+        data.extend(df_year.values.tolist())
 
     df = pd.DataFrame(data=data, columns=header_mapping.header_coaches)
+    df = header_mapping.schema_coaches.coerce(df)
+    # seasons of other runs are kept
+    storage.write_table(
+        df,
+        storage.paths["coaches"],
+        table_schema=storage.schemas["coaches"],
+        replace=False,
+    )
     return df
 
 
-def scrape_coaches(years: list) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+def scrape_coaches(
+    years: list, manifest: crawl_manifest.CrawlManifest = None
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """
     Scrape coach data from
     https://www.pro-football-reference.com/years/{year}/coaches.htm
@@ -154,6 +193,8 @@ def scrape_coaches(years: list) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFram
     ----------
     years: list
         list of years to scrape data for
+    manifest: CrawlManifest, optional
+        crawl manifest, seasons done in a previous run are read from their checkpoint
 
     Returns
     -------
@@ -219,7 +260,7 @@ def scrape_coaches(years: list) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFram
         playoff_losses_team: int
             number of playoff losses with that team
     """
-    df = scrape_data(years=years)
+    df = scrape_data(years=years, manifest=manifest)
 
     # coaches mapping table
     coaches = df.drop_duplicates(subset=["coach_id"])
@@ -1,80 +1,78 @@
 import pandas as pd
-import fantasy_football.utils.header_mapping as header_mapping
-import fantasy_football.utils.logging as logging
-import fantasy_football.scrapers.scraper as scraper
+import fantasy_football.utils.schema as schema
+import fantasy_football.utils.storage as storage
+import fantasy_football.scrapers.team_tables as team_tables
+import fantasy_football.scrapers.manifest as crawl_manifest
 from typing import Tuple
 
+# stored table of every table id of the season page, in order of scrape_defense
+TABLES = {
+    "team_stats": "total_defense",
+    "team_scoring": "scoring_defense",
+    "passing": "passing_defense",
+    "rushing": "rushing_defense",
+    "returns": "returning_defense",
+    "kicking": "kicking_defense",
+    "punting": "punting_defense",
+    "team_conversions": "conversion_defense",
+    "drives": "driving_defense",
+}
 
-def scrape_data(years: list, table_id: str, headers: list) -> pd.DataFrame:
+# page with all team defense tables of a season
+WEBSITE = "https://www.pro-football-reference.com/years/{year}/opp.htm"
+
+
+def scrape_tables(
+    years: list, tables: dict, manifest: crawl_manifest.CrawlManifest = None
+) -> dict:
     """
-    Scrape team defense data from
+    Scrape several team defense tables from
     https://www.pro-football-reference.com/years/{year}/opp.htm
+    each opponent page is fetched and parsed only once
 
     Parameters
     ----------
     years: list
         list of years to scrape data for
-    table_id: str
-        id of table to be scraped
-    headers: list
-        list of column headers for DataFrame
+    tables: dict
+        id of table to be scraped -> schema of DataFrame, see utils.header_mapping
+    manifest: CrawlManifest, optional
+        crawl manifest, tables done in a previous run are read from their checkpoint
 
     Returns
     -------
-    DataFrame
+    dict:
+        id of table -> DataFrame
     """
-    # iterate over years
-    data = list()
-    for year in years:
-        logging.log(str(year))
-        # website to scrape data from
-        website = f"https://www.pro-football-reference.com/years/{year}/opp.htm"
-
-        # selenium driver
-        driver = scraper.get_driver(website=website)
-
-        # import HTML of webpage into python
-        html = scraper.get_html(driver=driver)
-
-        # get afc and nfc table
-        table = scraper.find_table(html=html, id=table_id)
-        tbody = table.find("tbody")
+    return team_tables.scrape_tables(
+        years=years, tables=tables, website=WEBSITE, name="defense", manifest=manifest
+    )
 
-        # iterate over teams
-        standings = scraper.find_all_rows(table=tbody)
-        for team in standings:
-            # list for team
-            data_team = list()
-            data_team.append(year)
 
-            # team name - first column (is th)
-            team_th = scraper.find_table_header(table=team)
-            rank = team_th.text
-            data_team.append(rank)
-            team_stats = scraper.find_all_table_cells(team)
-            for i, stat in enumerate(team_stats):
-                if i == 0:
-                    href_team = scraper.find_href(stat)
-                    if href_team:
-                        team_id = href_team["href"][7:10].upper()
-                    else:
-                        team_id = None
-                    data_team.append(team_id)
-                else:
-                    data_team.append(stat.text)
-            if len(data_team) > 5:
-                data.append(data_team)
+def scrape_data(
+    years: list, table_id: str, table_schema: schema.Schema
+) -> pd.DataFrame:
+    """
+    Scrape team defense data from
+    https://www.pro-football-reference.com/years/{year}/opp.htm
 
-        driver.quit()
+    Parameters
+    ----------
+    years: list
+        list of years to scrape data for
+    table_id: str
+        id of table to be scraped
+    table_schema: Schema
+        columns of DataFrame with their dtypes
 
-    # write df
-    df = pd.DataFrame(data=data, columns=headers)
-    return df
+    Returns
+    -------
+    DataFrame
+    """
+    return scrape_tables(years=years, tables={table_id: table_schema})[table_id]
 
 
-def scrape_defense(
-    years: list,
-) -> Tuple[
+def scrape_defense(years: list, manifest: crawl_manifest.CrawlManifest = None) -> Tuple[
     pd.DataFrame,
     pd.DataFrame,
     pd.DataFrame,
@@ -94,6 +92,8 @@ def scrape_defense(
     ----------
     years: list
         list of years to scrape data for
+    manifest: CrawlManifest, optional
+        crawl manifest, tables done in a previous run are read from their checkpoint
 
     Returns
     -------
@@ -394,37 +394,28 @@ def scrape_defense(
         points_avg: float
             average number of points per drive
     """
-    total_defense = scrape_data(
-        years=years, table_id="team_stats", headers=header_mapping.header_defense
-    )
-    scoring_defense = scrape_data(
+    dfs = scrape_tables(
         years=years,
-        table_id="team_scoring",
-        headers=header_mapping.header_scoring_defense,
-    )
-    passing_defense = scrape_data(
-        years=years, table_id="passing", headers=header_mapping.header_passing_defense
-    )
-    rushing_defense = scrape_data(
-        years=years, table_id="rushing", headers=header_mapping.header_rushing_defense
-    )
-    returning_defense = scrape_data(
-        years=years, table_id="returns", headers=header_mapping.header_returns_defense
-    )
-    kicking_defense = scrape_data(
-        years=years, table_id="kicking", headers=header_mapping.header_kicking_defense
-    )
-    punting_defense = scrape_data(
-        years=years, table_id="punting", headers=header_mapping.header_punting_defense
-    )
-    conversion_defense = scrape_data(
-        years=years,
-        table_id="team_conversions",
-        headers=header_mapping.header_conversion_defense,
-    )
-    driving_defense = scrape_data(
-        years=years, table_id="drives", headers=header_mapping.header_drives_defense
+        manifest=manifest,
+        tables={table_id: storage.schemas[name] for table_id, name in TABLES.items()},
     )
+    # seasons of other runs are kept
+    for table_id, name in TABLES.items():
+        storage.write_table(
+            dfs[table_id],
+            storage.paths[name],
+            table_schema=storage.schemas[name],
+            replace=False,
+        )
+    total_defense = dfs["team_stats"]
+    scoring_defense = dfs["team_scoring"]
+    passing_defense = dfs["passing"]
+    rushing_defense = dfs["rushing"]
+    returning_defense = dfs["returns"]
+    kicking_defense = dfs["kicking"]
+    punting_defense = dfs["punting"]
+    conversion_defense = dfs["team_conversions"]
+    driving_defense = dfs["drives"]
     return (
         total_defense,
         scoring_defense,
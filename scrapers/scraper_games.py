@@ -1,165 +1,373 @@
+import random
+import time
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 import fantasy_football.utils.header_mapping as header_mapping
 import fantasy_football.utils.logging as logging
+import fantasy_football.utils.storage as storage
 import fantasy_football.scrapers.scraper as scraper
-from typing import Tuple
+import fantasy_football.scrapers.rate_limiter as rate_limiter
+import fantasy_football.scrapers.manifest as crawl_manifest
+import fantasy_football.scrapers.incremental as incremental
 
+# upper bound of concurrent boxscore downloads, be polite to the website
+MAX_WORKERS = 8
 
-def scrape_data(years: list) -> pd.DataFrame:
+
+def scrape_boxscore(game_id: str, refresh: bool = False) -> list:
+    """
+    Scrape boxscore data from
+    https://www.pro-football-reference.com/boxscores/{game_id}.htm
+
+    Parameters
+    ----------
+    game_id: str
+        games pro football reference id
+    refresh: bool, optional
+        ignore the cached page and fetch it again
+
+    Returns
+    -------
+    list:
+        game data in order of header_games, starting with away_team_id
+    """
+    data_game = list()
+    website_game = f"https://www.pro-football-reference.com/boxscores/{game_id}.htm"
+    html = scraper.get_html(
+        website=website_game,
+        load_timeout=4,
+        refresh=refresh,
+        wait_for=["game_info", "officials", "team_stats"],
+    )
+    score_box = html.find("div", class_="scorebox")
+    hrefs = score_box.find_all("a")
+    teams = list()
+    for h in hrefs:
+        if h["href"][:6] == "/teams":
+            teams.append(h["href"][7:10].upper())
+    away_team = teams[0]
+    home_team = teams[1]
+    data_game.append(away_team)
+    data_game.append(home_team)
+    scores = score_box.find_all("div", class_="score")
+    for score in scores:
+        data_game.append(score.text)
+    scorebox_meta = score_box.find("div", class_="scorebox_meta")
+    scorebox_divs = scorebox_meta.find_all("div")
+    game_day = None
+    date = None
+    start_time = None
+    stadium_id = None
+    attendance = None
+    time_of_game = None
+    for i, div in enumerate(scorebox_divs):
+        if i == 0:
+            s = div.text.split(" ", 1)
+            game_day = s[0].strip()
+            date = s[1].strip()
+        elif "Start Time" in div.text:
+            start_time = div.text.split(":", 1)[1].strip()
+        elif "Stadium" in div.text:
+            h = scraper.find_href(div)
+            stadium_id = h["href"][10:-4]
+        elif "Attendance" in div.text:
+            attendance = div.text.split(":", 1)[1].strip()
+        elif "Time of Game" in div.text:
+            time_of_game = div.text.split(":", 1)[1].strip()
+    data_game.append(game_day)
+    data_game.append(date)
+    data_game.append(start_time)
+    data_game.append(stadium_id)
+    data_game.append(attendance)
+    data_game.append(time_of_game)
+
+    game_info = scraper.find_table(html, id="game_info")
+    infos = scraper.find_all_rows(table=game_info)
+    won_toss = None
+    roof = None
+    vegas_line = None
+    over_under = None
+    for info in infos:
+        header = scraper.find_table_header(table=info)
+        info_value = scraper.find_all_table_cells(info)
+        if header is None or not info_value:
+            continue
+        info_label = header.text
+        if "Won Toss" in info_label:
+            won_toss = info_value[0].text.strip()
+        elif "Roof" in info_label:
+            roof = info_value[0].text.strip()
+        elif "Vegas Line" in info_label:
+            vegas_line = info_value[0].text.strip()
+        elif "Over" in info_label:
+            over_under = info_value[0].text.strip()
+    data_game.append(won_toss)
+    data_game.append(roof)
+    data_game.append(vegas_line)
+    data_game.append(over_under)
+
+    ref_info = scraper.find_table(html, id="officials")
+    infos = scraper.find_all_rows(table=ref_info)
+    referee = None
+    for info in infos:
+        header = scraper.find_table_header(table=info)
+        info_value = scraper.find_all_table_cells(info)
+        if header is None or not info_value:
+            continue
+        if "Referee" in header.text:
+            referee = info_value[0].text.strip()
+    data_game.append(referee)
+
+    team_stats = scraper.find_table(html, id="team_stats")
+    infos = scraper.find_all_rows(table=team_stats)
+    for info in infos:
+        info_value = scraper.find_all_table_cells(info)
+        for val in info_value:
+            data_game.append(val.text.strip())
+
+    # away + home + 2 scores + 6 meta + 5 info + 24 team stats
+    if len(data_game) != len(header_mapping.header_games) - 3:
+        raise ValueError(f"incomplete boxscore {game_id}: {len(data_game)} values")
+    return data_game
+
+
+def scrape_boxscore_with_retry(
+    game_id: str, max_retries: int = 3, backoff: float = 1.0
+) -> list:
+    """
+    Scrape boxscore, retry failed attempts with exponential backoff
+    retries always fetch the page again instead of using the cache
+
+    Parameters
+    ----------
+    game_id: str
+        games pro football reference id
+    max_retries: int, optional
+        number of retries after the first attempt
+    backoff: float, optional
+        seconds to wait before the first retry, doubled for every further retry
+
+    Returns
+    -------
+    list:
+        game data in order of header_games, starting with away_team_id
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return scrape_boxscore(game_id=game_id, refresh=attempt > 0)
+        except Exception as e:
+            if attempt == max_retries:
+                raise
+            wait = backoff * 2**attempt * (1 + random.random() / 2)
+            logging.log(f"{game_id} attempt {attempt + 1} failed ({e}), retry")
+            time.sleep(wait)
+
+
+def scrape_schedule(year: int, refresh: bool = False) -> list:
+    """
+    Scrape the games of a season from
+    https://www.pro-football-reference.com/years/{year}/games.htm
+
+    Parameters
+    ----------
+    year: int
+        season year
+    refresh: bool, optional
+        ignore the cached page and fetch it again
+
+    Returns
+    -------
+    list:
+        list of (year, week, game_id) of games with a boxscore
+    """
+    # website to scrape data from
+    website = f"https://www.pro-football-reference.com/years/{year}/games.htm"
+
+    # import HTML of webpage into python
+    html = scraper.get_html(website=website, refresh=refresh, wait_for=["games"])
+
+    # get games table
+    table = scraper.find_table(html=html, id="games")
+    tbody = table.find("tbody")
+
+    # iterate over games
+    schedule = list()
+    games = scraper.find_all_rows(table=tbody)
+    for game in games:
+        # week - first column (is th)
+        week = scraper.find_table_header(table=game).text
+        game_stats = scraper.find_all_table_cells(game)
+        for stat in game_stats:
+            if "boxscore" in stat.text:
+                href_game = scraper.find_href(stat)
+                game_id = href_game["href"][11:-4]
+                schedule.append((year, week, game_id))
+    return schedule
+
+
+def _season_frame(rows: list) -> pd.DataFrame:
+    # typed games of a season, raw and checkpointed rows mix text and numbers
+    return header_mapping.schema_games.coerce(
+        pd.DataFrame(data=rows, columns=header_mapping.header_games)
+    )
+
+
+def scrape_data(
+    years: list,
+    max_workers: int = None,
+    max_retries: int = 3,
+    backoff: float = 1.0,
+    manifest: crawl_manifest.CrawlManifest = None,
+    checkpoint_every: int = 25,
+    previous: pd.DataFrame = None,
+    return_failed: bool = False,
+) -> pd.DataFrame:
     """
     Scrape game data from
     https://www.pro-football-reference.com/years/{year}/games.htm
+    boxscores of a season are downloaded concurrently
 
     Parameters
     ----------
     years: list
         list of years to scrape data for
+    max_workers: int, optional
+        number of concurrent boxscore downloads, capped at MAX_WORKERS,
+        defaults to the ceiling of the adaptive concurrency of the rate limiter
+    max_retries: int, optional
+        retries per boxscore before it is recorded as failed
+    backoff: float, optional
+        seconds to wait before the first retry, doubled for every further retry
+    manifest: CrawlManifest, optional
+        crawl manifest, games done in a previous run are read from their checkpoint
+    checkpoint_every: int, optional
+        number of finished games after which the season checkpoint is written
+    previous: DataFrame, optional
+        previously stored games, only boxscores not in there are scraped
+        and the schedule is fetched again instead of read from the cache
+    return_failed: bool, optional
+        also return the failed games, they are logged and marked
+        as failed in the manifest either way
 
     Returns
     -------
-    DataFrame
+    DataFrame:
+        games in format of header_games, including previous games
+    DataFrame:
+        only if return_failed
+        year: int
+            season year
+        week: str
+            week of game
+        game_id: str
+            games pro football reference id
+        error: str
+            error of the last attempt
     """
-    # iterate over years
+    if max_workers is None:
+        # the concurrency controller limits the downloads in flight below this
+        max_workers = min(rate_limiter.max_concurrency(), MAX_WORKERS)
+    elif max_workers > MAX_WORKERS:
+        logging.log(f"max_workers {max_workers} lowered to {MAX_WORKERS}")
+        max_workers = MAX_WORKERS
+    max_workers = max(1, max_workers)
     data = list()
-    for year in years:
-        logging.log(str(year))
-        # website to scrape data from
-        website = f"https://www.pro-football-reference.com/years/{year}/games.htm"
-
-        # selenium driver
-        driver = scraper.get_driver(website=website)
-
-        # import HTML of webpage into python
-        html = scraper.get_html(driver=driver)
-
-        # get afc and nfc table
-        table = scraper.find_table(html=html, id="games")
-        tbody = table.find("tbody")
-
-        # iterate over games
-        games = scraper.find_all_rows(table=tbody)
-        for game in games:
-            # list for team
-            data_game = list()
-            data_game.append(year)
-
-            # team name - first column (is th)
-            week = scraper.find_table_header(table=game).text
-            logging.log(week)
-            data_game.append(week)
-            game_stats = scraper.find_all_table_cells(game)
-            for stat in game_stats:
-                if "boxscore" in stat.text:
-                    href_game = scraper.find_href(stat)
-                    game_id = href_game["href"][11:-4]
-                    data_game.append(game_id)
-
-                    website_game = f"https://www.pro-football-reference.com/boxscores/{game_id}.htm"
-                    got_data = False
-                    while not got_data:
-                        try:
-                            # selenium driver game
-                            driver_game = scraper.get_driver(
-                                website=website_game, load_timeout=4
-                            )
-                            html = scraper.get_html(driver=driver_game)
-                            score_box = html.find("div", class_="scorebox")
-                            hrefs = score_box.find_all("a")
-                            teams = list()
-                            for h in hrefs:
-                                if h["href"][:6] == "/teams":
-                                    teams.append(h["href"][7:10].upper())
-                            away_team = teams[0]
-                            home_team = teams[1]
-                            data_game.append(away_team)
-                            data_game.append(home_team)
-                            scores = score_box.find_all("div", class_="score")
-                            for score in scores:
-                                data_game.append(score.text)
-                            scorebox_meta = score_box.find(
-                                "div", class_="scorebox_meta"
-                            )
-                            scorebox_divs = scorebox_meta.find_all("div")
-                            for i, div in enumerate(scorebox_divs):
-                                if i == 0:
-                                    s = div.text.split(" ", 1)
-                                    game_day = s[0].strip()
-                                    date = s[1].strip()
-                                elif "Start Time" in div.text:
-                                    time = div.text.split(":", 1)[1].strip()
-                                elif "Stadium" in div.text:
-                                    h = scraper.find_href(div)
-                                    stadium_id = h["href"][10:-4]
-                                elif "Attendance" in div.text:
-                                    attendance = div.text.split(":", 1)[1].strip()
-                                elif "Time of Game" in div.text:
-                                    time_of_game = div.text.split(":", 1)[1].strip()
-                            data_game.append(game_day)
-                            data_game.append(date)
-                            data_game.append(time)
-                            data_game.append(stadium_id)
-                            data_game.append(attendance)
-                            data_game.append(time_of_game)
-
-                            game_info = scraper.find_table(html, id="game_info")
-                            infos = scraper.find_all_rows(table=game_info)
-                            for info in infos:
-                                try:
-                                    info_label = scraper.find_table_header(
-                                        table=info
-                                    ).text
-                                    info_value = scraper.find_all_table_cells(info)
-                                    if "Won Toss" in info_label:
-                                        won_toss = info_value[0].text.strip()
-                                    elif "Roof" in info_label:
-                                        roof = info_value[0].text.strip()
-                                    elif "Vegas Line" in info_label:
-                                        vegas_line = info_value[0].text.strip()
-                                    elif "Over" in info_label:
-                                        over_under = info_value[0].text.strip()
-                                except:
-                                    won_toss = None
-                            data_game.append(won_toss)
-                            data_game.append(roof),
-                            data_game.append(vegas_line)
-                            data_game.append(over_under)
-
-                            ref_info = scraper.find_table(html, id="officials")
-                            infos = scraper.find_all_rows(table=ref_info)
-                            for info in infos:
-                                try:
-                                    info_label = scraper.find_table_header(
-                                        table=info
-                                    ).text
-                                    info_value = scraper.find_all_table_cells(info)
-                                    if "Referee" in info_label:
-                                        referee = info_value[0].text.strip()
-                                except:
-                                    referee = None
-                            data_game.append(referee)
-
-                            team_stats = scraper.find_table(html, id="team_stats")
-                            infos = scraper.find_all_rows(table=team_stats)
-                            for info in infos:
-                                info_label = scraper.find_table_header(table=info).text
-                                info_value = scraper.find_all_table_cells(info)
-                                for val in info_value:
-                                    data_game.append(val.text.strip())
-                            got_data = True
-                        except:
-                            pass
-
-            if len(data_game) > 5:
-                print(data_game)
-                print(len(data_game))
-                data.append(data_game)
-            if len(data_game) == 52:
-                raise NotImplementedError()
-        driver.quit()
-        pd.DataFrame(data=data, columns=header_mapping.header_games).to_excel(
-            f"games_{year}.xlsx", index=False
-        )
+    failed = list()
+    known = set()
+    if previous is not None:
+        known = set(previous["game_id"].astype(str))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # iterate over years
+        for year in years:
+            logging.log(str(year))
+            schedule = scrape_schedule(year=year, refresh=previous is not None)
+            schedule = [game for game in schedule if game[2] not in known]
+
+            # games finished in a previous run
+            rows = dict()
+            if manifest is not None:
+                output = manifest.checkpoint_path("games", year, "games")
+                done = manifest.done(scraper="games", year=year)
+                # checkpoints of older runs may be xlsx files
+                for path in sorted(set(done.values())):
+                    checkpoint = crawl_manifest.read_checkpoint(path)
+                    for row in checkpoint.values.tolist():
+                        if row[2] in done:
+                            rows[row[2]] = row
+                logging.log(f"{year} resuming with {len(rows)} games done")
+            todo = [game for game in schedule if game[2] not in rows]
+            if manifest is not None:
+                manifest.mark_many(
+                    "games", year, [game[2] for game in todo], crawl_manifest.PENDING
+                )
+
+            futures = [
+                executor.submit(
+                    scrape_boxscore_with_retry,
+                    game_id=game_id,
+                    max_retries=max_retries,
+                    backoff=backoff,
+                )
+                for _, _, game_id in todo
+            ]
+            unsaved = list()
+            for (year, week, game_id), future in zip(todo, futures):
+                try:
+                    rows[game_id] = [year, week, game_id] + future.result()
+                    unsaved.append(game_id)
+                except Exception as e:
+                    logging.log(f"{game_id} failed permanently ({e})")
+                    failed.append([year, week, game_id, str(e)])
+                    if manifest is not None:
+                        manifest.mark(
+                            "games", year, game_id, crawl_manifest.FAILED, error=str(e)
+                        )
+                if manifest is not None and len(unsaved) >= checkpoint_every:
+                    crawl_manifest.write_checkpoint(
+                        _season_frame(list(rows.values())), output
+                    )
+                    manifest.mark_many(
+                        "games", year, unsaved, crawl_manifest.DONE, output=output
+                    )
+                    unsaved = list()
+            if manifest is not None and unsaved:
+                crawl_manifest.write_checkpoint(
+                    _season_frame(list(rows.values())), output
+                )
+                manifest.mark_many(
+                    "games", year, unsaved, crawl_manifest.DONE, output=output
+                )
+
+            logging.log(f"{year} done, rate limiter {rate_limiter.metrics()}")
+
+            # keep order of schedule
+            season = [rows[game[2]] for game in schedule if game[2] in rows]
+            data.extend(season)
+            if previous is None:
+                storage.write_table(
+                    _season_frame(season),
+                    storage.paths["games"],
+                    table_schema=header_mapping.schema_games,
+                    replace=False,
+                )
 
     # write df
     df = pd.DataFrame(data=data, columns=header_mapping.header_games)
-    return df
+    if previous is not None:
+        logging.log(f"{len(df)} new games")
+        df = incremental.upsert(previous=previous, delta=df, keys=["game_id"])
+    df = header_mapping.schema_games.coerce(df)
+    if previous is not None:
+        # seasons of the upserted table that were scraped again, others are kept
+        storage.write_table(
+            df[df["year"].isin(years)],
+            storage.paths["games"],
+            table_schema=header_mapping.schema_games,
+            replace=False,
+        )
+    if failed:
+        logging.log(f"{len(failed)} games failed")
+    if not return_failed:
+        return df
+    df_failed = pd.DataFrame(data=failed, columns=["year", "week", "game_id", "error"])
+    return df, df_failed
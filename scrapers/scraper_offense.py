@@ -1,80 +1,78 @@
 import pandas as pd
-import fantasy_football.utils.header_mapping as header_mapping
-import fantasy_football.utils.logging as logging
-import fantasy_football.scrapers.scraper as scraper
+import fantasy_football.utils.schema as schema
+import fantasy_football.utils.storage as storage
+import fantasy_football.scrapers.team_tables as team_tables
+import fantasy_football.scrapers.manifest as crawl_manifest
 from typing import Tuple
 
+# stored table of every table id of the season page, in order of scrape_offense
+TABLES = {
+    "team_stats": "total_offense",
+    "team_scoring": "scoring_offense",
+    "passing": "passing_offense",
+    "rushing": "rushing_offense",
+    "returns": "returning_offense",
+    "kicking": "kicking_offense",
+    "punting": "punting_offense",
+    "team_conversions": "conversion_offense",
+    "drives": "driving_offense",
+}
 
-def scrape_data(years: list, table_id: str, headers: list) -> pd.DataFrame:
+# page with all team offense tables of a season
+WEBSITE = "https://www.pro-football-reference.com/years/{year}/"
+
+
+def scrape_tables(
+    years: list, tables: dict, manifest: crawl_manifest.CrawlManifest = None
+) -> dict:
     """
-    Scrape team offense data from
+    Scrape several team offense tables from
     https://www.pro-football-reference.com/years/{year}/
+    each season page is fetched and parsed only once
 
     Parameters
     ----------
     years: list
         list of years to scrape data for
-    table_id: str
-        id of table to be scraped
-    headers: list
-        list of column headers for DataFrame
+    tables: dict
+        id of table to be scraped -> schema of DataFrame, see utils.header_mapping
+    manifest: CrawlManifest, optional
+        crawl manifest, tables done in a previous run are read from their checkpoint
 
     Returns
     -------
-    DataFrame
+    dict:
+        id of table -> DataFrame
     """
-    # iterate over years
-    data = list()
-    for year in years:
-        logging.log(str(year))
-        # website to scrape data from
-        website = f"https://www.pro-football-reference.com/years/{year}/"
-
-        # selenium driver
-        driver = scraper.get_driver(website=website)
-
-        # import HTML of webpage into python
-        html = scraper.get_html(driver=driver)
-
-        # get afc and nfc table
-        table = scraper.find_table(html=html, id=table_id)
-        tbody = table.find("tbody")
+    return team_tables.scrape_tables(
+        years=years, tables=tables, website=WEBSITE, name="offense", manifest=manifest
+    )
 
-        # iterate over teams
-        standings = scraper.find_all_rows(table=tbody)
-        for team in standings:
-            # list for team
-            data_team = list()
-            data_team.append(year)
 
-            # team name - first column (is th)
-            team_th = scraper.find_table_header(table=team)
-            rank = team_th.text
-            data_team.append(rank)
-            team_stats = scraper.find_all_table_cells(team)
-            for i, stat in enumerate(team_stats):
-                if i == 0:
-                    href_team = scraper.find_href(stat)
-                    if href_team:
-                        team_id = href_team["href"][7:10].upper()
-                    else:
-                        team_id = None
-                    data_team.append(team_id)
-                else:
-                    data_team.append(stat.text)
-            if len(data_team) > 5:
-                data.append(data_team)
+def scrape_data(
+    years: list, table_id: str, table_schema: schema.Schema
+) -> pd.DataFrame:
+    """
+    Scrape team offense data from
+    https://www.pro-football-reference.com/years/{year}/
 
-        driver.quit()
+    Parameters
+    ----------
+    years: list
+        list of years to scrape data for
+    table_id: str
+        id of table to be scraped
+    table_schema: Schema
+        columns of DataFrame with their dtypes
 
-    # write df
-    df = pd.DataFrame(data=data, columns=headers)
-    return df
+    Returns
+    -------
+    DataFrame
+    """
+    return scrape_tables(years=years, tables={table_id: table_schema})[table_id]
 
 
-def scrape_offense(
-    years: list,
-) -> Tuple[
+def scrape_offense(years: list, manifest: crawl_manifest.CrawlManifest = None) -> Tuple[
     pd.DataFrame,
     pd.DataFrame,
     pd.DataFrame,
@@ -94,6 +92,8 @@ def scrape_offense(
     ----------
     years: list
         list of years to scrape data for
+    manifest: CrawlManifest, optional
+        crawl manifest, tables done in a previous run are read from their checkpoint
 
     Returns
     -------
@@ -452,35 +452,28 @@ def scrape_offense(
         points_avg: float
             average number of points per drive
     """
-    total_offense = scrape_data(
-        years=years, table_id="team_stats", headers=header_mapping.header_offense
-    )
-    scoring_offense = scrape_data(
-        years=years, table_id="team_scoring", headers=header_mapping.header_scoring
-    )
-    passing_offense = scrape_data(
-        years=years, table_id="passing", headers=header_mapping.header_passing
-    )
-    rushing_offense = scrape_data(
-        years=years, table_id="rushing", headers=header_mapping.header_rushing
-    )
-    returning_offense = scrape_data(
-        years=years, table_id="returns", headers=header_mapping.header_returns
-    )
-    kicking_offense = scrape_data(
-        years=years, table_id="kicking", headers=header_mapping.header_kicking
-    )
-    punting_offense = scrape_data(
-        years=years, table_id="punting", headers=header_mapping.header_punting
-    )
-    conversion_offense = scrape_data(
+    dfs = scrape_tables(
         years=years,
-        table_id="team_conversions",
-        headers=header_mapping.header_conversion,
-    )
-    driving_offense = scrape_data(
-        years=years, table_id="drives", headers=header_mapping.header_drives
+        manifest=manifest,
+        tables={table_id: storage.schemas[name] for table_id, name in TABLES.items()},
     )
+    # seasons of other runs are kept
+    for table_id, name in TABLES.items():
+        storage.write_table(
+            dfs[table_id],
+            storage.paths[name],
+            table_schema=storage.schemas[name],
+            replace=False,
+        )
+    total_offense = dfs["team_stats"]
+    scoring_offense = dfs["team_scoring"]
+    passing_offense = dfs["passing"]
+    rushing_offense = dfs["rushing"]
+    returning_offense = dfs["returns"]
+    kicking_offense = dfs["kicking"]
+    punting_offense = dfs["punting"]
+    conversion_offense = dfs["team_conversions"]
+    driving_offense = dfs["drives"]
     return (
         total_offense,
         scoring_offense,
@@ -1,10 +1,65 @@
 import pandas as pd
 import fantasy_football.utils.header_mapping as header_mapping
 import fantasy_football.utils.logging as logging
+import fantasy_football.utils.storage as storage
 import fantasy_football.scrapers.scraper as scraper
+import fantasy_football.scrapers.extractor as extractor
+import fantasy_football.scrapers.manifest as crawl_manifest
 
 
-def scrape_data(years: list) -> pd.DataFrame:
+def scrape_season(year: int) -> pd.DataFrame:
+    """
+    Scrape playoff standings data of one season from
+    https://www.pro-football-reference.com/years/{year}/
+
+    Parameters
+    ----------
+    year: int
+        season year
+
+    Returns
+    -------
+    DataFrame:
+        rows in format of header_playoffs
+    """
+    # website to scrape data from
+    website = f"https://www.pro-football-reference.com/years/{year}/"
+
+    # import HTML of webpage into python
+    html = scraper.get_html(
+        website=website, wait_for=["afc_playoff_standings", "nfc_playoff_standings"]
+    )
+
+    # get afc and nfc table
+    afc = scraper.find_table(html=html, id="afc_playoff_standings")
+    nfc = scraper.find_table(html=html, id="nfc_playoff_standings")
+    conferences = [afc, nfc]
+
+    # iterate over conferences, teams are listed by seat
+    frames = list()
+    for conference in conferences:
+        rows = scraper.find_table_rows(table=conference)
+        frames.append(
+            extractor.extract(
+                rows=rows,
+                columns=["team_id", "wins", "losses", "ties", "position", "reason"],
+                table_schema=header_mapping.schema_playoffs,
+                constants={"year": year},
+                converters={"team_id": extractor.team_id},
+                derived={
+                    "seat": lambda index, row: index + 1,
+                    # teams in the playoffs have their seed behind the name
+                    "made_playoffs": lambda index, row: row[0].text.endswith(")"),
+                },
+                min_cells=3,
+            )
+        )
+    return extractor.concat(frames=frames, table_schema=header_mapping.schema_playoffs)
+
+
+def scrape_data(
+    years: list, manifest: crawl_manifest.CrawlManifest = None
+) -> pd.DataFrame:
     """
     Scrape playoff standings data from
     https://www.pro-football-reference.com/years/{year}/
@@ -13,6 +68,8 @@ def scrape_data(years: list) -> pd.DataFrame:
     ----------
     years: list
         list of years to scrape data for
+    manifest: CrawlManifest, optional
+        crawl manifest, seasons done in a previous run are read from their checkpoint
 
     Returns
     -------
@@ -37,63 +94,32 @@ def scrape_data(years: list) -> pd.DataFrame:
             team made playoffs
     """
     # iterate over years
-    data = list()
+    frames = list()
     for year in years:
         logging.log(str(year))
-        # website to scrape data from
-        website = f"https://www.pro-football-reference.com/years/{year}/"
-
-        # selenium driver
-        driver = scraper.get_driver(website=website)
-
-        # import HTML of webpage into python
-        html = scraper.get_html(driver=driver)
-
-        # get afc and nfc table
-        afc = scraper.find_table(html=html, id="afc_playoff_standings")
-        nfc = scraper.find_table(html=html, id="nfc_playoff_standings")
-        conferences = [afc, nfc]
-
-        # iterate over teams
-        for conference in conferences:
-            standings = scraper.find_all_rows(table=conference)
-            for seat, team in enumerate(standings):
-                # list for team
-                data_team = list()
-                made_playoffs = False
-                data_team.append(year)
-
-                # team name - first column (is th)
-                team_th = scraper.find_table_header(table=team)
-                team_name = team_th.text
-                href = scraper.find_href(team_th)
-                if team_name:
-                    if team_name[-1] in [")"]:
-                        team_name = team_name[:-4]
-                        made_playoffs = True
-                else:
-                    team_name = None
-                if href:
-                    team_id = href["href"][7:10].upper()
-                else:
-                    team_id = None
-                data_team.append(team_id)
-                data_team.append(seat)
-                team_stats = scraper.find_all_table_cells(team)
-                for stat in team_stats:
-                    data_team.append(stat.text)
-                data_team.append(made_playoffs)
-                if len(data_team) > 5:
-                    data.append(data_team)
-
-        driver.quit()
-
+        df_year = crawl_manifest.run_unit(
+            manifest=manifest,
+            scraper="playoffs",
+            year=year,
+            unit="playoff_standings",
+            build=lambda: scrape_season(year=year),
+        )
+        frames.append(df_year)
     # write df
-    df = pd.DataFrame(data=data, columns=header_mapping.header_playoffs)
+    df = extractor.concat(frames=frames, table_schema=header_mapping.schema_playoffs)
+    # seasons of other runs are kept
+    storage.write_table(
+        df,
+        storage.paths["playoff_history"],
+        table_schema=storage.schemas["playoff_history"],
+        replace=False,
+    )
     return df
 
 
-def scrape_playoffs(years: list) -> pd.DataFrame:
+def scrape_playoffs(
+    years: list, manifest: crawl_manifest.CrawlManifest = None
+) -> pd.DataFrame:
     """
     Scrape playoff standings data from
     https://www.pro-football-reference.com/years/{year}/
@@ -103,6 +129,8 @@ def scrape_playoffs(years: list) -> pd.DataFrame:
     ----------
     years: list
         list of years to scrape data for
+    manifest: CrawlManifest, optional
+        crawl manifest, seasons done in a previous run are read from their checkpoint
 
     Returns
     -------
@@ -120,7 +148,7 @@ def scrape_playoffs(years: list) -> pd.DataFrame:
         made_playoffs: bool
             team made playoffs
     """
-    df = scrape_data(years=years)
+    df = scrape_data(years=years, manifest=manifest)
     playoff_history = df[
         ["year", "team_id", "seat", "position", "reason", "made_playoffs"]
     ]
@@ -1,6 +1,7 @@
 import pandas as pd
 import fantasy_football.utils.header_mapping as header_mapping
 import fantasy_football.utils.logging as logging
+import fantasy_football.utils.storage as storage
 import fantasy_football.scrapers.scraper as scraper
 from typing import Tuple
 
@@ -42,11 +43,8 @@ def scrape_data() -> pd.DataFrame:
     # website to scrape data from
     website = "https://www.pro-football-reference.com/stadiums/"
 
-    # selenium driver
-    driver = scraper.get_driver(website=website)
-
     # import HTML of webpage into python
-    html = scraper.get_html(driver=driver)
+    html = scraper.get_html(website=website, wait_for=["stadiums"])
 
     # get stadium table
     table = scraper.find_table(html=html, id="stadiums")
@@ -72,8 +70,9 @@ def scrape_data() -> pd.DataFrame:
             stadium_href = (
                 f"https://www.pro-football-reference.com/stadiums/{stadium_id}.htm"
             )
-            driver_stadium = scraper.get_driver(website=stadium_href, load_timeout=6)
-            html_stadium = scraper.get_html(driver=driver_stadium)
+            html_stadium = scraper.get_html(
+                website=stadium_href, load_timeout=6, wait_for=["info", "meta"]
+            )
             info = scraper.find_div(html=html_stadium, id="info")
             meta = scraper.find_div(html=info, id="meta")
             ps = scraper.find_all_p(meta)
@@ -85,7 +84,6 @@ def scrape_data() -> pd.DataFrame:
                     surface = p.text.split(":")[1].strip()
                 elif p.text[:11] == "Super Bowls":
                     super_bowls = p.text.split(":")[1].strip()
-            driver_stadium.quit()
         else:
             street = None
             surface = None
@@ -98,8 +96,14 @@ def scrape_data() -> pd.DataFrame:
         data_stadium.append(super_bowls)
         if data_stadium and len(data_stadium) > 5:
             data.append(data_stadium)
-    driver.quit()
     df = pd.DataFrame(data=data, columns=header_mapping.header_stadiums)
+    df = header_mapping.schema_stadiums.coerce(df)
+    storage.write_table(
+        df,
+        storage.paths["stadiums_all"],
+        table_schema=storage.schemas["stadiums_all"],
+        replace=True,
+    )
     return df
 
 
@@ -142,7 +146,7 @@ def scrape_stadiums() -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
             stadiums pro football reference id
     """
     # df = scrape_data()
-    df = pd.read_excel("stadiums_all.xlsx")
+    df = storage.load("stadiums_all.xlsx", table_schema=header_mapping.schema_stadiums)
 
     # stadium mapping table
     stadiums = df[
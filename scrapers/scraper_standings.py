@@ -2,12 +2,134 @@ import pandas as pd
 import numpy as np
 import fantasy_football.utils.header_mapping as header_mapping
 import fantasy_football.utils.logging as logging
+import fantasy_football.utils.storage as storage
 import fantasy_football.scrapers.scraper as scraper
+import fantasy_football.scrapers.manifest as crawl_manifest
+import fantasy_football.scrapers.incremental as incremental
 import fantasy_football.utils.mappings as mappings
 from typing import Tuple
 
 
-def scrape_data(years: list) -> pd.DataFrame:
+def scrape_season(year: int, previous: dict = None) -> list:
+    """
+    Scrape standings data of one season from
+    https://www.pro-football-reference.com/years/{year}/
+    with previous rows, the season page is fetched again and team pages
+    are only fetched for teams whose standings changed
+
+    Parameters
+    ----------
+    year: int
+        season year
+    previous: dict, optional
+        team_id -> previously stored row in format of header_standings
+
+    Returns
+    -------
+    list:
+        list of rows in format of header_standings
+    """
+    data = list()
+    # website to scrape data from
+    website = f"https://www.pro-football-reference.com/years/{year}/"
+
+    # import HTML of webpage into python
+    html = scraper.get_html(
+        website=website, refresh=previous is not None, wait_for=["AFC", "NFC"]
+    )
+
+    # get afc and nfc table
+    afc = scraper.find_table(html=html, id="AFC")
+    nfc = scraper.find_table(html=html, id="NFC")
+    conferences = [afc, nfc]
+
+    # iterate over divisons teams
+    for conference in conferences:
+        standings = scraper.find_all_rows(table=conference)
+        # iterate over rows (teams)
+        for team in standings:
+            # list for team
+            data_team = list()
+            data_team.append(year)
+
+            # team name - first column (is th)
+            team_th = scraper.find_table_header(table=team)
+            if team_th:
+                team_name = team_th.text
+                if team_name[-1] in ["*", "+"]:
+                    team_name = team_name[:-1]
+                href = scraper.find_href(team_th)
+            else:
+                team_name = None
+            if href:
+                # coach id is his hyperlink handle
+                team_id = href["href"][7:10].upper()
+                data_team.append(team_id)
+                data_team.append(team_name)
+                team_href = (
+                    f"https://www.pro-football-reference.com/teams/{team_id}/{year}.htm"
+                )
+                table_stats = [s.text for s in scraper.find_all_table_cells(team)]
+                if len(table_stats) == 11:
+                    # seasons without ties column
+                    table_stats.insert(2, 0)
+                known = previous.get(team_id) if previous else None
+                if known is not None and incremental.same_values(
+                    known[9:], table_stats
+                ):
+                    # unchanged since last scrape, keep team page information
+                    data_team.extend(known[3:9])
+                else:
+                    html_team = scraper.get_html(
+                        website=team_href,
+                        load_timeout=6,
+                        refresh=previous is not None,
+                        wait_for=["meta"],
+                    )
+                    meta = scraper.find_div(html=html_team, id="meta")
+                    ps = scraper.find_all_p(meta)
+                    for p in ps:
+                        # print(p.text[:4])
+                        if "Record" in p.text:
+                            s1 = p.text.split("in")
+                            s2 = s1[1].split("(")
+                            division = s2[0].strip()
+                            division_id = mappings.divisions[division]
+                        elif "Preseason Odds" in p.text:
+                            s1 = p.text.split("Super Bowl")
+                            s2 = s1[1].split(";")
+                            super_bowl_odds = int(s2[0].strip())
+                            try:
+                                s3 = s2[1].split(":")
+                                wins_odds = float(s3[1].strip())
+                            except:
+                                wins_odds = None
+                        elif "Expected" in p.text:
+                            s1 = p.text.split(":")
+                            s2 = s1[1].split("-")
+                            expected_wins = float(s2[0].strip())
+                            expected_losses = float(s2[1].strip())
+                    data_team.append(division_id)
+                    data_team.append(division)
+                    data_team.append(super_bowl_odds)
+                    data_team.append(wins_odds)
+                    data_team.append(expected_wins)
+                    data_team.append(expected_losses)
+            stats = scraper.find_all_table_cells(team)
+            for stat in stats:
+                data_team.append(stat.text)
+            if len(data_team) > 5:
+                if len(data_team) == 20:
+                    data_team.insert(11, 0)
+                data.append(data_team)
+    return data
+
+
+def scrape_data(
+    years: list,
+    manifest: crawl_manifest.CrawlManifest = None,
+    previous: pd.DataFrame = None,
+) -> pd.DataFrame:
     """
     Scrape standings data from
     https://www.pro-football-reference.com/years/{year}/
@@ -16,6 +138,11 @@ def scrape_data(years: list) -> pd.DataFrame:
     ----------
     years: list
         list of years to scrape data for
+    manifest: CrawlManifest, optional
+        crawl manifest, seasons done in a previous run are read from their checkpoint
+    previous: DataFrame, optional
+        previously stored standings, team pages are only fetched for changed rows
+        and scraped rows are upserted into previous
 
     Returns
     -------
@@ -64,95 +191,51 @@ def scrape_data(years: list) -> pd.DataFrame:
         defensive_SRS: float
             team defense quality relative to average (0.0)
     """
+
+    def previous_season(year: int) -> dict:
+        # last seen rows of a season by team
+        if previous is None:
+            return None
+        rows = previous[previous["year"] == year][header_mapping.header_standings]
+        return {row[1]: row for row in rows.values.tolist()}
+
     # iterate over years
     data = list()
     for year in years:
         logging.log(str(year))
-        # website to scrape data from
-        website = f"https://www.pro-football-reference.com/years/{year}/"
-
-        # selenium driver
-        driver = scraper.get_driver(website=website)
-
-        # import HTML of webpage into python
-        html = scraper.get_html(driver=driver)
-
-        # get afc and nfc table
-        afc = scraper.find_table(html=html, id="AFC")
-        nfc = scraper.find_table(html=html, id="NFC")
-        conferences = [afc, nfc]
-
-        # iterate over divisons teams
-        for conference in conferences:
-            standings = scraper.find_all_rows(table=conference)
-            # iterate over rows (teams)
-            for team in standings:
-                # list for team
-                data_team = list()
-                data_team.append(year)
-
-                # team name - first column (is th)
-                team_th = scraper.find_table_header(table=team)
-                if team_th:
-                    team_name = team_th.text
-                    if team_name[-1] in ["*", "+"]:
-                        team_name = team_name[:-1]
-                    href = scraper.find_href(team_th)
-                else:
-                    team_name = None
-                if href:
-                    # coach id is his hyperlink handle
-                    team_id = href["href"][7:10].upper()
-                    data_team.append(team_id)
-                    data_team.append(team_name)
-                    team_href = f"https://www.pro-football-reference.com/teams/{team_id}/{year}.htm"
-                    driver_team = scraper.get_driver(website=team_href, load_timeout=6)
-                    html_team = scraper.get_html(driver=driver_team)
-                    meta = scraper.find_div(html=html_team, id="meta")
-                    ps = scraper.find_all_p(meta)
-                    for p in ps:
-                        # print(p.text[:4])
-                        if "Record" in p.text:
-                            s1 = p.text.split("in")
-                            s2 = s1[1].split("(")
-                            division = s2[0].strip()
-                            division_id = mappings.divisions[division]
-                        elif "Preseason Odds" in p.text:
-                            s1 = p.text.split("Super Bowl")
-                            s2 = s1[1].split(";")
-                            super_bowl_odds = int(s2[0].strip())
-                            try:
-                                s3 = s2[1].split(":")
-                                wins_odds = float(s3[1].strip())
-                            except:
-                                wins_odds = None
-                        elif "Expected" in p.text:
-                            s1 = p.text.split(":")
-                            s2 = s1[1].split("-")
-                            expected_wins = float(s2[0].strip())
-                            expected_losses = float(s2[1].strip())
-                    data_team.append(division_id)
-                    data_team.append(division)
-                    data_team.append(super_bowl_odds)
-                    data_team.append(wins_odds)
-                    data_team.append(expected_wins)
-                    data_team.append(expected_losses)
-                    driver_team.quit()
-                stats = scraper.find_all_table_cells(team)
-                for stat in stats:
-                    data_team.append(stat.text)
-                if len(data_team) > 5:
-                    if len(data_team) == 20:
-                        data_team.insert(11, 0)
-                    data.append(data_team)
-        driver.quit()
+        if manifest is not None and previous is not None:
+            # the checkpoint of an earlier run is outdated, scrape the season again
+            manifest.mark("standings", year, "standings", crawl_manifest.PENDING)
+        df_year = crawl_manifest.run_unit(
+            manifest=manifest,
+            scraper="standings",
+            year=year,
+            unit="standings",
+            build=lambda: pd.DataFrame(
+                data=scrape_season(year=year, previous=previous_season(year)),
+                columns=header_mapping.header_standings,
+            ),
+        )
+        data.extend(df_year.values.tolist())
     df = pd.DataFrame(data=data, columns=header_mapping.header_standings)
     df = df.dropna(subset=["team_name"])
+    if previous is not None:
+        df = incremental.upsert(previous=previous, delta=df, keys=["year", "team_id"])
+    df = header_mapping.schema_standings.coerce(df)
+    # seasons of other runs are kept
+    storage.write_table(
+        df,
+        storage.paths["standings"],
+        table_schema=storage.schemas["standings"],
+        replace=False,
+    )
     return df
 
 
 def scrape_standings(
     years: list,
+    manifest: crawl_manifest.CrawlManifest = None,
+    previous: pd.DataFrame = None,
 ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """
     Scrape coach data from
@@ -163,6 +246,10 @@ def scrape_standings(
     ----------
     years: list
         list of years to scrape data for
+    manifest: CrawlManifest, optional
+        crawl manifest, seasons done in a previous run are read from their checkpoint
+    previous: DataFrame, optional
+        previously stored standings in format of scrape_data, see scrape_data
 
     Returns
     -------
@@ -224,7 +311,7 @@ def scrape_standings(
         defensive_SRS: float
             team defense quality relative to average (0.0)
     """
-    df = scrape_data(years=years)
+    df = scrape_data(years=years, manifest=manifest, previous=previous)
 
     # teams table
     teams = df[["team_id", "division_id"]]
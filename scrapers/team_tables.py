@@ -0,0 +1,131 @@
+import pandas as pd
+from bs4 import BeautifulSoup
+import fantasy_football.utils.logging as logging
+import fantasy_football.utils.schema as schema
+import fantasy_football.scrapers.scraper as scraper
+import fantasy_football.scrapers.extractor as extractor
+import fantasy_football.scrapers.manifest as crawl_manifest
+
+
+def parse_table(
+    year: int, table: BeautifulSoup, table_schema: schema.Schema
+) -> pd.DataFrame:
+    """
+    Parse rows of a team table into a typed DataFrame
+    format: year, rank, team_id, stats...
+
+    Parameters
+    ----------
+    year: int
+        season year
+    table: BeautifulSoup
+        html of table
+    table_schema: Schema
+        columns of DataFrame with their dtypes
+
+    Returns
+    -------
+    DataFrame:
+        one row per team
+    """
+    # team rows only, league totals are in tfoot
+    rows = scraper.find_table_rows(table=table)
+    return extractor.extract(
+        rows=rows,
+        columns=table_schema.names[1:],
+        table_schema=table_schema,
+        constants={"year": year},
+        converters={"team_id": extractor.team_id},
+        min_cells=5,
+    )
+
+
+def scrape_tables(
+    years: list,
+    tables: dict,
+    website: str,
+    name: str,
+    manifest: crawl_manifest.CrawlManifest = None,
+) -> dict:
+    """
+    Scrape several team tables of one season page,
+    each season page is fetched and parsed only once
+
+    Parameters
+    ----------
+    years: list
+        list of years to scrape data for
+    tables: dict
+        id of table to be scraped -> schema of DataFrame, see utils.header_mapping
+    website: str
+        season page with a {year} placeholder,
+        p.e. https://www.pro-football-reference.com/years/{year}/opp.htm
+    name: str
+        name of scraper in the crawl manifest, p.e. 'defense'
+    manifest: CrawlManifest, optional
+        crawl manifest, tables done in a previous run are read from their checkpoint
+
+    Returns
+    -------
+    dict:
+        id of table -> DataFrame
+    """
+    data = {table_id: list() for table_id in tables}
+    # iterate over years
+    for year in years:
+        logging.log(str(year))
+
+        # tables finished in a previous run
+        done = dict()
+        if manifest is not None:
+            done = manifest.done(scraper=name, year=year)
+        for table_id in tables:
+            if table_id in done:
+                data[table_id].append(
+                    tables[table_id].coerce(
+                        crawl_manifest.read_checkpoint(done[table_id])
+                    )
+                )
+        pending = [table_id for table_id in tables if table_id not in done]
+        if not pending:
+            continue
+
+        try:
+            # import HTML of webpage into python
+            html = scraper.get_html(website=website.format(year=year), wait_for=pending)
+
+            # get all requested tables, including the ones inside html comments
+            tables_html = scraper.find_tables(html=html, ids=pending)
+        except Exception as e:
+            if manifest is not None:
+                for table_id in pending:
+                    manifest.mark(
+                        name, year, table_id, crawl_manifest.FAILED, error=str(e)
+                    )
+            raise
+        for table_id, table in tables_html.items():
+            if table is None:
+                logging.log(f"{year} table {table_id} not found")
+                if manifest is not None:
+                    manifest.mark(
+                        name,
+                        year,
+                        table_id,
+                        crawl_manifest.FAILED,
+                        error="table not found",
+                    )
+                continue
+            df_table = parse_table(
+                year=year, table=table, table_schema=tables[table_id]
+            )
+            data[table_id].append(df_table)
+            if manifest is not None:
+                output = manifest.checkpoint_path(name, year, table_id)
+                crawl_manifest.write_checkpoint(df_table, output)
+                manifest.mark(name, year, table_id, crawl_manifest.DONE, output=output)
+
+    # write dfs
+    return {
+        table_id: extractor.concat(frames=data[table_id], table_schema=table_schema)
+        for table_id, table_schema in tables.items()
+    }
@@ -0,0 +1,104 @@
+import datetime
+import sqlite3
+import time
+import pytest
+import fantasy_football.scrapers.cache as cache
+
+SEASON = "https://www.pro-football-reference.com/years/2022/"
+BOXSCORE = "https://www.pro-football-reference.com/boxscores/202209110kan.htm"
+
+
+@pytest.mark.parametrize(
+    "today, season",
+    [
+        (datetime.date(2022, 9, 11), 2022),
+        (datetime.date(2023, 2, 12), 2022),
+        (datetime.date(2023, 3, 1), 2023),
+    ],
+)
+def test_current_season(today, season):
+    assert cache.current_season(today) == season
+
+
+@pytest.mark.parametrize(
+    "website, today, url_class",
+    [
+        (SEASON, datetime.date(2022, 12, 1), "current_season"),
+        (SEASON, datetime.date(2023, 2, 28), "current_season"),
+        (SEASON, datetime.date(2023, 3, 1), "finished_season"),
+        (
+            "https://www.pro-football-reference.com/teams/kan/2022.htm",
+            datetime.date(2024, 1, 1),
+            "finished_season",
+        ),
+        (BOXSCORE, datetime.date(2022, 9, 14), "recent_boxscore"),
+        (BOXSCORE, datetime.date(2022, 9, 15), "boxscore"),
+        (
+            "https://www.pro-football-reference.com/stadiums/",
+            datetime.date(2022, 9, 1),
+            "other",
+        ),
+    ],
+)
+def test_url_class(website, today, url_class):
+    assert cache.url_class(website, today=today) == url_class
+
+
+def _fetched(page_cache: cache.PageCache, website: str, when: datetime.datetime):
+    # pretend website was fetched at when
+    with sqlite3.connect(page_cache.path) as con:
+        con.execute(
+            "UPDATE pages SET fetched_at = ? WHERE url = ?",
+            (when.timestamp(), website),
+        )
+
+
+def test_get_returns_fresh_page(tmp_path):
+    page_cache = cache.PageCache(path=str(tmp_path / "pages.sqlite"))
+    page_cache.put(SEASON, "<html>2022</html>")
+    assert page_cache.get(SEASON) == "<html>2022</html>"
+    assert page_cache.get(BOXSCORE) is None
+
+
+def test_finished_season_fetched_while_running_expires(tmp_path):
+    page_cache = cache.PageCache(path=str(tmp_path / "pages.sqlite"))
+    page_cache.put(SEASON, "<html>mid season</html>")
+    _fetched(page_cache, SEASON, datetime.datetime(2022, 11, 1))
+    assert page_cache.get(SEASON) is None
+
+
+def test_finished_season_fetched_afterwards_never_expires(tmp_path):
+    page_cache = cache.PageCache(path=str(tmp_path / "pages.sqlite"))
+    page_cache.put(SEASON, "<html>final</html>")
+    _fetched(page_cache, SEASON, datetime.datetime(2023, 6, 1))
+    assert page_cache.get(SEASON) == "<html>final</html>"
+
+
+def test_boxscore_fetched_before_corrections_expires(tmp_path):
+    page_cache = cache.PageCache(path=str(tmp_path / "pages.sqlite"))
+    page_cache.put(BOXSCORE, "<html>game day</html>")
+    _fetched(page_cache, BOXSCORE, datetime.datetime(2022, 9, 12))
+    assert page_cache.get(BOXSCORE) is None
+    page_cache.put(BOXSCORE, "<html>corrected</html>")
+    _fetched(page_cache, BOXSCORE, datetime.datetime(2022, 9, 20))
+    assert page_cache.get(BOXSCORE) == "<html>corrected</html>"
+
+
+def test_ttls_override(tmp_path):
+    page_cache = cache.PageCache(path=str(tmp_path / "pages.sqlite"), ttls={"other": 0})
+    website = "https://www.pro-football-reference.com/stadiums/"
+    page_cache.put(website, "<html></html>")
+    time.sleep(0.01)
+    assert page_cache.get(website) is None
+
+
+def test_eviction_keeps_byte_total(tmp_path):
+    page_cache = cache.PageCache(path=str(tmp_path / "pages.sqlite"), max_bytes=2000)
+    for i in range(50):
+        page_cache.put(f"https://example.com/{i}", f"{i}" * 500 + str(i**7))
+        if i % 7 == 0:
+            page_cache.invalidate(f"https://example.com/{i // 2}")
+        assert page_cache._bytes == page_cache.size() <= 2000
+    # least recently used pages are evicted first
+    assert page_cache.get("https://example.com/49") is not None
+    assert page_cache.get("https://example.com/0") is None
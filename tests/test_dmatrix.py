@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import pytest
+import fantasy_football.predictor.dmatrix as dmatrix
+import fantasy_football.predictor.features as features
+
+
+@pytest.fixture
+def training(monkeypatch):
+    # twenty team seasons of two features, counts the conversions
+    calls = list()
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(20, 2)), columns=["points", "yards"])
+    y = pd.Series(rng.integers(0, 2, size=20).astype(bool))
+
+    def training_data(years=None):
+        calls.append(years)
+        return X, y
+
+    monkeypatch.setattr(features, "training_data", training_data)
+    monkeypatch.setattr(dmatrix, "fingerprint", lambda years=None: f"{years}")
+    return calls
+
+
+def test_save_once(training, tmp_path):
+    path = dmatrix.save(years=[2021], directory=str(tmp_path))
+    assert dmatrix.save(years=[2021], directory=str(tmp_path)) == path
+    assert training == [[2021]]
+    # other training data is saved to another file
+    assert dmatrix.save(years=[2022], directory=str(tmp_path)) != path
+
+
+def test_load_saved_matrix(training, tmp_path):
+    matrix = dmatrix.training_matrix(years=[2021], directory=str(tmp_path))
+    assert (matrix.num_row(), matrix.num_col()) == (20, 2)
+    assert matrix.feature_names == ["points", "yards"]
+    np.testing.assert_array_equal(matrix.get_label(), features.training_data()[1])
+
+
+def test_quantize_in_memory(training):
+    matrix = dmatrix.training_matrix(years=[2021], directory=None)
+    assert isinstance(matrix, dmatrix.xgb.QuantileDMatrix)
+    assert matrix.num_row() == 20
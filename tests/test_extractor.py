@@ -0,0 +1,90 @@
+import pandas as pd
+import fantasy_football.scrapers.document as document
+import fantasy_football.scrapers.extractor as extractor
+import fantasy_football.utils.schema as schema
+
+SCHEMA = schema.Schema(
+    [
+        schema.Column("year", schema.INT),
+        schema.category("team_id"),
+        schema.text("team"),
+        schema.count("wins"),
+        schema.pct("win_pct", fraction=True),
+    ]
+)
+COLUMNS = ["team", "wins", "win_pct"]
+
+
+def cell(text, stat=None, href=None):
+    return document.Cell(text, stat, href)
+
+
+def team_of(index, row):
+    return next(extractor.team_id(item) for item in row if item.stat == "team")
+
+
+def test_later_rows_are_placed_by_data_stat():
+    rows = [
+        # over header row
+        [cell("Standings")],
+        [
+            cell("Kansas City Chiefs", "team", "/teams/kan/2022.htm"),
+            cell("14", "wins"),
+            cell(".824", "win_loss_perc"),
+        ],
+        # missing wins cell and reordered cells
+        [
+            cell(".647", "win_loss_perc"),
+            cell("Buffalo Bills", "team", "/teams/buf/2022.htm"),
+        ],
+    ]
+    df = extractor.extract(
+        rows,
+        COLUMNS,
+        SCHEMA,
+        constants={"year": 2022},
+        derived={"team_id": team_of},
+        min_cells=2,
+    )
+    assert df["team"].tolist() == ["Kansas City Chiefs", "Buffalo Bills"]
+    assert df["team_id"].tolist() == ["KAN", "BUF"]
+    assert df["wins"].tolist()[0] == 14
+    assert df["wins"].isna().tolist() == [False, True]
+    assert df["win_pct"].tolist() == [0.824, 0.647]
+    assert df["year"].tolist() == [2022, 2022]
+
+
+def test_converters_replace_cell_text():
+    rows = [[cell("Chiefs", "team", "/teams/kan/2022.htm"), cell("14"), cell("1")]]
+    df = extractor.extract(
+        rows, COLUMNS, SCHEMA, converters={"team": extractor.team_id}
+    )
+    assert df["team"].tolist() == ["KAN"]
+
+
+def test_table_without_full_row_is_placed_by_position():
+    rows = [
+        [cell("Kansas City Chiefs", "team"), cell("14", "wins")],
+        [cell("Buffalo Bills", "team"), cell("13", "wins")],
+    ]
+    df = extractor.extract(rows, COLUMNS, SCHEMA)
+    assert df["team"].tolist() == ["Kansas City Chiefs", "Buffalo Bills"]
+    assert df["wins"].tolist() == [14, 13]
+    assert df["win_pct"].isna().all()
+
+
+def test_extract_returns_schema_dtypes():
+    df = extractor.extract(list(), COLUMNS, SCHEMA)
+    assert df.empty
+    assert {name: str(dtype) for name, dtype in df.dtypes.items()} == SCHEMA.dtypes
+
+
+def test_concat_keeps_dtypes():
+    frames = [
+        extractor.extract([[cell("A"), cell("1"), cell(".5")]], COLUMNS, SCHEMA),
+        extractor.extract([[cell("B"), cell("2"), cell(".25")]], COLUMNS, SCHEMA),
+    ]
+    df = extractor.concat(frames, SCHEMA)
+    assert df["team"].tolist() == ["A", "B"]
+    assert {name: str(dtype) for name, dtype in df.dtypes.items()} == SCHEMA.dtypes
+    assert extractor.concat(list(), SCHEMA).columns.tolist() == SCHEMA.names
@@ -0,0 +1,32 @@
+import datetime
+import pandas as pd
+import pytest
+import fantasy_football.predictor.features as features
+import fantasy_football.predictor.loader as loader
+
+
+@pytest.fixture
+def history(monkeypatch):
+    # measures of 2020 to 2023, playoff seeds of 2020, 2021 and the running 2023
+    def read_playoff_history(columns=None):
+        return pd.DataFrame(
+            {
+                "year": [2020, 2020, 2021, 2023, 2023],
+                loader.LABEL: [True, False, True, True, None],
+            }
+        )[columns]
+
+    monkeypatch.setattr(loader, "read_playoff_history", read_playoff_history)
+    monkeypatch.setattr(loader, "seasons", lambda factor: [2020, 2021, 2022, 2023])
+
+
+@pytest.mark.parametrize(
+    "today, seasons",
+    [
+        (datetime.date(2023, 12, 1), [2020, 2021]),
+        (datetime.date(2024, 2, 1), [2020, 2021]),
+        (datetime.date(2024, 3, 1), [2020, 2021, 2023]),
+    ],
+)
+def test_labeled_seasons(history, today, seasons):
+    assert features.labeled_seasons(today=today) == seasons
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import pytest
+import fantasy_football.scrapers.incremental as incremental
+
+
+def test_upsert_replaces_rows_with_same_keys():
+    previous = pd.DataFrame(
+        {
+            "year": [2021, 2021, 2022],
+            "team_id": ["KAN", "BUF", "KAN"],
+            "wins": [12, 11, 5],
+        }
+    )
+    delta = pd.DataFrame({"year": ["2022"], "team_id": ["KAN"], "wins": [14]})
+    combined = incremental.upsert(previous, delta, keys=["year", "team_id"])
+    assert combined["wins"].tolist() == [12, 11, 14]
+    assert combined.index.tolist() == [0, 1, 2]
+
+
+def test_upsert_appends_new_rows():
+    previous = pd.DataFrame({"year": [2021], "team_id": ["KAN"], "wins": [12]})
+    delta = pd.DataFrame({"year": [2022], "team_id": ["KAN"], "wins": [14]})
+    combined = incremental.upsert(previous, delta, keys=["year", "team_id"])
+    assert combined["year"].tolist() == [2021, 2022]
+
+
+@pytest.mark.parametrize("previous", [None, pd.DataFrame(columns=["year", "wins"])])
+def test_upsert_without_previous(previous):
+    delta = pd.DataFrame({"year": [2022], "wins": [14]}, index=[7])
+    combined = incremental.upsert(previous, delta, keys=["year"])
+    pd.testing.assert_frame_equal(combined, delta.reset_index(drop=True))
+
+
+def test_upsert_without_delta():
+    previous = pd.DataFrame({"year": [2021], "wins": [12]}, index=[3])
+    combined = incremental.upsert(previous, previous.iloc[:0], keys=["year"])
+    pd.testing.assert_frame_equal(combined, previous.reset_index(drop=True))
+
+
+@pytest.mark.parametrize(
+    "stored, scraped, same",
+    [
+        ([10, "KAN"], ["10", "KAN"], True),
+        ([10.0, 0.5], ["10", ".5"], True),
+        ([np.nan, None, pd.NA], ["", " ", ""], True),
+        ([" KAN "], ["KAN"], True),
+        ([10], ["11"], False),
+        ([np.nan], ["0"], False),
+        (["KAN"], ["BUF"], False),
+        ([10, 11], ["10"], False),
+    ],
+)
+def test_same_values(stored, scraped, same):
+    assert incremental.same_values(stored, scraped) is same
@@ -0,0 +1,125 @@
+import threading
+import time
+import pytest
+import fantasy_football.scrapers.errors as errors
+import fantasy_football.scrapers.rate_limiter as rate_limiter
+
+
+@pytest.fixture(autouse=True)
+def limiter():
+    # every test starts with a fresh fast limiter, the defaults are restored after
+    rate_limiter.configure(requests_per_minute=60 * 1000, burst=1000)
+    yield
+    rate_limiter.configure()
+
+
+def test_bucket_burst_is_free():
+    bucket = rate_limiter.TokenBucket(rate=1, burst=3)
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+
+def test_bucket_waits_for_rate():
+    bucket = rate_limiter.TokenBucket(rate=50, burst=1)
+    bucket.acquire()
+    start = time.monotonic()
+    for _ in range(5):
+        bucket.acquire()
+    assert time.monotonic() - start == pytest.approx(0.1, abs=0.06)
+
+
+def test_bucket_pause():
+    bucket = rate_limiter.TokenBucket(rate=1000, burst=10)
+    bucket.pause(0.1)
+    start = time.monotonic()
+    bucket.acquire()
+    assert time.monotonic() - start >= 0.09
+
+
+def test_concurrency_grows_after_healthy_window():
+    concurrency = rate_limiter.AdaptiveConcurrency(initial=2, maximum=3, window=5)
+    for _ in range(5):
+        concurrency.acquire()
+        concurrency.release(latency=0.1)
+    assert concurrency.limit == 3
+    for _ in range(10):
+        concurrency.acquire()
+        concurrency.release(latency=0.1)
+    assert concurrency.limit == 3
+
+
+def test_concurrency_keeps_limit_while_slow_or_failing():
+    concurrency = rate_limiter.AdaptiveConcurrency(initial=2, window=5)
+    for _ in range(5):
+        concurrency.acquire()
+        concurrency.release(latency=5.0)
+    for _ in range(5):
+        concurrency.acquire()
+        concurrency.release(latency=0.1, error=True)
+    assert concurrency.limit == 2
+
+
+def test_concurrency_halves_on_throttle():
+    concurrency = rate_limiter.AdaptiveConcurrency(initial=8, minimum=1)
+    for limit in [4, 2, 1, 1]:
+        concurrency.acquire()
+        concurrency.release(latency=0.1, throttled=True)
+        assert concurrency.limit == limit
+    assert concurrency.metrics()["throttled"] == 4
+
+
+def test_concurrency_blocks_at_limit():
+    concurrency = rate_limiter.AdaptiveConcurrency(initial=1)
+    concurrency.acquire()
+    entered = threading.Event()
+
+    def second():
+        concurrency.acquire()
+        entered.set()
+        concurrency.release()
+
+    thread = threading.Thread(target=second)
+    thread.start()
+    assert not entered.wait(0.05)
+    concurrency.release()
+    assert entered.wait(1)
+    thread.join()
+
+
+def test_limited_returns_result():
+    assert rate_limiter.limited(lambda a, b=0: a + b, 1, b=2) == 3
+    assert rate_limiter.metrics()["in_flight"] == 0
+
+
+@pytest.mark.parametrize(
+    "error, throttled",
+    [
+        (errors.ThrottledError("https://example.com", retry_after=0.01), 1),
+        (errors.FetchTimeoutError("https://example.com"), 1),
+        (ValueError("parse"), 0),
+    ],
+)
+def test_limited_frees_slot_on_error(error, throttled):
+    def fail():
+        raise error
+
+    with pytest.raises(type(error)):
+        rate_limiter.limited(fail)
+    metrics = rate_limiter.metrics()
+    assert metrics["in_flight"] == 0
+    assert metrics["errors"] == 1
+    assert metrics["throttled"] == throttled
+
+
+def test_limited_frees_slot_when_waiting_fails(monkeypatch):
+    def interrupted():
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(rate_limiter._bucket, "acquire", interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        rate_limiter.limited(lambda: None)
+    assert rate_limiter.metrics()["in_flight"] == 0
+
+
+def test_max_concurrency():
+    rate_limiter.configure(maximum=5)
+    assert rate_limiter.max_concurrency() == 5
@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+import pytest
+import fantasy_football.utils.schema as schema
+
+SCHEMA = schema.Schema(
+    [
+        schema.Column("year", schema.INT, nullable=False),
+        schema.category("team_id", nullable=False),
+        schema.count("yards"),
+        schema.ratio("yards_per_play"),
+        schema.pct("completion_pct"),
+        schema.pct("win_pct", fraction=True),
+        schema.flag("made_playoffs"),
+        schema.text("remark"),
+    ]
+)
+
+
+def scraped(**columns) -> pd.DataFrame:
+    # text cells like the scrapers produce them
+    rows = {
+        "year": ["2022", "2022", "2022"],
+        "team_id": ["KAN", "BUF", "KAN"],
+        "yards": ["6,874", "--", "12"],
+        "yards_per_play": ["6.5", "", "5"],
+        "completion_pct": ["67.2", "45.3%", "-"],
+        "win_pct": [".824", ".765", None],
+        "made_playoffs": ["True", "False", None],
+        "remark": [" Super Bowl ", "", "x"],
+    }
+    rows.update(columns)
+    return pd.DataFrame(
+        {name: pd.Series(values, dtype=object) for name, values in rows.items()}
+    )
+
+
+def test_coerce_dtypes():
+    df = SCHEMA.coerce(scraped())
+    assert {name: str(dtype) for name, dtype in df.dtypes.items()} == SCHEMA.dtypes
+
+
+def test_coerce_numbers():
+    df = SCHEMA.coerce(scraped())
+    assert df["yards"].tolist()[0] == 6874
+    assert df["yards"].isna().tolist() == [False, True, False]
+    assert df["yards_per_play"].tolist()[0] == 6.5
+    assert np.isnan(df["yards_per_play"].tolist()[1])
+
+
+def test_percentages_are_fractions():
+    df = SCHEMA.coerce(scraped())
+    completion = df["completion_pct"].to_numpy()
+    np.testing.assert_allclose(completion[:2], [0.672, 0.453])
+    assert np.isnan(completion[2])
+    np.testing.assert_allclose(df["win_pct"].to_numpy()[:2], [0.824, 0.765])
+
+
+def test_clean_percentages_take_the_fast_path():
+    df = SCHEMA.coerce(scraped(completion_pct=["67.2", "50", "0"]))
+    np.testing.assert_allclose(df["completion_pct"], [0.672, 0.5, 0.0])
+
+
+def test_flags_and_text():
+    df = SCHEMA.coerce(scraped())
+    assert df["made_playoffs"].tolist()[:2] == [True, False]
+    assert df["made_playoffs"].isna().tolist()[2]
+    assert df["remark"].tolist()[0] == "Super Bowl"
+    assert df["remark"].isna().tolist()[1]
+
+
+def test_coerce_twice_is_the_same():
+    once = SCHEMA.coerce(scraped())
+    pd.testing.assert_frame_equal(SCHEMA.coerce(once), once)
+
+
+def test_coerce_keeps_other_columns():
+    df = SCHEMA.coerce(scraped().assign(extra=["a", "b", "c"]))
+    assert df["extra"].tolist() == ["a", "b", "c"]
+
+
+@pytest.mark.parametrize(
+    "columns, message",
+    [
+        ({"yards": ["1", "2.5", "3"]}, "column yards: fractional"),
+        ({"yards": ["1", "many", "3"]}, "column yards: "),
+        ({"team_id": ["KAN", None, "BUF"]}, "column team_id has missing values"),
+    ],
+)
+def test_coerce_errors_name_the_column(columns, message):
+    with pytest.raises(ValueError, match=message):
+        SCHEMA.coerce(scraped(**columns))
+
+
+def test_json_round_trip():
+    restored = schema.Schema.from_json(SCHEMA.to_json())
+    assert restored.names == SCHEMA.names
+    assert restored.dtypes == SCHEMA.dtypes
+    assert [column.parse for column in restored] == [column.parse for column in SCHEMA]
+
+
+def test_select():
+    assert SCHEMA.select(["yards", "year"]).names == ["yards", "year"]
@@ -0,0 +1,88 @@
+import pytest
+import fantasy_football.scrapers.rate_limiter as rate_limiter
+import fantasy_football.scrapers.scraper_games as scraper_games
+import fantasy_football.utils.header_mapping as header_mapping
+import fantasy_football.utils.storage as storage
+
+
+def boxscore(game_id: str) -> list:
+    # away, home, their scores and nothing else
+    values = ["KAN", "BUF", "20", "17"]
+    return values + [None] * (len(header_mapping.header_games) - 3 - len(values))
+
+
+@pytest.fixture
+def site(monkeypatch):
+    # two games a season, games with "bad" in their id fail, no writes
+    executors = list()
+
+    class Executor(scraper_games.ThreadPoolExecutor):
+        def __init__(self, max_workers):
+            executors.append(max_workers)
+            super().__init__(max_workers=max_workers)
+
+    def scrape_boxscore_with_retry(game_id, max_retries, backoff):
+        if "bad" in game_id:
+            raise ValueError(f"incomplete boxscore {game_id}")
+        return boxscore(game_id)
+
+    monkeypatch.setattr(scraper_games, "ThreadPoolExecutor", Executor)
+    monkeypatch.setattr(
+        scraper_games,
+        "scrape_schedule",
+        lambda year, refresh: [(year, "1", f"{year}a"), (year, "2", f"{year}bad")],
+    )
+    monkeypatch.setattr(
+        scraper_games, "scrape_boxscore_with_retry", scrape_boxscore_with_retry
+    )
+    monkeypatch.setattr(storage, "write_table", lambda *args, **kwargs: None)
+    yield executors
+    rate_limiter.configure()
+
+
+@pytest.mark.parametrize(
+    "maximum, max_workers, workers",
+    [
+        (4, None, 4),
+        (32, None, scraper_games.MAX_WORKERS),
+        (4, 6, 6),
+        (4, 100, scraper_games.MAX_WORKERS),
+        (4, 0, 1),
+    ],
+)
+def test_workers(site, maximum, max_workers, workers):
+    rate_limiter.configure(maximum=maximum)
+    scraper_games.scrape_data(years=[2022], max_workers=max_workers)
+    assert site == [workers]
+
+
+def test_failed_games(site):
+    df, failed = scraper_games.scrape_data(years=[2021, 2022], return_failed=True)
+    assert df["game_id"].tolist() == ["2021a", "2022a"]
+    assert df["home_team_score"].tolist() == [17, 17]
+    assert failed["game_id"].tolist() == ["2021bad", "2022bad"]
+    assert failed["error"].str.startswith("incomplete boxscore").all()
+
+
+def test_retry_fetches_again(monkeypatch):
+    attempts = list()
+
+    def scrape_boxscore(game_id, refresh):
+        attempts.append(refresh)
+        if len(attempts) < 3:
+            raise ValueError("timeout")
+        return boxscore(game_id)
+
+    monkeypatch.setattr(scraper_games, "scrape_boxscore", scrape_boxscore)
+    row = scraper_games.scrape_boxscore_with_retry("g", max_retries=3, backoff=0)
+    assert row[:2] == ["KAN", "BUF"]
+    assert attempts == [False, True, True]
+
+
+def test_retry_gives_up(monkeypatch):
+    def scrape_boxscore(game_id, refresh):
+        raise ValueError("timeout")
+
+    monkeypatch.setattr(scraper_games, "scrape_boxscore", scrape_boxscore)
+    with pytest.raises(ValueError, match="timeout"):
+        scraper_games.scrape_boxscore_with_retry("g", max_retries=2, backoff=0)
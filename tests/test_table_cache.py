@@ -0,0 +1,76 @@
+import os
+import pandas as pd
+import fantasy_football.predictor.cache as cache
+
+
+class Builder:
+    # counting table builder
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self) -> pd.DataFrame:
+        self.calls += 1
+        return pd.DataFrame({"year": [2022], "points": [self.calls]})
+
+
+def test_digest_is_stable():
+    assert cache.digest(["offense", [2021, 2022]]) == cache.digest(
+        ["offense", [2021, 2022]]
+    )
+    assert cache.digest(["offense", [2021]]) != cache.digest(["defense", [2021]])
+
+
+def test_fingerprint_follows_sources(tmp_path):
+    source = tmp_path / "offense.csv"
+    missing = str(tmp_path / "missing.csv")
+    source.write_text("a")
+    first = cache.fingerprint([str(source), missing])
+    assert cache.fingerprint([str(source)]) == first
+    source.write_text("b")
+    assert cache.fingerprint([str(source)]) != first
+
+
+def test_get_builds_once(tmp_path):
+    source = tmp_path / "offense.csv"
+    source.write_text("a")
+    tables = cache.TableCache(directory=None)
+    build = Builder()
+    df = tables.get("offense", [str(source)], build)
+    df["points"] = 0
+    assert tables.get("offense", [str(source)], build)["points"].tolist() == [1]
+    assert build.calls == 1
+    source.write_text("b")
+    assert tables.get("offense", [str(source)], build)["points"].tolist() == [2]
+
+
+def test_materialized_tables_are_shared(tmp_path):
+    source = tmp_path / "offense.csv"
+    source.write_text("a")
+    directory = str(tmp_path / "tables")
+    build = Builder()
+    cache.TableCache(directory=directory).get("offense", [str(source)], build)
+    df = cache.TableCache(directory=directory).get("offense", [str(source)], build)
+    assert build.calls == 1
+    assert df["points"].tolist() == [1]
+    # a changed source replaces the outdated table on disk
+    source.write_text("b")
+    cache.TableCache(directory=directory).get("offense", [str(source)], build)
+    assert len(os.listdir(directory)) == 1
+
+
+def test_maxsize_evicts_least_recently_used(tmp_path):
+    tables = cache.TableCache(directory=None, maxsize=2)
+    build = Builder()
+    for key in ["offense", "defense", "offense", "games"]:
+        tables.get(key, list(), build)
+    assert list(tables._tables) == ["offense", "games"]
+
+
+def test_disable_cache(monkeypatch):
+    # the process wide cache is restored after the test
+    monkeypatch.setattr(cache, "_cache", None)
+    monkeypatch.setattr(cache, "_enabled", True)
+    cache.disable_cache()
+    assert cache.get_cache() is None
+    shared = cache.configure_cache(directory=None)
+    assert cache.get_cache() is shared
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+from scipy import stats
+import fantasy_football.predictor.ttest as ttest
+
+
+def test_matches_scipy_per_column():
+    rng = np.random.default_rng(7)
+    a = rng.normal(1.0, 2.0, size=(40, 6))
+    b = rng.normal(0.5, 1.5, size=(25, 6))
+    a[rng.random(a.shape) < 0.2] = np.nan
+    b[rng.random(b.shape) < 0.2] = np.nan
+    t, p = ttest.ttest(a, b)
+    for i in range(a.shape[1]):
+        expected = stats.ttest_ind(a[:, i], b[:, i], nan_policy="omit")
+        assert t[i] == pytest.approx(expected.statistic, rel=1e-9)
+        assert p[i] == pytest.approx(expected.pvalue, rel=1e-9)
+
+
+def test_infinite_values_are_left_out():
+    a = np.array([[1.0], [2.0], [np.inf], [4.0]])
+    b = np.array([[0.0], [-np.inf], [1.0], [0.5]])
+    t, p = ttest.ttest(a, b)
+    expected = stats.ttest_ind([1.0, 2.0, 4.0], [0.0, 1.0, 0.5])
+    assert t[0] == pytest.approx(expected.statistic)
+    assert p[0] == pytest.approx(expected.pvalue)
+
+
+def test_constant_columns():
+    # equal constants, different constants and constants off by rounding
+    a = np.array([[3.0, 3.0, 0.1 + 0.2]] * 4)
+    b = np.array([[3.0, 1.0, 0.3]] * 5)
+    t, p = ttest.ttest(a, b)
+    assert t[0] == 0.0 and p[0] == 1.0
+    assert t[1] == np.inf and p[1] == 0.0
+    assert np.isinf(t[2]) and p[2] == 0.0
+
+
+def test_columns_without_values_are_nan():
+    a = np.array([[np.nan, 1.0], [np.nan, 2.0]])
+    b = np.array([[1.0, np.nan], [2.0, 3.0]])
+    t, p = ttest.ttest(a, b)
+    assert np.isnan(t[0]) and np.isnan(p[0])
+    # one value per sample leaves no degree of freedom
+    a = np.array([[1.0]])
+    b = np.array([[2.0]])
+    t, p = ttest.ttest(a, b)
+    assert np.isnan(t[0]) and np.isnan(p[0])
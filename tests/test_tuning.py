@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+import fantasy_football.predictor.tuning as tuning
+
+
+def test_sample_stays_in_space():
+    rng = np.random.default_rng(0)
+    for _ in range(100):
+        params = tuning.sample(tuning.SPACE, rng)
+        assert params.keys() == tuning.SPACE.keys()
+        for name, (distribution, low, high) in tuning.SPACE.items():
+            assert low <= params[name] <= high
+            if distribution == "int":
+                assert isinstance(params[name], int)
+
+
+def test_sample_unknown_distribution():
+    with pytest.raises(ValueError, match="normal"):
+        tuning.sample({"eta": ("normal", 0, 1)}, np.random.default_rng(0))
+
+
+def test_season_folds_keep_seasons_together():
+    years = np.repeat(np.arange(2010, 2022), 32)
+    folds = tuning.season_folds(years, n_folds=5)
+    assert len(folds) == 5
+    validated = np.concatenate([valid for _, valid in folds])
+    assert sorted(validated.tolist()) == list(range(len(years)))
+    for train, valid in folds:
+        assert not set(years[train]) & set(years[valid])
+        assert len(train) + len(valid) == len(years)
+
+
+def test_season_folds_at_most_one_per_season():
+    years = np.array([2020, 2020, 2021])
+    assert len(tuning.season_folds(years, n_folds=5)) == 2
+
+
+def test_trial_cache_round_trip(tmp_path):
+    trials = tuning.TrialCache(str(tmp_path / "tuning"))
+    key = trials.key({"eta": 0.1, "max_depth": 3}, rounds=100, data="abc")
+    assert trials.get(key) is None
+    trials.put(key, {"loss": 0.5, "rounds": 42})
+    assert trials.get(key) == {"loss": 0.5, "rounds": 42}
+    # a new cache on the same directory reads the finished trial
+    assert tuning.TrialCache(str(tmp_path / "tuning")).get(key)["rounds"] == 42
+
+
+def test_trial_cache_key():
+    trials = tuning.TrialCache(None)
+    key = trials.key({"eta": 0.1, "max_depth": 3}, rounds=100, data="abc")
+    assert key == trials.key({"max_depth": 3, "eta": 0.1}, rounds=100, data="abc")
+    assert key != trials.key({"eta": 0.1, "max_depth": 3}, rounds=200, data="abc")
+    assert key != trials.key({"eta": 0.1, "max_depth": 3}, rounds=100, data="abd")
+
+
+@pytest.mark.parametrize("directory", [None, ""])
+def test_trial_cache_keeps_nothing(directory):
+    trials = tuning.TrialCache(directory)
+    trials.put("key", {"loss": 0.5})
+    assert trials.get("key") is None
+
+
+def test_trial_cache_ignores_broken_files(tmp_path):
+    trials = tuning.TrialCache(str(tmp_path))
+    (tmp_path / "key.json").write_text("{")
+    assert trials.get("key") is None
@@ -1,485 +1,556 @@
+import fantasy_football.utils.schema as schema
+
 # header for coaches
-header_coaches = [
-    "year",
-    "coach_id",
-    "coach_name",
-    "birthday",
-    "birth_location",
-    "team_id",
-    "games",
-    "wins",
-    "losses",
-    "ties",
-    "games_with_team",
-    "wins_with_team",
-    "losses_with_team",
-    "ties_with_team",
-    "games_career",
-    "wins_career",
-    "losses_career",
-    "ties_career",
-    "playoff_games",
-    "playoff_wins",
-    "playoff_losses",
-    "playoff_games_team",
-    "playoff_wins_team",
-    "playoff_losses_team",
-    "playoff_games_career",
-    "playoff_wins_career",
-    "playoff_losses_career",
-    "remark",
-]
+schema_coaches = schema.Schema(
+    [
+        schema.Column("year", schema.INT, nullable=False),
+        schema.text("coach_id"),
+        schema.text("coach_name"),
+        schema.text("birthday"),
+        schema.text("birth_location"),
+        schema.category("team_id"),
+        schema.count("games"),
+        schema.count("wins"),
+        schema.count("losses"),
+        schema.count("ties"),
+        schema.count("games_with_team"),
+        schema.count("wins_with_team"),
+        schema.count("losses_with_team"),
+        schema.count("ties_with_team"),
+        schema.count("games_career"),
+        schema.count("wins_career"),
+        schema.count("losses_career"),
+        schema.count("ties_career"),
+        schema.count("playoff_games"),
+        schema.count("playoff_wins"),
+        schema.count("playoff_losses"),
+        schema.count("playoff_games_team"),
+        schema.count("playoff_wins_team"),
+        schema.count("playoff_losses_team"),
+        schema.count("playoff_games_career"),
+        schema.count("playoff_wins_career"),
+        schema.count("playoff_losses_career"),
+        schema.text("remark"),
+    ]
+)
+header_coaches = schema_coaches.names
 
 # header for stadiums
-header_stadiums = [
-    "stadium_id",
-    "stadium_name",
-    "from",
-    "to",
-    "games",
-    "city",
-    "state",
-    "primary_team",
-    "street",
-    "surface",
-    "super_bowls",
-]
+schema_stadiums = schema.Schema(
+    [
+        schema.text("stadium_id"),
+        schema.text("stadium_name"),
+        schema.Column("from", schema.INT),
+        schema.Column("to", schema.INT),
+        schema.count("games"),
+        schema.text("city"),
+        schema.category("state"),
+        schema.category("primary_team"),
+        schema.text("street"),
+        schema.text("surface"),
+        schema.text("super_bowls"),
+    ]
+)
+header_stadiums = schema_stadiums.names
 
 # header team standings
-header_standings = [
-    "year",
-    "team_id",
-    "team_name",
-    "division_id",
-    "division",
-    "odds_super_bowl",
-    "odds_wins",
-    "expected_wins",
-    "expected_losses",
-    "wins",
-    "losses",
-    "ties",
-    "win_pct",
-    "points_for",
-    "points_against",
-    "points_diffential",
-    "margin_of_victory",
-    "strength_of_schedule",
-    "simple_rating_system",
-    "offensive_SRS",
-    "defensive_SRS",
-]
+schema_standings = schema.Schema(
+    [
+        schema.Column("year", schema.INT, nullable=False),
+        schema.category("team_id", nullable=False),
+        schema.text("team_name"),
+        schema.category("division_id"),
+        schema.category("division"),
+        schema.Column("odds_super_bowl", schema.INT),
+        schema.ratio("odds_wins"),
+        schema.ratio("expected_wins"),
+        schema.ratio("expected_losses"),
+        schema.count("wins"),
+        schema.count("losses"),
+        schema.count("ties"),
+        schema.pct("win_pct", fraction=True),
+        schema.count("points_for"),
+        schema.count("points_against"),
+        schema.count("points_diffential"),
+        schema.ratio("margin_of_victory"),
+        schema.ratio("strength_of_schedule"),
+        schema.ratio("simple_rating_system"),
+        schema.ratio("offensive_SRS"),
+        schema.ratio("defensive_SRS"),
+    ]
+)
+header_standings = schema_standings.names
 
 # header for playoff standings
-header_playoffs = [
-    "year",
-    "team_id",
-    "seat",
-    "wins",
-    "losses",
-    "ties",
-    "position",
-    "reason",
-    "made_playoffs",
-]
+schema_playoffs = schema.Schema(
+    [
+        schema.Column("year", schema.INT, nullable=False),
+        schema.category("team_id", nullable=False),
+        schema.Column("seat", schema.INT),
+        schema.count("wins"),
+        schema.count("losses"),
+        schema.count("ties"),
+        schema.category("position"),
+        schema.category("reason"),
+        schema.flag("made_playoffs"),
+    ]
+)
+header_playoffs = schema_playoffs.names
 
 # headers for offense
-header_offense = [
-    "year",
-    "rank",
-    "team_id",
-    "games",
-    "points_for",
-    "total_yards",
-    "offensive_plays",
-    "yards_per_play",
-    "turnovers_lost",
-    "fumbles_lost",
-    "first_downs",
-    "passes_completed",
-    "passes_attempted",
-    "yards_passing",
-    "touchdowns_passing",
-    "interceptions",
-    "net_yards_gained_per_pass",
-    "first_downs_passing",
-    "rushing_attempted",
-    "yards_rushing",
-    "touchdowns_rushing",
-    "rushing_yards_per_attempt",
-    "first_downs_rushing",
-    "penalties_opponent",
-    "yards_penalties_opponent",
-    "first_downs_penalties_opponent",
-    "pct_drives_ending_score",
-    "pct_drives_ending_turnover",
-    "expected_point_contr",
-]
-header_passing = [
-    "year",
-    "rank",
-    "team_id",
-    "games",
-    "passes_completed",
-    "passes_attempted",
-    "completion_pct",
-    "yards_passing",
-    "touchdowns_passing",
-    "touchdown_pct",
-    "interceptions",
-    "interception_pct",
-    "longest_pass",
-    "yards_gained_per_pass",
-    "adjusted_yards_gained_per_pass",
-    "yards_per_completion",
-    "yards_per_game",
-    "rate",
-    "sacks",
-    "sacks_yards",
-    "sack_pct",
-    "net_yards_gained_per_pass",
-    "adjusted_net_yards_gained_per_pass",
-    "fourth_quarter_comebacks",
-    "game_winning_drives",
-    "expected_point_contr",
-]
-header_rushing = [
-    "year",
-    "rank",
-    "team_id",
-    "games",
-    "rushing_attempted",
-    "yards_rushing",
-    "touchdowns_rushing",
-    "longest_rush",
-    "rushing_yards_per_attempt",
-    "rushing_yards_per_game",
-    "fumbles_total",
-    "expected_point_contr",
-]
-header_returns = [
-    "year",
-    "rank",
-    "team_id",
-    "games",
-    "punts_returned",
-    "punt_return_yards",
-    "touchdowns_punt_returns",
-    "longest_punt_return",
-    "yards_per_punt_return",
-    "kickoffs_returned",
-    "kickoff_return_yards",
-    "touchdowns_kickoff_returns",
-    "longest_kickoff_return",
-    "yards_per_kickoff_return",
-    "all_purpose_yards",
-]
-header_kicking = [
-    "year",
-    "rank",
-    "team_id",
-    "games",
-    "field_goals_attempted_0_19",
-    "field_goals_made_0_19",
-    "field_goals_attempted_20_29",
-    "field_goals_made_20_29",
-    "field_goals_attempted_30_39",
-    "field_goals_made_30_39",
-    "field_goals_attempted_40_49",
-    "field_goals_made_40_49",
-    "field_goals_attempted_50_plus",
-    "field_goals_made_50_plus",
-    "field_goals_attempted",
-    "field_goals_made",
-    "longest_field_goal",
-    "field_goal_pct",
-    "extra_points_attempted",
-    "extra_points_made",
-    "extra_points_pct",
-    "kickoffs",
-    "kickoff_yards",
-    "kickoff_touchbacks",
-    "touchback_pct",
-    "kickoff_avg_yards",
-]
-header_punting = [
-    "year",
-    "rank",
-    "team_id",
-    "games",
-    "punts",
-    "punt_yards",
-    "punts_avg_yards",
-    "punt_return_yards_opponent",
-    "punt_net_yards",
-    "punt_net_yards_per_punt",
-    "longest_punt",
-    "punts_touchback",
-    "punts_touchback_pct",
-    "punts_inside_20",
-    "punts_inside_20_pct",
-    "punts_blocked",
-]
-header_scoring = [
-    "year",
-    "rank",
-    "team_id",
-    "games",
-    "touchdowns_rushing",
-    "touchdowns_passing",
-    "touchdowns_punt_returns",
-    "touchdowns_kickoff_returns",
-    "touchdowns_fumbles",
-    "touchdowns_interceptions",
-    "touchdowns_other",
-    "total_touchdowns",
-    "two_points_made",
-    "two_points_attempted",
-    "defensive_two_points_made",
-    "extra_points_made",
-    "extra_points_attempted",
-    "field_goals_made",
-    "field_goals_attempted",
-    "safeties",
-    "total_points",
-    "points_per_game",
-]
-header_conversion = [
-    "year",
-    "rank",
-    "team_id",
-    "games",
-    "third_downs_attempted",
-    "third_downs_converted",
-    "third_down_conversion_pct",
-    "fourth_downs_attempted",
-    "fourth_downs_converted",
-    "fourth_down_conversion_pct",
-    "red_zones_attempted",
-    "red_zones_converted",
-    "red_zone_conversion_pct",
-]
-header_drives = [
-    "year",
-    "rank",
-    "team_id",
-    "games",
-    "drives",
-    "plays",
-    "pct_drives_ending_score",
-    "pct_drives_ending_turnover",
-    "plays_avg",
-    "yards_avg",
-    "start",
-    "time_avg",
-    "points_avg",
-]
+schema_offense = schema.Schema(
+    [
+        schema.Column("year", schema.INT, nullable=False),
+        schema.Column("rank", schema.INT),
+        schema.category("team_id", nullable=False),
+        schema.count("games"),
+        schema.count("points_for"),
+        schema.count("total_yards"),
+        schema.count("offensive_plays"),
+        schema.ratio("yards_per_play"),
+        schema.count("turnovers_lost"),
+        schema.count("fumbles_lost"),
+        schema.count("first_downs"),
+        schema.count("passes_completed"),
+        schema.count("passes_attempted"),
+        schema.count("yards_passing"),
+        schema.count("touchdowns_passing"),
+        schema.count("interceptions"),
+        schema.ratio("net_yards_gained_per_pass"),
+        schema.count("first_downs_passing"),
+        schema.count("rushing_attempted"),
+        schema.count("yards_rushing"),
+        schema.count("touchdowns_rushing"),
+        schema.ratio("rushing_yards_per_attempt"),
+        schema.count("first_downs_rushing"),
+        schema.count("penalties_opponent"),
+        schema.count("yards_penalties_opponent"),
+        schema.count("first_downs_penalties_opponent"),
+        schema.pct("pct_drives_ending_score"),
+        schema.pct("pct_drives_ending_turnover"),
+        schema.Column("expected_point_contr", schema.FLOAT),
+    ]
+)
+header_offense = schema_offense.names
+schema_passing = schema.Schema(
+    [
+        schema.Column("year", schema.INT, nullable=False),
+        schema.Column("rank", schema.INT),
+        schema.category("team_id", nullable=False),
+        schema.count("games"),
+        schema.count("passes_completed"),
+        schema.count("passes_attempted"),
+        schema.pct("completion_pct"),
+        schema.count("yards_passing"),
+        schema.count("touchdowns_passing"),
+        schema.pct("touchdown_pct"),
+        schema.count("interceptions"),
+        schema.pct("interception_pct"),
+        schema.count("longest_pass"),
+        schema.ratio("yards_gained_per_pass"),
+        schema.ratio("adjusted_yards_gained_per_pass"),
+        schema.ratio("yards_per_completion"),
+        schema.ratio("yards_per_game"),
+        schema.ratio("rate"),
+        schema.count("sacks"),
+        schema.count("sacks_yards"),
+        schema.pct("sack_pct"),
+        schema.ratio("net_yards_gained_per_pass"),
+        schema.ratio("adjusted_net_yards_gained_per_pass"),
+        schema.count("fourth_quarter_comebacks"),
+        schema.count("game_winning_drives"),
+        schema.Column("expected_point_contr", schema.FLOAT),
+    ]
+)
+header_passing = schema_passing.names
+schema_rushing = schema.Schema(
+    [
+        schema.Column("year", schema.INT, nullable=False),
+        schema.Column("rank", schema.INT),
+        schema.category("team_id", nullable=False),
+        schema.count("games"),
+        schema.count("rushing_attempted"),
+        schema.count("yards_rushing"),
+        schema.count("touchdowns_rushing"),
+        schema.count("longest_rush"),
+        schema.ratio("rushing_yards_per_attempt"),
+        schema.ratio("rushing_yards_per_game"),
+        schema.count("fumbles_total"),
+        schema.Column("expected_point_contr", schema.FLOAT),
+    ]
+)
+header_rushing = schema_rushing.names
+schema_returns = schema.Schema(
+    [
+        schema.Column("year", schema.INT, nullable=False),
+        schema.Column("rank", schema.INT),
+        schema.category("team_id", nullable=False),
+        schema.count("games"),
+        schema.count("punts_returned"),
+        schema.count("punt_return_yards"),
+        schema.count("touchdowns_punt_returns"),
+        schema.count("longest_punt_return"),
+        schema.ratio("yards_per_punt_return"),
+        schema.count("kickoffs_returned"),
+        schema.count("kickoff_return_yards"),
+        schema.count("touchdowns_kickoff_returns"),
+        schema.count("longest_kickoff_return"),
+        schema.ratio("yards_per_kickoff_return"),
+        schema.count("all_purpose_yards"),
+    ]
+)
+header_returns = schema_returns.names
+schema_kicking = schema.Schema(
+    [
+        schema.Column("year", schema.INT, nullable=False),
+        schema.Column("rank", schema.INT),
+        schema.category("team_id", nullable=False),
+        schema.count("games"),
+        schema.count("field_goals_attempted_0_19"),
+        schema.count("field_goals_made_0_19"),
+        schema.count("field_goals_attempted_20_29"),
+        schema.count("field_goals_made_20_29"),
+        schema.count("field_goals_attempted_30_39"),
+        schema.count("field_goals_made_30_39"),
+        schema.count("field_goals_attempted_40_49"),
+        schema.count("field_goals_made_40_49"),
+        schema.count("field_goals_attempted_50_plus"),
+        schema.count("field_goals_made_50_plus"),
+        schema.count("field_goals_attempted"),
+        schema.count("field_goals_made"),
+        schema.count("longest_field_goal"),
+        schema.pct("field_goal_pct"),
+        schema.count("extra_points_attempted"),
+        schema.count("extra_points_made"),
+        schema.pct("extra_points_pct"),
+        schema.count("kickoffs"),
+        schema.count("kickoff_yards"),
+        schema.count("kickoff_touchbacks"),
+        schema.pct("touchback_pct"),
+        schema.ratio("kickoff_avg_yards"),
+    ]
+)
+header_kicking = schema_kicking.names
+schema_punting = schema.Schema(
+    [
+        schema.Column("year", schema.INT, nullable=False),
+        schema.Column("rank", schema.INT),
+        schema.category("team_id", nullable=False),
+        schema.count("games"),
+        schema.count("punts"),
+        schema.count("punt_yards"),
+        schema.ratio("punts_avg_yards"),
+        schema.count("punt_return_yards_opponent"),
+        schema.count("punt_net_yards"),
+        schema.ratio("punt_net_yards_per_punt"),
+        schema.count("longest_punt"),
+        schema.count("punts_touchback"),
+        schema.pct("punts_touchback_pct"),
+        schema.count("punts_inside_20"),
+        schema.pct("punts_inside_20_pct"),
+        schema.count("punts_blocked"),
+    ]
+)
+header_punting = schema_punting.names
+schema_scoring = schema.Schema(
+    [
+        schema.Column("year", schema.INT, nullable=False),
+        schema.Column("rank", schema.INT),
+        schema.category("team_id", nullable=False),
+        schema.count("games"),
+        schema.count("touchdowns_rushing"),
+        schema.count("touchdowns_passing"),
+        schema.count("touchdowns_punt_returns"),
+        schema.count("touchdowns_kickoff_returns"),
+        schema.count("touchdowns_fumbles"),
+        schema.count("touchdowns_interceptions"),
+        schema.count("touchdowns_other"),
+        schema.count("total_touchdowns"),
+        schema.count("two_points_made"),
+        schema.count("two_points_attempted"),
+        schema.count("defensive_two_points_made"),
+        schema.count("extra_points_made"),
+        schema.count("extra_points_attempted"),
+        schema.count("field_goals_made"),
+        schema.count("field_goals_attempted"),
+        schema.count("safeties"),
+        schema.count("total_points"),
+        schema.ratio("points_per_game"),
+    ]
+)
+header_scoring = schema_scoring.names
+schema_conversion = schema.Schema(
+    [
+        schema.Column("year", schema.INT, nullable=False),
+        schema.Column("rank", schema.INT),
+        schema.category("team_id", nullable=False),
+        schema.count("games"),
+        schema.count("third_downs_attempted"),
+        schema.count("third_downs_converted"),
+        schema.pct("third_down_conversion_pct"),
+        schema.count("fourth_downs_attempted"),
+        schema.count("fourth_downs_converted"),
+        schema.pct("fourth_down_conversion_pct"),
+        schema.count("red_zones_attempted"),
+        schema.count("red_zones_converted"),
+        schema.pct("red_zone_conversion_pct"),
+    ]
+)
+header_conversion = schema_conversion.names
+schema_drives = schema.Schema(
+    [
+        schema.Column("year", schema.INT, nullable=False),
+        schema.Column("rank", schema.INT),
+        schema.category("team_id", nullable=False),
+        schema.count("games"),
+        schema.count("drives"),
+        schema.count("plays"),
+        schema.pct("pct_drives_ending_score"),
+        schema.pct("pct_drives_ending_turnover"),
+        schema.ratio("plays_avg"),
+        schema.ratio("yards_avg"),
+        schema.text("start"),
+        schema.text("time_avg"),
+        schema.ratio("points_avg"),
+    ]
+)
+header_drives = schema_drives.names
 
 # headers for defense
-header_defense = [
-    "year",
-    "rank",
-    "team_id",
-    "games",
-    "points_against",
-    "total_yards",
-    "defensive_plays",
-    "yards_per_play",
-    "takeaways",
-    "fumbles_won",
-    "first_downs",
-    "passes_completed",
-    "passes_attempted",
-    "yards_passing",
-    "touchdowns_passing",
-    "interceptions",
-    "net_yards_gained_per_pass",
-    "first_downs_passing",
-    "rushing_attempted",
-    "yards_rushing",
-    "touchdowns_rushing",
-    "rushing_yards_per_attempt",
-    "first_downs_rushing",
-    "penalties_commited",
-    "yards_penalties_commited",
-    "first_downs_penalties_commited",
-    "pct_drives_ending_score",
-    "pct_drives_ending_turnover",
-    "expected_point_contr",
-]
-header_scoring_defense = [
-    "year",
-    "rank",
-    "team_id",
-    "games",
-    "touchdowns_rushing",
-    "touchdowns_passing",
-    "touchdowns_punt_returns",
-    "touchdowns_kickoff_returns",
-    "touchdowns_fumbles",
-    "touchdowns_interceptions",
-    "touchdowns_other",
-    "total_touchdowns",
-    "two_points_made",
-    "two_points_attempted",
-    "defensive_two_points_made",
-    "extra_points_made",
-    "extra_points_attempted",
-    "field_goals_made",
-    "field_goals_attempted",
-    "safeties",
-    "total_points",
-    "points_per_game",
-]
-header_passing_defense = [
-    "year",
-    "rank",
-    "team_id",
-    "games",
-    "passes_completed",
-    "passes_attempted",
-    "completion_pct",
-    "yards_passing",
-    "touchdowns_passing",
-    "touchdown_pct",
-    "interceptions",
-    "passes_defended",
-    "interception_pct",
-    "yards_gained_per_pass",
-    "adjusted_yards_gained_per_pass",
-    "yards_per_completion",
-    "yards_per_game",
-    "rate",
-    "sacks",
-    "sacks_yards",
-    "qb_hits",
-    "tackles_for_loss",
-    "sack_pct",
-    "net_yards_gained_per_pass",
-    "adjusted_net_yards_gained_per_pass",
-    "expected_point_contr",
-]
-header_rushing_defense = [
-    "year",
-    "rank",
-    "team_id",
-    "games",
-    "rushing_attempted",
-    "yards_rushing",
-    "touchdowns_rushing",
-    "rushing_yards_per_attempt",
-    "rushing_yards_per_game",
-    "expected_point_contr",
-]
-header_returns_defense = [
-    "year",
-    "rank",
-    "team_id",
-    "games",
-    "punts_returned",
-    "punt_return_yards",
-    "touchdowns_punt_returns",
-    "yards_per_punt_return",
-    "kickoffs_returned",
-    "kickoff_return_yards",
-    "touchdowns_kickoff_returns",
-    "yards_per_kickoff_return",
-]
-header_kicking_defense = [
-    "year",
-    "rank",
-    "team_id",
-    "games",
-    "field_goals_attempted",
-    "field_goals_made",
-    "field_goal_pct",
-    "extra_points_attempted",
-    "extra_points_made",
-    "extra_points_pct",
-]
-header_punting_defense = [
-    "year",
-    "rank",
-    "team_id",
-    "games",
-    "punts",
-    "punt_yards",
-    "punts_avg_yards",
-    "punts_blocked",
-]
-header_conversion_defense = [
-    "year",
-    "rank",
-    "team_id",
-    "games",
-    "third_downs_attempted",
-    "third_downs_converted",
-    "third_down_conversion_pct",
-    "fourth_downs_attempted",
-    "fourth_downs_converted",
-    "fourth_down_conversion_pct",
-    "red_zones_attempted",
-    "red_zones_converted",
-    "red_zone_conversion_pct",
-]
-header_drives_defense = [
-    "year",
-    "rank",
-    "team_id",
-    "games",
-    "drives",
-    "plays",
-    "pct_drives_ending_score",
-    "pct_drives_ending_turnover",
-    "plays_avg",
-    "yards_avg",
-    "start",
-    "time_avg",
-    "points_avg",
-]
+schema_defense = schema.Schema(
+    [
+        schema.Column("year", schema.INT, nullable=False),
+        schema.Column("rank", schema.INT),
+        schema.category("team_id", nullable=False),
+        schema.count("games"),
+        schema.count("points_against"),
+        schema.count("total_yards"),
+        schema.count("defensive_plays"),
+        schema.ratio("yards_per_play"),
+        schema.count("takeaways"),
+        schema.count("fumbles_won"),
+        schema.count("first_downs"),
+        schema.count("passes_completed"),
+        schema.count("passes_attempted"),
+        schema.count("yards_passing"),
+        schema.count("touchdowns_passing"),
+        schema.count("interceptions"),
+        schema.ratio("net_yards_gained_per_pass"),
+        schema.count("first_downs_passing"),
+        schema.count("rushing_attempted"),
+        schema.count("yards_rushing"),
+        schema.count("touchdowns_rushing"),
+        schema.ratio("rushing_yards_per_attempt"),
+        schema.count("first_downs_rushing"),
+        schema.count("penalties_commited"),
+        schema.count("yards_penalties_commited"),
+        schema.count("first_downs_penalties_commited"),
+        schema.pct("pct_drives_ending_score"),
+        schema.pct("pct_drives_ending_turnover"),
+        schema.Column("expected_point_contr", schema.FLOAT),
+    ]
+)
+header_defense = schema_defense.names
+schema_scoring_defense = schema.Schema(
+    [
+        schema.Column("year", schema.INT, nullable=False),
+        schema.Column("rank", schema.INT),
+        schema.category("team_id", nullable=False),
+        schema.count("games"),
+        schema.count("touchdowns_rushing"),
+        schema.count("touchdowns_passing"),
+        schema.count("touchdowns_punt_returns"),
+        schema.count("touchdowns_kickoff_returns"),
+        schema.count("touchdowns_fumbles"),
+        schema.count("touchdowns_interceptions"),
+        schema.count("touchdowns_other"),
+        schema.count("total_touchdowns"),
+        schema.count("two_points_made"),
+        schema.count("two_points_attempted"),
+        schema.count("defensive_two_points_made"),
+        schema.count("extra_points_made"),
+        schema.count("extra_points_attempted"),
+        schema.count("field_goals_made"),
+        schema.count("field_goals_attempted"),
+        schema.count("safeties"),
+        schema.count("total_points"),
+        schema.ratio("points_per_game"),
+    ]
+)
+header_scoring_defense = schema_scoring_defense.names
+schema_passing_defense = schema.Schema(
+    [
+        schema.Column("year", schema.INT, nullable=False),
+        schema.Column("rank", schema.INT),
+        schema.category("team_id", nullable=False),
+        schema.count("games"),
+        schema.count("passes_completed"),
+        schema.count("passes_attempted"),
+        schema.pct("completion_pct"),
+        schema.count("yards_passing"),
+        schema.count("touchdowns_passing"),
+        schema.pct("touchdown_pct"),
+        schema.count("interceptions"),
+        schema.count("passes_defended"),
+        schema.pct("interception_pct"),
+        schema.ratio("yards_gained_per_pass"),
+        schema.ratio("adjusted_yards_gained_per_pass"),
+        schema.ratio("yards_per_completion"),
+        schema.ratio("yards_per_game"),
+        schema.ratio("rate"),
+        schema.count("sacks"),
+        schema.count("sacks_yards"),
+        schema.count("qb_hits"),
+        schema.count("tackles_for_loss"),
+        schema.pct("sack_pct"),
+        schema.ratio("net_yards_gained_per_pass"),
+        schema.ratio("adjusted_net_yards_gained_per_pass"),
+        schema.Column("expected_point_contr", schema.FLOAT),
+    ]
+)
+header_passing_defense = schema_passing_defense.names
+schema_rushing_defense = schema.Schema(
+    [
+        schema.Column("year", schema.INT, nullable=False),
+        schema.Column("rank", schema.INT),
+        schema.category("team_id", nullable=False),
+        schema.count("games"),
+        schema.count("rushing_attempted"),
+        schema.count("yards_rushing"),
+        schema.count("touchdowns_rushing"),
+        schema.ratio("rushing_yards_per_attempt"),
+        schema.ratio("rushing_yards_per_game"),
+        schema.Column("expected_point_contr", schema.FLOAT),
+    ]
+)
+header_rushing_defense = schema_rushing_defense.names
+schema_returns_defense = schema.Schema(
+    [
+        schema.Column("year", schema.INT, nullable=False),
+        schema.Column("rank", schema.INT),
+        schema.category("team_id", nullable=False),
+        schema.count("games"),
+        schema.count("punts_returned"),
+        schema.count("punt_return_yards"),
+        schema.count("touchdowns_punt_returns"),
+        schema.ratio("yards_per_punt_return"),
+        schema.count("kickoffs_returned"),
+        schema.count("kickoff_return_yards"),
+        schema.count("touchdowns_kickoff_returns"),
+        schema.ratio("yards_per_kickoff_return"),
+    ]
+)
+header_returns_defense = schema_returns_defense.names
+schema_kicking_defense = schema.Schema(
+    [
+        schema.Column("year", schema.INT, nullable=False),
+        schema.Column("rank", schema.INT),
+        schema.category("team_id", nullable=False),
+        schema.count("games"),
+        schema.count("field_goals_attempted"),
+        schema.count("field_goals_made"),
+        schema.pct("field_goal_pct"),
+        schema.count("extra_points_attempted"),
+        schema.count("extra_points_made"),
+        schema.pct("extra_points_pct"),
+    ]
+)
+header_kicking_defense = schema_kicking_defense.names
+schema_punting_defense = schema.Schema(
+    [
+        schema.Column("year", schema.INT, nullable=False),
+        schema.Column("rank", schema.INT),
+        schema.category("team_id", nullable=False),
+        schema.count("games"),
+        schema.count("punts"),
+        schema.count("punt_yards"),
+        schema.ratio("punts_avg_yards"),
+        schema.count("punts_blocked"),
+    ]
+)
+header_punting_defense = schema_punting_defense.names
+schema_conversion_defense = schema.Schema(
+    [
+        schema.Column("year", schema.INT, nullable=False),
+        schema.Column("rank", schema.INT),
+        schema.category("team_id", nullable=False),
+        schema.count("games"),
+        schema.count("third_downs_attempted"),
+        schema.count("third_downs_converted"),
+        schema.pct("third_down_conversion_pct"),
+        schema.count("fourth_downs_attempted"),
+        schema.count("fourth_downs_converted"),
+        schema.pct("fourth_down_conversion_pct"),
+        schema.count("red_zones_attempted"),
+        schema.count("red_zones_converted"),
+        schema.pct("red_zone_conversion_pct"),
+    ]
+)
+header_conversion_defense = schema_conversion_defense.names
+schema_drives_defense = schema.Schema(
+    [
+        schema.Column("year", schema.INT, nullable=False),
+        schema.Column("rank", schema.INT),
+        schema.category("team_id", nullable=False),
+        schema.count("games"),
+        schema.count("drives"),
+        schema.count("plays"),
+        schema.pct("pct_drives_ending_score"),
+        schema.pct("pct_drives_ending_turnover"),
+        schema.ratio("plays_avg"),
+        schema.ratio("yards_avg"),
+        schema.text("start"),
+        schema.text("time_avg"),
+        schema.ratio("points_avg"),
+    ]
+)
+header_drives_defense = schema_drives_defense.names
 
 # header games
-header_games = [
-    "year",
-    "week",
-    "game_id",
-    "away_team_id",
-    "home_team_id",
-    "away_team_score",
-    "home_team_score",
-    "weekday",
-    "date",
-    "start_time",
-    "stadium_id",
-    "attendance",
-    "time_of_game",
-    "won_toss",
-    "roof",
-    "vegas_line",
-    "over_under",
-    "referee",
-    "first_downs_away",
-    "first_downs_home",
-    "rush_yds_tds_away",
-    "rush_yds_tds_home",
-    "comp_att_yd_td_int_away",
-    "comp_att_yd_td_int_home",
-    "sacked_yards_away",
-    "sacked_yards_home",
-    "net_pass_yards_away",
-    "net_pass_yards_home",
-    "total_yards_away",
-    "total_yards_home",
-    "fumbles_lost_away",
-    "fumbles_lost_home",
-    "turnovers_away",
-    "turnovers_home",
-    "penalties_yards_away",
-    "penalties_yards_home",
-    "third_down_conv_away",
-    "third_down_conv_home",
-    "fourth_down_conv_away",
-    "fourth_down_conv_home",
-    "time_of_poss_away",
-    "time_of_poss_home",
-]
+schema_games = schema.Schema(
+    [
+        schema.Column("year", schema.INT, nullable=False),
+        schema.category("week"),
+        schema.text("game_id", nullable=False),
+        schema.category("away_team_id"),
+        schema.category("home_team_id"),
+        schema.count("away_team_score"),
+        schema.count("home_team_score"),
+        schema.category("weekday"),
+        schema.text("date"),
+        schema.text("start_time"),
+        schema.text("stadium_id"),
+        schema.count("attendance"),
+        schema.text("time_of_game"),
+        schema.category("won_toss"),
+        schema.category("roof"),
+        schema.text("vegas_line"),
+        schema.text("over_under"),
+        schema.text("referee"),
+        schema.count("first_downs_away"),
+        schema.count("first_downs_home"),
+        schema.text("rush_yds_tds_away"),
+        schema.text("rush_yds_tds_home"),
+        schema.text("comp_att_yd_td_int_away"),
+        schema.text("comp_att_yd_td_int_home"),
+        schema.text("sacked_yards_away"),
+        schema.text("sacked_yards_home"),
+        schema.count("net_pass_yards_away"),
+        schema.count("net_pass_yards_home"),
+        schema.count("total_yards_away"),
+        schema.count("total_yards_home"),
+        schema.text("fumbles_lost_away"),
+        schema.text("fumbles_lost_home"),
+        schema.count("turnovers_away"),
+        schema.count("turnovers_home"),
+        schema.text("penalties_yards_away"),
+        schema.text("penalties_yards_home"),
+        schema.text("third_down_conv_away"),
+        schema.text("third_down_conv_home"),
+        schema.text("fourth_down_conv_away"),
+        schema.text("fourth_down_conv_home"),
+        schema.text("time_of_poss_away"),
+        schema.text("time_of_poss_home"),
+    ]
+)
+header_games = schema_games.names
@@ -0,0 +1,307 @@
+import json
+import numpy as np
+import pandas as pd
+
+# dtypes
+INT = "Int64"
+FLOAT = "float64"
+BOOL = "boolean"
+CATEGORY = "category"
+TEXT = "string"
+
+# units
+COUNT = "count"
+PCT = "pct"
+RATIO = "ratio"
+
+# parse rules for scraped text
+NUMBER = "number"
+PERCENT = "percent"
+STRING = "string"
+
+# cell texts pro football reference uses for missing values
+MISSING = ["", "-", "--"]
+
+
+class Column:
+    """
+    Column of a scraped table
+
+    Parameters
+    ----------
+    name: str
+        column header
+    dtype: str, optional
+        pandas dtype, one of INT, FLOAT, BOOL, CATEGORY, TEXT
+    unit: str, optional
+        COUNT, PCT or RATIO for numbers, None for other columns
+    nullable: bool, optional
+        column may hold missing values
+    parse: str, optional
+        rule for scraped text, NUMBER ('1,024' -> 1024),
+        PERCENT ('45.3%' or '45.3' -> 0.453)
+        or STRING, defaults to NUMBER for numeric dtypes and STRING otherwise
+    """
+
+    def __init__(
+        self,
+        name: str,
+        dtype: str = TEXT,
+        unit: str = None,
+        nullable: bool = True,
+        parse: str = None,
+    ) -> None:
+        self.name = name
+        self.dtype = dtype
+        self.unit = unit
+        self.nullable = nullable
+        if parse is None:
+            parse = NUMBER if dtype in [INT, FLOAT] else STRING
+        self.parse = parse
+
+    def __repr__(self) -> str:
+        return (
+            f"Column({self.name!r}, {self.dtype!r}, unit={self.unit!r}, "
+            f"nullable={self.nullable}, parse={self.parse!r})"
+        )
+
+    def coerce(self, column: pd.Series) -> pd.Series:
+        """
+        Convert column to dtype, text is parsed with the parse rule
+        columns already holding numbers are only cast, so coercing twice
+        gives the same result
+
+        Parameters
+        ----------
+        column: pd.Series
+            column values
+
+        Returns
+        -------
+        pd.Series:
+            typed column
+
+        Raises
+        ------
+        ValueError:
+            text isn't a number or an integer column has fractional values,
+            the message names the column
+        """
+        try:
+            return self._convert(column)
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"column {self.name}: {e}") from e
+
+    def _convert(self, column: pd.Series) -> pd.Series:
+        if str(column.dtype) == self.dtype:
+            return column
+        text = column.dtype == object or isinstance(column.dtype, pd.StringDtype)
+        if self.dtype == BOOL:
+            if text:
+                column = column.map(
+                    {True: True, False: False, "True": True, "False": False},
+                    na_action="ignore",
+                )
+            return column.astype(BOOL)
+        if self.dtype in [INT, FLOAT]:
+            if text and self.parse in [NUMBER, PERCENT]:
+                # clean numbers are parsed by numpy in one go
+                try:
+                    values = column.to_numpy().astype(np.float64)
+                    if self.parse == PERCENT:
+                        values = values / 100.0
+                    column = pd.Series(values, index=column.index, name=column.name)
+                    text = False
+                except (ValueError, TypeError):
+                    pass
+            if text:
+                column = column.astype(TEXT).str.strip()
+                column = column.mask(column.isin(MISSING))
+                column = column.str.replace(",", "", regex=False)
+                if self.parse == PERCENT:
+                    column = column.str.rstrip("%")
+                column = pd.to_numeric(column, errors="raise")
+                if self.parse == PERCENT:
+                    column = column / 100.0
+            if self.dtype == INT:
+                # astype fails on fractions without naming the column
+                values = column.to_numpy(dtype=np.float64, na_value=np.nan)
+                fractional = np.isfinite(values) & (values != np.round(values))
+                if fractional.any():
+                    raise ValueError(
+                        f"fractional values for dtype {INT}, "
+                        f"p.e. {values[fractional][0]}"
+                    )
+            return column.astype(self.dtype)
+        if text:
+            column = column.astype(TEXT).str.strip()
+            column = column.mask(column.isin(MISSING))
+        return column.astype(self.dtype)
+
+
+class Schema:
+    """
+    Ordered columns of a scraped table
+
+    Parameters
+    ----------
+    columns: list
+        list of Column
+    """
+
+    def __init__(self, columns: list) -> None:
+        self.columns = list(columns)
+        self.names = [column.name for column in self.columns]
+        self._by_name = {column.name: column for column in self.columns}
+
+    def __getitem__(self, name: str) -> Column:
+        return self._by_name[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._by_name
+
+    def __iter__(self):
+        return iter(self.columns)
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def __repr__(self) -> str:
+        return f"Schema({self.names})"
+
+    @property
+    def dtypes(self) -> dict:
+        """
+        Returns
+        -------
+        dict:
+            column name -> dtype
+        """
+        return {column.name: column.dtype for column in self.columns}
+
+    def select(self, names: list) -> "Schema":
+        """
+        Schema of a subset of the columns
+
+        Parameters
+        ----------
+        names: list
+            column names
+
+        Returns
+        -------
+        Schema:
+            schema with the columns in names
+        """
+        return Schema([self._by_name[name] for name in names])
+
+    def to_json(self) -> str:
+        """
+        Returns
+        -------
+        str:
+            columns with their dtype, unit, nullable flag and parse rule as json
+        """
+        return json.dumps(
+            [
+                {
+                    "name": column.name,
+                    "dtype": column.dtype,
+                    "unit": column.unit,
+                    "nullable": column.nullable,
+                    "parse": column.parse,
+                }
+                for column in self.columns
+            ]
+        )
+
+    @staticmethod
+    def from_json(text: str) -> "Schema":
+        """
+        Schema written by to_json
+
+        Parameters
+        ----------
+        text: str
+            json of to_json
+
+        Returns
+        -------
+        Schema:
+            schema with the same columns
+        """
+        return Schema([Column(**column) for column in json.loads(text)])
+
+    def coerce(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert every column of df that is in the schema to its dtype,
+        one vectorized pass per column, other columns are kept as they are
+
+        Parameters
+        ----------
+        df: DataFrame
+            scraped or loaded table
+
+        Returns
+        -------
+        DataFrame:
+            typed table
+
+        Raises
+        ------
+        ValueError:
+            a column can't be parsed or a not nullable column has missing values
+        """
+        df = df.copy(deep=False)
+        for name in df.columns:
+            column = self._by_name.get(name)
+            if column is None:
+                continue
+            df[name] = column.coerce(df[name])
+            if not column.nullable and df[name].isna().any():
+                raise ValueError(f"column {name} has missing values")
+        return df
+
+
+def count(name: str, nullable: bool = True) -> Column:
+    """
+    Integer column counting something, p.e. games or yards
+    """
+    return Column(name, INT, unit=COUNT, nullable=nullable)
+
+
+def ratio(name: str) -> Column:
+    """
+    Float column of a rate or average, p.e. yards per play
+    """
+    return Column(name, FLOAT, unit=RATIO)
+
+
+def pct(name: str, fraction: bool = False) -> Column:
+    """
+    Float column of a percentage, stored as fraction
+    the scraped text looks like '45.3%' or '45.3' and is stored as 0.453,
+    with fraction pro football reference shows the fraction, p.e. '.625'
+    """
+    return Column(name, FLOAT, unit=PCT, parse=NUMBER if fraction else PERCENT)
+
+
+def category(name: str, nullable: bool = True) -> Column:
+    """
+    Categorical column of a few repeated values, p.e. team ids
+    """
+    return Column(name, CATEGORY, nullable=nullable)
+
+
+def text(name: str, nullable: bool = True) -> Column:
+    """
+    Free text column
+    """
+    return Column(name, TEXT, nullable=nullable)
+
+
+def flag(name: str) -> Column:
+    """
+    Boolean column
+    """
+    return Column(name, BOOL)
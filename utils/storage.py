@@ -0,0 +1,441 @@
+import os
+import re
+import shutil
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import fantasy_football.utils.header_mapping as header_mapping
+import fantasy_football.utils.logging as logging
+import fantasy_football.utils.schema as schema
+
+# column tables are partitioned by
+PARTITION = "year"
+
+# key of the table schema in the parquet file metadata
+SCHEMA_KEY = b"fantasy_football.schema"
+
+# schemas of the xlsx files written by the scrapers, by file name without extension
+schemas = {
+    "coaches": header_mapping.schema_coaches,
+    "stadiums_all": header_mapping.schema_stadiums,
+    "standings": header_mapping.schema_standings,
+    "playoff_history": header_mapping.schema_playoffs,
+    "games": header_mapping.schema_games,
+    "total_offense": header_mapping.schema_offense,
+    "passing_offense": header_mapping.schema_passing,
+    "rushing_offense": header_mapping.schema_rushing,
+    "returning_offense": header_mapping.schema_returns,
+    "kicking_offense": header_mapping.schema_kicking,
+    "punting_offense": header_mapping.schema_punting,
+    "scoring_offense": header_mapping.schema_scoring,
+    "conversion_offense": header_mapping.schema_conversion,
+    "driving_offense": header_mapping.schema_drives,
+    "total_defense": header_mapping.schema_defense,
+    "passing_defense": header_mapping.schema_passing_defense,
+    "rushing_defense": header_mapping.schema_rushing_defense,
+    "returning_defense": header_mapping.schema_returns_defense,
+    "kicking_defense": header_mapping.schema_kicking_defense,
+    "punting_defense": header_mapping.schema_punting_defense,
+    "scoring_defense": header_mapping.schema_scoring_defense,
+    "conversion_defense": header_mapping.schema_conversion_defense,
+    "driving_defense": header_mapping.schema_drives_defense,
+}
+
+# parquet datasets the scrapers write, by name of schemas,
+# the measure tables and playoff history where predictor.loader reads them
+paths = {
+    "coaches": "coaches.parquet",
+    "stadiums_all": "stadiums_all.parquet",
+    "standings": "standings.parquet",
+    "playoff_history": "data/playoffs/playoff_history.parquet",
+    "games": "games.parquet",
+    **{
+        name: f"data/{name.split('_')[1]}/{name}.parquet"
+        for name in schemas
+        if name.endswith(("_offense", "_defense"))
+    },
+}
+
+# games_2022.xlsx, one file per scraped season
+_SEASON_FILE = re.compile(r"^(?P<name>.+)_(?P<year>\d{4})$")
+
+
+def parquet_path(path: str) -> str:
+    """
+    Parquet dataset of a table file, p.e. data/offense/total_offense.xlsx ->
+    data/offense/total_offense.parquet
+
+    Parameters
+    ----------
+    path: str
+        path of table file
+
+    Returns
+    -------
+    str:
+        path of parquet dataset
+    """
+    return os.path.splitext(path)[0] + ".parquet"
+
+
+def exists(path: str) -> bool:
+    """
+    Parameters
+    ----------
+    path: str
+        path of parquet dataset
+
+    Returns
+    -------
+    bool:
+        dataset holds at least one file
+    """
+    return bool(_files(path))
+
+
+def _files(path: str, years: list = None) -> list:
+    # data files of a dataset, partitions in order of season,
+    # partitions of other seasons than years are never opened
+    if not os.path.isdir(path):
+        return list()
+    files = list()
+    for entry in sorted(os.listdir(path)):
+        full = os.path.join(path, entry)
+        if entry.startswith(f"{PARTITION}="):
+            if years is not None and int(entry.split("=")[1]) not in years:
+                continue
+            files.extend(
+                os.path.join(full, name)
+                for name in sorted(os.listdir(full))
+                if name.endswith(".parquet")
+            )
+        elif entry.endswith(".parquet"):
+            files.append(full)
+    return files
+
+
+def _write_file(df: pd.DataFrame, path: str, metadata: bytes) -> None:
+    # write to a temporary file first, readers never see half written files
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if metadata is not None:
+        table = table.replace_schema_metadata(
+            {**(table.schema.metadata or dict()), SCHEMA_KEY: metadata}
+        )
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    pq.write_table(table, path + ".tmp", compression="snappy")
+    os.replace(path + ".tmp", path)
+
+
+def write_table(
+    df: pd.DataFrame,
+    path: str,
+    table_schema: schema.Schema = None,
+    replace: bool = True,
+) -> str:
+    """
+    Write table as parquet dataset partitioned by season,
+    one file per year in path/year={year}/part-0.parquet
+    Tables without year column are written to path/part-0.parquet.
+    The table schema is stored in the file metadata.
+
+    Parameters
+    ----------
+    df: DataFrame
+        table to write
+    path: str
+        directory of dataset, p.e. data/offense/total_offense.parquet
+    table_schema: Schema, optional
+        columns with their dtypes, df is coerced before writing
+    replace: bool, optional
+        replace the whole dataset, else only the seasons in df are replaced
+        and other seasons are kept
+
+    Returns
+    -------
+    str:
+        path of dataset
+    """
+    metadata = None
+    if table_schema is not None:
+        df = table_schema.coerce(df)
+        metadata = table_schema.to_json().encode()
+    if replace and os.path.isdir(path):
+        shutil.rmtree(path)
+    if PARTITION not in df.columns:
+        _write_file(df, os.path.join(path, "part-0.parquet"), metadata)
+        return path
+    # iterate over seasons
+    for year, df_year in df.groupby(PARTITION, sort=True, observed=True):
+        _write_file(
+            df_year.reset_index(drop=True),
+            os.path.join(path, f"{PARTITION}={year}", "part-0.parquet"),
+            metadata,
+        )
+    return path
+
+
+def read_schema(path: str) -> schema.Schema:
+    """
+    Schema stored with a dataset
+
+    Parameters
+    ----------
+    path: str
+        path of parquet dataset
+
+    Returns
+    -------
+    Schema:
+        table schema, None if the dataset was written without one
+    """
+    files = _files(path)
+    if not files:
+        return None
+    metadata = pq.read_schema(files[0]).metadata or dict()
+    if SCHEMA_KEY not in metadata:
+        return None
+    return schema.Schema.from_json(metadata[SCHEMA_KEY].decode())
+
+
+def seasons(path: str) -> list:
+    """
+    Seasons of a table file
+
+    Parameters
+    ----------
+    path: str
+        path of xlsx file, its parquet dataset is used instead when present
+
+    Returns
+    -------
+    list:
+        sorted season years
+    """
+    dataset = parquet_path(path)
+    if exists(dataset):
+        return sorted(
+            int(entry.split("=")[1])
+            for entry in os.listdir(dataset)
+            if entry.startswith(f"{PARTITION}=")
+        )
+    df = pd.read_excel(path, usecols=[PARTITION])
+    return sorted(int(year) for year in df[PARTITION].dropna().unique())
+
+
+def read_table(
+    path: str,
+    table_schema: schema.Schema = None,
+    columns: list = None,
+    years: list = None,
+) -> pd.DataFrame:
+    """
+    Read parquet dataset written by write_table
+    only the requested columns are read from the files
+    and only the partitions of the requested seasons are opened
+
+    Parameters
+    ----------
+    path: str
+        path of parquet dataset
+    table_schema: Schema, optional
+        columns with their dtypes, defaults to the schema stored with the dataset
+    columns: list, optional
+        columns to read, all columns if None
+    years: list, optional
+        seasons to read, all seasons if None
+
+    Returns
+    -------
+    DataFrame:
+        typed table, all seasons in order
+
+    Raises
+    ------
+    FileNotFoundError:
+        dataset has no files
+    """
+    if not exists(path):
+        raise FileNotFoundError(path)
+    stored = read_schema(path)
+    if table_schema is None:
+        table_schema = stored
+    files = _files(path, years=years)
+    if not files:
+        # no season matches, empty table with the requested columns
+        df = pq.read_schema(_files(path)[0]).empty_table().to_pandas()
+        if columns is not None:
+            df = df[columns]
+        return df if table_schema is None else table_schema.coerce(df)
+    # seasons are joined by arrow and converted to pandas once
+    table = pa.concat_tables(
+        [pq.ParquetFile(file).read(columns=columns) for file in files],
+        promote_options="default",
+    )
+    df = table.to_pandas()
+    if table_schema is not None:
+        df = _rescale(df, stored, table_schema)
+        df = table_schema.coerce(df)
+    return df
+
+
+def _rescale(
+    df: pd.DataFrame, stored: schema.Schema, table_schema: schema.Schema
+) -> pd.DataFrame:
+    # percentages written before they were stored as fractions hold 0-100
+    if stored is None:
+        return df
+    for name in df.columns:
+        if name in stored and name in table_schema:
+            old, new = stored[name], table_schema[name]
+            if (
+                new.unit == schema.PCT
+                and new.parse == schema.PERCENT
+                and old.parse == schema.NUMBER
+            ):
+                df[name] = df[name] / 100.0
+    return df
+
+
+def sources(path: str, years: list = None) -> list:
+    """
+    Files load reads for a table file
+
+    Parameters
+    ----------
+    path: str
+        path of xlsx file
+    years: list, optional
+        seasons to read, all seasons if None
+
+    Returns
+    -------
+    list:
+        files of the parquet dataset when present, else the xlsx file
+    """
+    dataset = parquet_path(path)
+    if exists(dataset):
+        return _files(dataset, years=years)
+    return [path]
+
+
+def load(
+    path: str,
+    table_schema: schema.Schema = None,
+    columns: list = None,
+    years: list = None,
+) -> pd.DataFrame:
+    """
+    Read a table file, its parquet dataset is read instead when present
+    columns and years are pushed down into the read, xlsx files are
+    filtered by season after reading
+
+    Parameters
+    ----------
+    path: str
+        path of xlsx file, p.e. data/offense/total_offense.xlsx
+    table_schema: Schema, optional
+        columns with their dtypes
+    columns: list, optional
+        columns to read, all columns if None
+    years: list, optional
+        seasons to read, all seasons if None
+
+    Returns
+    -------
+    DataFrame:
+        typed table
+    """
+    dataset = parquet_path(path)
+    if exists(dataset):
+        return read_table(
+            dataset, table_schema=table_schema, columns=columns, years=years
+        )
+    usecols = columns
+    if columns is not None and years is not None and PARTITION not in columns:
+        usecols = columns + [PARTITION]
+    df = pd.read_excel(path, usecols=usecols)
+    if years is not None:
+        df = df[df[PARTITION].isin(years)].reset_index(drop=True)
+    if columns is not None:
+        df = df[columns]
+    if table_schema is not None:
+        df = table_schema.coerce(df)
+    return df
+
+
+def convert_xlsx(
+    path: str,
+    table_schema: schema.Schema = None,
+    output: str = None,
+    replace: bool = True,
+) -> str:
+    """
+    Convert a xlsx file into a parquet dataset
+
+    Parameters
+    ----------
+    path: str
+        path of xlsx file
+    table_schema: Schema, optional
+        columns with their dtypes
+    output: str, optional
+        path of dataset, defaults to the xlsx path with .parquet extension
+    replace: bool, optional
+        replace the whole dataset, else only the seasons of the file
+
+    Returns
+    -------
+    str:
+        path of dataset
+    """
+    df = pd.read_excel(path)
+    return write_table(
+        df,
+        output or parquet_path(path),
+        table_schema=table_schema,
+        replace=replace,
+    )
+
+
+def convert_directory(directory: str = ".") -> list:
+    """
+    Convert all xlsx files of scraped tables below directory into parquet datasets
+    Files of single seasons, p.e. games_2021.xlsx and games_2022.xlsx,
+    are merged into one dataset games.parquet.
+    Files that aren't scraped tables are skipped.
+
+    Parameters
+    ----------
+    directory: str, optional
+        root directory, p.e. the project directory holding data/
+
+    Returns
+    -------
+    list:
+        paths of written datasets
+    """
+    written = list()
+    for root, _, names in os.walk(directory):
+        # older season files first, newer files replace their seasons
+        for name in sorted(names):
+            stem, extension = os.path.splitext(name)
+            if extension != ".xlsx" or stem.startswith("~$"):
+                continue
+            path = os.path.join(root, name)
+            season = _SEASON_FILE.match(stem)
+            if stem in schemas:
+                output = convert_xlsx(path, table_schema=schemas[stem])
+            elif season and season.group("name") in schemas:
+                output = convert_xlsx(
+                    path,
+                    table_schema=schemas[season.group("name")],
+                    output=os.path.join(root, f"{season.group('name')}.parquet"),
+                    replace=False,
+                )
+            else:
+                logging.log(f"{path} skipped, unknown table")
+                continue
+            logging.log(f"{path} -> {output}")
+            if output not in written:
+                written.append(output)
+    return written
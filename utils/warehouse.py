@@ -0,0 +1,475 @@
+import os
+import sqlite3
+import threading
+import pandas as pd
+import fantasy_football.utils.header_mapping as header_mapping
+import fantasy_football.utils.schema as schema
+import fantasy_football.utils.storage as storage
+
+# sqlite column type per schema dtype
+SQL_TYPES = {
+    schema.INT: "INTEGER",
+    schema.FLOAT: "REAL",
+    schema.BOOL: "INTEGER",
+    schema.CATEGORY: "TEXT",
+    schema.TEXT: "TEXT",
+}
+
+
+def _quote(name: str) -> str:
+    # column names like from and to are sql keywords
+    return f'"{name}"'
+
+
+def _names(columns: list) -> str:
+    return ", ".join(_quote(column) for column in columns)
+
+
+class Table:
+    """
+    Table of the warehouse
+
+    Parameters
+    ----------
+    name: str
+        name of table
+    table_schema: Schema
+        columns with their dtypes
+    primary_key: list
+        columns identifying a row
+    indexes: list, optional
+        list of column lists to index besides the primary key
+    """
+
+    def __init__(
+        self,
+        name: str,
+        table_schema: schema.Schema,
+        primary_key: list,
+        indexes: list = None,
+    ) -> None:
+        self.name = name
+        self.schema = table_schema
+        self.primary_key = primary_key
+        self.indexes = indexes or list()
+
+    def create(self) -> list:
+        """
+        Returns
+        -------
+        list:
+            sql statements creating the table and its indexes
+        """
+        columns = ", ".join(
+            f"{_quote(column.name)} {SQL_TYPES[column.dtype]}"
+            + ("" if column.nullable else " NOT NULL")
+            for column in self.schema
+        )
+        statements = [
+            f"CREATE TABLE IF NOT EXISTS {_quote(self.name)} "
+            f"({columns}, PRIMARY KEY ({_names(self.primary_key)}))"
+        ]
+        for index in self.indexes:
+            statements.append(
+                f"CREATE INDEX IF NOT EXISTS {_quote(self.name + '_' + '_'.join(index))} "
+                f"ON {_quote(self.name)} ({_names(index)})"
+            )
+        return statements
+
+
+def _table(name: str, table_schema: schema.Schema, names: list = None, **kwargs):
+    # table with the columns names of a scraped table schema, all if None
+    if names is not None:
+        table_schema = table_schema.select(names)
+    return Table(name, table_schema, **kwargs)
+
+
+# the tables scrape_coaches, scrape_stadiums, scrape_standings and scrape_playoffs
+# return, plus the measure tables the predictor reads
+tables = {
+    table.name: table
+    for table in [
+        _table(
+            "coaches",
+            header_mapping.schema_coaches,
+            [
+                "coach_id",
+                "coach_name",
+                "games_career",
+                "wins_career",
+                "losses_career",
+                "ties_career",
+                "playoff_games_career",
+                "playoff_wins_career",
+                "playoff_losses_career",
+            ],
+            primary_key=["coach_id"],
+        ),
+        _table(
+            "coach_history",
+            header_mapping.schema_coaches,
+            [
+                "year",
+                "team_id",
+                "coach_id",
+                "games",
+                "wins",
+                "losses",
+                "ties",
+                "playoff_games",
+                "playoff_wins",
+                "playoff_losses",
+                "remark",
+            ],
+            primary_key=["year", "team_id", "coach_id"],
+            indexes=[["coach_id"]],
+        ),
+        _table(
+            "coach_team",
+            header_mapping.schema_coaches,
+            [
+                "team_id",
+                "coach_id",
+                "games_with_team",
+                "wins_with_team",
+                "losses_with_team",
+                "ties_with_team",
+                "playoff_games_team",
+                "playoff_wins_team",
+                "playoff_losses_team",
+            ],
+            primary_key=["team_id", "coach_id"],
+            indexes=[["coach_id"]],
+        ),
+        _table(
+            "stadiums",
+            header_mapping.schema_stadiums,
+            [
+                "stadium_id",
+                "stadium_name",
+                "from",
+                "to",
+                "games",
+                "city",
+                "state",
+                "street",
+            ],
+            primary_key=["stadium_id"],
+        ),
+        _table(
+            "surface_history",
+            schema.Schema(
+                [
+                    schema.text("stadium_id", nullable=False),
+                    schema.Column("year", schema.INT, nullable=False),
+                    schema.category("surface", nullable=False),
+                ]
+            ),
+            primary_key=["stadium_id", "year", "surface"],
+            indexes=[["year"]],
+        ),
+        _table(
+            "super_bowl_history",
+            schema.Schema(
+                [
+                    schema.text("super_bowl_id", nullable=False),
+                    schema.text("stadium_id"),
+                ]
+            ),
+            primary_key=["super_bowl_id"],
+            indexes=[["stadium_id"]],
+        ),
+        _table(
+            "teams",
+            header_mapping.schema_standings,
+            ["team_id", "division_id"],
+            primary_key=["team_id"],
+        ),
+        _table(
+            "team_history",
+            header_mapping.schema_standings,
+            ["year", "team_id", "team_name"],
+            primary_key=["year", "team_id"],
+            indexes=[["team_id"]],
+        ),
+        _table(
+            "division",
+            schema.Schema(
+                [
+                    schema.category("division_id", nullable=False),
+                    schema.category("division"),
+                    schema.category("conference"),
+                ]
+            ),
+            primary_key=["division_id"],
+        ),
+        _table(
+            "standings_history",
+            header_mapping.schema_standings,
+            [
+                "year",
+                "team_id",
+                "odds_super_bowl",
+                "odds_wins",
+                "wins",
+                "losses",
+                "ties",
+                "win_pct",
+                "expected_wins",
+                "expected_losses",
+                "points_for",
+                "points_against",
+                "points_diffential",
+                "margin_of_victory",
+                "strength_of_schedule",
+                "simple_rating_system",
+                "offensive_SRS",
+                "defensive_SRS",
+            ],
+            primary_key=["year", "team_id"],
+            indexes=[["team_id"]],
+        ),
+        _table(
+            "playoff_history",
+            header_mapping.schema_playoffs,
+            ["year", "team_id", "seat", "position", "reason", "made_playoffs"],
+            primary_key=["year", "team_id"],
+            indexes=[["team_id"]],
+        ),
+    ]
+    + [
+        # measure tables, p.e. total_offense
+        _table(
+            name,
+            table_schema,
+            primary_key=["year", "team_id"],
+            indexes=[["team_id"]],
+        )
+        for name, table_schema in storage.schemas.items()
+        if name.endswith("_offense") or name.endswith("_defense")
+    ]
+}
+
+# tables returned by the scrapers, in order of their return values
+outputs = {
+    "coaches": ["coaches", "coach_history", "coach_team"],
+    "stadiums": ["stadiums", "surface_history", "super_bowl_history"],
+    "standings": ["teams", "team_history", "division", "standings_history"],
+    "playoffs": ["playoff_history"],
+    # scrape_offense and scrape_defense, p.e. total_offense
+    **{
+        factor: [
+            f"{table}_{factor}"
+            for table in [
+                "total",
+                "scoring",
+                "passing",
+                "rushing",
+                "returning",
+                "kicking",
+                "punting",
+                "conversion",
+                "driving",
+            ]
+        ]
+        for factor in ["offense", "defense"]
+    },
+}
+
+
+class Warehouse:
+    """
+    Local SQLite database of the scraped tables
+    Tables have primary keys and indexes on (year, team_id), coach_id and
+    stadium_id, scraper output is upserted by primary key, so scraping a
+    season again replaces its rows.
+
+    Parameters
+    ----------
+    path: str, optional
+        SQLite file of the warehouse
+    """
+
+    def __init__(self, path: str = "data/warehouse.sqlite") -> None:
+        self.path = path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        con = self._connection()
+        with con:
+            for table in tables.values():
+                for statement in table.create():
+                    con.execute(statement)
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite connections can't be shared between threads
+        con = getattr(self._local, "con", None)
+        if con is None:
+            con = sqlite3.connect(self.path, timeout=30)
+            con.execute("PRAGMA journal_mode=WAL")
+            self._local.con = con
+        return con
+
+    def upsert(self, table: str, df: pd.DataFrame) -> int:
+        """
+        Insert rows of df, rows with the primary key of a stored row replace it
+
+        Parameters
+        ----------
+        table: str
+            name of table
+        df: DataFrame
+            rows with columns of the table, missing columns are stored as NULL
+
+        Returns
+        -------
+        int:
+            number of rows written
+
+        Raises
+        ------
+        ValueError:
+            df has columns the table doesn't have
+        """
+        return self.upsert_many({table: df})
+
+    def upsert_many(self, frames: dict) -> int:
+        """
+        Upsert several tables in one transaction
+
+        Parameters
+        ----------
+        frames: dict
+            name of table -> DataFrame
+
+        Returns
+        -------
+        int:
+            number of rows written
+        """
+        statements = list()
+        for name, df in frames.items():
+            table = tables[name]
+            unknown = [column for column in df.columns if column not in table.schema]
+            if unknown:
+                raise ValueError(f"{name} has no columns {unknown}")
+            df = table.schema.coerce(df)
+            columns = list(df.columns)
+            updates = [column for column in columns if column not in table.primary_key]
+            sql = (
+                f"INSERT INTO {_quote(name)} ({_names(columns)}) "
+                f"VALUES ({', '.join('?' for _ in columns)}) "
+                f"ON CONFLICT ({_names(table.primary_key)}) DO "
+            )
+            if updates:
+                sql += "UPDATE SET " + ", ".join(
+                    f"{_quote(column)} = excluded.{_quote(column)}"
+                    for column in updates
+                )
+            else:
+                sql += "NOTHING"
+            # python values, missing values as NULL
+            values = df.astype(object).where(df.notna(), None)
+            statements.append((sql, list(values.itertuples(index=False, name=None))))
+        con = self._connection()
+        with self._lock, con:
+            for sql, rows in statements:
+                con.executemany(sql, rows)
+        return sum(len(rows) for _, rows in statements)
+
+    def store(self, scraper: str, frames: tuple) -> int:
+        """
+        Upsert the tables a scraper returns
+
+        Parameters
+        ----------
+        scraper: str
+            'coaches', 'stadiums', 'standings', 'playoffs', 'offense' or 'defense'
+        frames: tuple
+            return value of the scraper, p.e. scrape_coaches(years)
+
+        Returns
+        -------
+        int:
+            number of rows written
+
+        Example
+        -------
+        >>> Warehouse().store("coaches", scrape_coaches(years=[2022]))
+        """
+        if isinstance(frames, pd.DataFrame):
+            frames = (frames,)
+        return self.upsert_many(dict(zip(outputs[scraper], frames)))
+
+    def query(
+        self, sql: str, params: list = None, table_schema: schema.Schema = None
+    ) -> pd.DataFrame:
+        """
+        Run a select statement
+
+        Parameters
+        ----------
+        sql: str
+            select statement
+        params: list, optional
+            values of the ? placeholders of sql
+        table_schema: Schema, optional
+            columns with their dtypes the result is coerced to
+
+        Returns
+        -------
+        DataFrame:
+            result rows
+        """
+        df = pd.read_sql_query(sql, self._connection(), params=params)
+        if table_schema is not None:
+            df = table_schema.coerce(df)
+        return df
+
+    def read_table(
+        self, table: str, columns: list = None, years: list = None
+    ) -> pd.DataFrame:
+        """
+        Read a table with the dtypes of its schema,
+        seasons are selected with the index on year
+
+        Parameters
+        ----------
+        table: str
+            name of table
+        columns: list, optional
+            columns to read, all columns if None
+        years: list, optional
+            seasons to read, all seasons if None
+
+        Returns
+        -------
+        DataFrame:
+            rows in order of the primary key
+        """
+        definition = tables[table]
+        columns = columns or definition.schema.names
+        sql = f"SELECT {_names(columns)} FROM {_quote(table)}"
+        params = list()
+        if years is not None:
+            sql += f" WHERE year IN ({', '.join('?' for _ in years)})"
+            params = [int(year) for year in years]
+        sql += f" ORDER BY {_names(definition.primary_key)}"
+        return self.query(sql, params=params, table_schema=definition.schema)
+
+    def has_rows(self, table: str) -> bool:
+        """
+        Parameters
+        ----------
+        table: str
+            name of table
+
+        Returns
+        -------
+        bool:
+            table holds at least one row
+        """
+        row = self._connection().execute(f"SELECT 1 FROM {_quote(table)} LIMIT 1")
+        return row.fetchone() is not None